@@ -0,0 +1,235 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Benchmark the parsers on synthetic Odoo-like repositories.
+
+Each scenario runs in its own Python process so peak RSS is measured
+independently. Usage (from the root of the project):
+
+    python -m benchmarks.run --modules 100 --workers 4
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+With `--compare`, the exit code is 1 if a scenario got slower than the
+baseline by more than `--tolerance` (20% by default).
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import synthetic
+
+SCENARIOS = (
+    "module",
+    "repository",
+    "repository_no_prefilter",
+    "repository_workers",
+    "odoo",
+)
+
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of current process and of its terminated children, in MB."""
+    peak = 0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        peak = max(peak, resource.getrusage(who).ru_maxrss)
+    # Kilobytes on Linux, bytes on macOS
+    if sys.platform == "darwin":
+        peak /= 1024
+    return peak / 1024
+
+
+def _count_models(data: dict) -> int:
+    return sum(len(module_data.get("models", {})) for module_data in data.values())
+
+
+def run_scenario(
+    scenario: str, path: pathlib.Path, workers: int, code_stats: bool = True
+) -> dict:
+    """Run one scenario in the current process and return its results."""
+    from odoo_addons_parser import (
+        Instrumentation,
+        ModuleParser,
+        OdooParser,
+        RepositoryParser,
+    )
+
+    from odoo_addons_parser.code import PyFile
+
+    instrumentation = Instrumentation()
+    if scenario == "repository_no_prefilter":
+        # Parse all Python files, to measure the time saved by the pre-filter
+        PyFile.prefilter = False
+    start = time.perf_counter()
+    if scenario == "module":
+        module_path = path.joinpath("addons", "bench_module_0")
+        parser = ModuleParser(
+            module_path, code_stats=code_stats, instrumentation=instrumentation
+        )
+        data = {parser.name: parser.to_dict()}
+    elif scenario in ("repository", "repository_no_prefilter", "repository_workers"):
+        parser = RepositoryParser(
+            path.joinpath("addons"),
+            workers=workers if scenario == "repository_workers" else 0,
+            code_stats=code_stats,
+            instrumentation=instrumentation,
+        )
+        data = parser.to_dict()
+    elif scenario == "odoo":
+        parser = OdooParser(
+            path,
+            workers=workers,
+            code_stats=code_stats,
+            instrumentation=instrumentation,
+        )
+        data = parser.to_dict()
+    else:
+        raise ValueError(f"Unknown scenario {scenario}")
+    wall = time.perf_counter() - start
+    phases = instrumentation.phases
+    files = phases.get("walk", {}).get("count", 0)
+    bytes_ = sum(
+        phases.get(phase, {}).get("bytes", 0)
+        for phase in ("py_file", "xml_file", "csv_file")
+    )
+    models = _count_models(data)
+    return {
+        "wall": wall,
+        "files": files,
+        "models": models,
+        "files_per_s": files / wall if wall else 0,
+        "models_per_s": models / wall if wall else 0,
+        "mb_per_s": bytes_ / 1024 / 1024 / wall if wall else 0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "phases": phases,
+    }
+
+
+def _run_in_subprocess(
+    scenario: str, path: pathlib.Path, workers: int, code_stats: bool
+) -> dict:
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.run",
+        "--scenario",
+        scenario,
+        "--path",
+        str(path),
+        "--workers",
+        str(workers),
+    ]
+    if not code_stats:
+        cmd.append("--no-code-stats")
+    project_path = pathlib.Path(__file__).resolve().parent.parent
+    output = subprocess.run(
+        cmd, check=True, capture_output=True, text=True, cwd=project_path
+    ).stdout
+    return json.loads(output)
+
+
+def _print_results(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Print results, compared to the baseline if any. Return True if OK."""
+    ok = True
+    print(
+        f"{'scenario':<24} {'wall (s)':>9} {'files/s':>9} {'models/s':>9} "
+        f"{'MB/s':>7} {'RSS (MB)':>9}  baseline"
+    )
+    for scenario, res in results.items():
+        line = (
+            f"{scenario:<24} {res['wall']:>9.3f} {res['files_per_s']:>9.0f} "
+            f"{res['models_per_s']:>9.0f} {res['mb_per_s']:>7.2f} "
+            f"{res['peak_rss_mb']:>9.1f}"
+        )
+        base = baseline.get(scenario)
+        if base:
+            ratio = res["wall"] / base["wall"] if base["wall"] else 1
+            line += f"  {ratio - 1:+.0%}"
+            if ratio > 1 + tolerance:
+                line += " REGRESSION"
+                ok = False
+        print(line)
+        phases = ", ".join(
+            f"{name}={stats['wall']:.3f}s"
+            for name, stats in sorted(
+                res["phases"].items(), key=lambda item: -item[1]["wall"]
+            )
+            if name not in ("module", "py_file_skipped")
+        )
+        print(f"{'':<24} {phases}")
+        py_files = res["phases"].get("py_file", {}).get("count", 0)
+        if py_files:
+            skipped = res["phases"].get("py_file_skipped", {}).get("count", 0)
+            print(f"{'':<24} Python files not parsed: {skipped}/{py_files}")
+    if "repository" in results and "repository_no_prefilter" in results:
+        saved = (
+            results["repository_no_prefilter"]["phases"]["py_file"]["wall"]
+            - results["repository"]["phases"]["py_file"]["wall"]
+        )
+        print(f"Python files pre-filter: {saved:.3f}s saved on 'repository'")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    for key, value in synthetic.DEFAULT_SIZES.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=value)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument(
+        "--no-code-stats",
+        dest="code_stats",
+        action="store_false",
+        help="Disable code stats (pygount), to focus on models and data parsing",
+    )
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Comma separated list"
+    )
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    # Internal options, used to run a scenario in a subprocess
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.scenario:
+        result = run_scenario(
+            args.scenario, pathlib.Path(args.path), args.workers, args.code_stats
+        )
+        json.dump(result, sys.stdout)
+        return 0
+
+    sizes = {key: getattr(args, key) for key in synthetic.DEFAULT_SIZES}
+    settings = {"sizes": sizes, "code_stats": args.code_stats}
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file_:
+            baseline = json.load(file_)
+        if baseline.get("settings") != settings:
+            print("Warning: baseline generated with different settings")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir).joinpath("odoo")
+        start = time.perf_counter()
+        synthetic.generate_odoo(path, **sizes)
+        print(f"Generated {sizes} in {time.perf_counter() - start:.1f}s")
+        results = {}
+        for scenario in args.scenarios.split(","):
+            results[scenario] = _run_in_subprocess(
+                scenario, path, args.workers, args.code_stats
+            )
+    ok = _print_results(results, baseline.get("results", {}), args.tolerance)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file_:
+            json.dump({"settings": settings, "results": results}, file_, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Generate synthetic Odoo-like addons repositories for benchmarks."""
+
+import os
+import pathlib
+import typing
+
+DEFAULT_SIZES = {
+    "modules": 50,
+    "py_files": 4,  # Python files with models per module
+    "models_per_file": 3,
+    "fields_per_model": 15,
+    "methods_per_model": 5,
+    "xml_files": 3,  # Data files per module
+    "records_per_file": 50,
+    "csv_rows": 200,
+    "helper_files": 4,  # Python files without models (controllers, tests...)
+    "static_files": 10,  # JS/SCSS files under 'static/'
+}
+
+FIELD_TEMPLATES = (
+    '    {name} = fields.Char(string="{label}", required=True)\n',
+    '    {name} = fields.Integer("{label}", default=0)\n',
+    "    {name} = fields.Many2one(\n"
+    '        comodel_name="res.partner",\n'
+    '        string="{label}",\n'
+    '        ondelete="cascade",\n'
+    "    )\n",
+    "    {name} = fields.Boolean(default=lambda self: self._default_{name}())\n",
+    "    {name} = fields.Selection(\n"
+    '        [("draft", "Draft"), ("done", "Done")],\n'
+    '        string="{label}",\n'
+    "    )\n",
+)
+
+METHOD_TEMPLATE = """
+    @api.depends("{field}")
+    def _compute_{name}(self):
+        for rec in self:
+            if rec.{field}:
+                rec.{field} = rec.{field}
+            else:
+                super()._compute_{name}()
+"""
+
+XML_RECORD_TEMPLATE = """
+    <record id="{xmlid}" model="ir.ui.view">
+        <field name="name">{model}.{xmlid}</field>
+        <field name="model">{model}</field>
+        <field name="inherit_id" ref="base.view_partner_form"/>
+        <field name="arch" type="xml">
+            <field name="name" position="after">
+                <field name="{field}"/>
+            </field>
+        </field>
+    </record>
+"""
+
+HELPER_TEMPLATE = '''from odoo import http
+from odoo.http import request
+
+
+def helper_{index}(values):
+    """Helper without any model."""
+    return {{key: value for key, value in values.items() if value}}
+
+
+class Controller{index}(http.Controller):
+    @http.route("/bench/{index}", type="json", auth="user")
+    def route_{index}(self, **kwargs):
+        return request.env["res.partner"].search_read([], ["name"])
+'''
+
+
+def _model_name(module_index: int, file_index: int, model_index: int) -> str:
+    return f"bench.m{module_index}.f{file_index}.model{model_index}"
+
+
+def _write_models_file(
+    path: pathlib.Path, module_index: int, file_index: int, sizes: dict
+):
+    chunks = ["from odoo import api, fields, models\n"]
+    for model_index in range(sizes["models_per_file"]):
+        model_name = _model_name(module_index, file_index, model_index)
+        class_name = f"BenchModel{file_index}x{model_index}"
+        chunks.append(
+            f"\n\nclass {class_name}(models.Model):\n"
+            f'    _name = "{model_name}"\n'
+            f'    _description = "{class_name}"\n'
+            '    _order = "id desc"\n\n'
+        )
+        if module_index and model_index == 0:
+            # Extend a model of the previous module, like Odoo modules do
+            chunks[-1] = (
+                f"\n\nclass {class_name}(models.Model):\n"
+                f'    _inherit = "{_model_name(module_index - 1, file_index, 0)}"\n\n'
+            )
+        for field_index in range(sizes["fields_per_model"]):
+            template = FIELD_TEMPLATES[field_index % len(FIELD_TEMPLATES)]
+            chunks.append(
+                template.format(
+                    name=f"field_{field_index}", label=f"Field {field_index}"
+                )
+            )
+        for method_index in range(sizes["methods_per_model"]):
+            chunks.append(
+                METHOD_TEMPLATE.format(
+                    name=f"method_{method_index}",
+                    field=f"field_{method_index % max(sizes['fields_per_model'], 1)}",
+                )
+            )
+    path.write_text("".join(chunks))
+
+
+def _write_module(
+    repo_path: pathlib.Path, module_index: int, sizes: dict
+) -> pathlib.Path:
+    module_name = f"bench_module_{module_index}"
+    module_path = repo_path.joinpath(module_name)
+    models_path = module_path.joinpath("models")
+    models_path.mkdir(parents=True)
+    views_path = module_path.joinpath("views")
+    views_path.mkdir()
+    security_path = module_path.joinpath("security")
+    security_path.mkdir()
+    data_files = ["security/ir.model.access.csv"]
+    # Python files
+    imports = []
+    for file_index in range(sizes["py_files"]):
+        _write_models_file(
+            models_path.joinpath(f"models_{file_index}.py"),
+            module_index,
+            file_index,
+            sizes,
+        )
+        imports.append(f"from . import models_{file_index}\n")
+    models_path.joinpath("__init__.py").write_text("".join(imports))
+    module_path.joinpath("__init__.py").write_text("from . import models\n")
+    for helper_index in range(sizes["helper_files"]):
+        folder = ("controllers", "tests", "wizard", "migrations")[helper_index % 4]
+        module_path.joinpath(folder).mkdir(exist_ok=True)
+        module_path.joinpath(folder, f"helper_{helper_index}.py").write_text(
+            HELPER_TEMPLATE.format(index=helper_index)
+        )
+    # XML files
+    for file_index in range(sizes["xml_files"]):
+        records = [
+            XML_RECORD_TEMPLATE.format(
+                xmlid=f"view_{file_index}_{record_index}",
+                model=_model_name(module_index, 0, 0),
+                field=f"field_{record_index % max(sizes['fields_per_model'], 1)}",
+            )
+            for record_index in range(sizes["records_per_file"])
+        ]
+        views_path.joinpath(f"views_{file_index}.xml").write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n<odoo>\n'
+            + "".join(records)
+            + "</odoo>\n"
+        )
+        data_files.append(f"views/views_{file_index}.xml")
+    # CSV file
+    rows = ['"id","name","model_id:id","group_id:id","perm_read","perm_write"\n']
+    for row_index in range(sizes["csv_rows"]):
+        rows.append(
+            f'"access_{row_index}","access {row_index}",'
+            f'"model_bench_{row_index}","base.group_user",1,{row_index % 2}\n'
+        )
+    security_path.joinpath("ir.model.access.csv").write_text("".join(rows))
+    # Static files
+    if sizes["static_files"]:
+        static_path = module_path.joinpath("static", "src", "js")
+        static_path.mkdir(parents=True)
+        for static_index in range(sizes["static_files"]):
+            static_path.joinpath(f"widget_{static_index}.js").write_text(
+                "/** @odoo-module **/\n"
+                + "".join(
+                    f"export function fn{static_index}_{i}(a) {{ return a + {i}; }}\n"
+                    for i in range(50)
+                )
+            )
+    depends = ["base"]
+    if module_index:
+        depends.append(f"bench_module_{module_index - 1}")
+    manifest = {
+        "name": module_name,
+        "version": "18.0.1.0.0",
+        "depends": depends,
+        "data": data_files,
+        "installable": True,
+    }
+    module_path.joinpath("__manifest__.py").write_text(repr(manifest))
+    return module_path
+
+
+def generate_repository(
+    repo_path: typing.Union[str, os.PathLike], **sizes
+) -> pathlib.Path:
+    """Generate an addons repository in `repo_path` (must not exist).
+
+    Sizes not given are taken from `DEFAULT_SIZES`.
+    """
+    sizes = dict(DEFAULT_SIZES, **sizes)
+    repo_path = pathlib.Path(repo_path)
+    repo_path.mkdir(parents=True)
+    for module_index in range(sizes["modules"]):
+        _write_module(repo_path, module_index, sizes)
+    return repo_path
+
+
+ORM_TEMPLATE = """class BaseModel(metaclass=MetaModel):
+    _auto = False
+    _name = None
+
+    def write(self, vals):
+        return True
+
+
+class AbstractModel(BaseModel):
+    _auto = False
+
+
+class Model(AbstractModel):
+    _auto = True
+
+
+class TransientModel(Model):
+    _transient = True
+"""
+
+
+def generate_odoo(odoo_path: typing.Union[str, os.PathLike], **sizes) -> pathlib.Path:
+    """Generate an Odoo-like source tree in `odoo_path` (must not exist).
+
+    It contains the ORM base models file and two addons paths
+    (`odoo/addons` with a `base` module and `addons`).
+    """
+    odoo_path = pathlib.Path(odoo_path)
+    odoo_path.joinpath("odoo").mkdir(parents=True)
+    odoo_path.joinpath("odoo", "models.py").write_text(ORM_TEMPLATE)
+    base_path = odoo_path.joinpath("odoo", "addons", "base")
+    base_path.mkdir(parents=True)
+    base_path.joinpath("__init__.py").touch()
+    base_path.joinpath("__manifest__.py").write_text(
+        repr({"name": "Base", "depends": [], "installable": True})
+    )
+    generate_repository(odoo_path.joinpath("addons"), **sizes)
+    return odoo_path
@@ -1,5 +1,15 @@
 from .module import ModuleParser
 from .repository import RepositoryParser
 from .odoo import OdooParser
+from .graph import DependencyGraph
+from .instrumentation import Instrumentation
+from .manifest import ManifestParser
 
-__all__ = ["ModuleParser", "RepositoryParser", "OdooParser"]
+__all__ = [
+    "ModuleParser",
+    "RepositoryParser",
+    "OdooParser",
+    "DependencyGraph",
+    "ManifestParser",
+    "Instrumentation",
+]
@@ -0,0 +1,271 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Scan modules straight from zip and tar archives, without extracting them.
+
+Members are listed once, then each file is read at its offset in the
+archive when a parser needs it. Sent to worker processes, an archive is
+opened again by each of them, so members are read in parallel.
+
+Compressed tar archives (gzip, bzip2, xz) can't be read at random offsets:
+they are decompressed once to a temporary file, removed on `close()`.
+
+E.g:
+    >>> data = ArchiveRepositoryParser("./server-tools-18.0.zip", workers=4).to_dict()
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import pathlib
+import shutil
+import stat
+import tarfile
+import tempfile
+import threading
+import typing
+import weakref
+import zipfile
+
+from .tree import (
+    Entry,
+    Tree,
+    TreeModuleParser,
+    TreeOdooParser,
+    TreeRepositoryParser,
+)
+
+# Decompressors of tar archives, by magic number
+TAR_COMPRESSIONS = {
+    b"\x1f\x8b": gzip.open,
+    b"BZh": bz2.open,
+    b"\xfd7zXZ\x00": lzma.open,
+}
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+# Archives opened in the current process (see `ArchiveTree`)
+_archives = {}
+
+
+def _get_archive(path: str, data_path: typing.Optional[str]) -> "ArchiveTree":
+    try:
+        return _archives[path, data_path]
+    except KeyError:
+        archive = _archives[path, data_path] = ArchiveTree(path, data_path)
+        return archive
+
+
+def _decompress(path: pathlib.Path) -> typing.Optional[str]:
+    """Decompress a compressed tar archive to a temporary file, return its path."""
+    with open(path, "rb") as file_:
+        magic = file_.read(6)
+    for prefix, open_ in TAR_COMPRESSIONS.items():
+        if magic.startswith(prefix):
+            break
+    else:
+        return None
+    with open_(path, "rb") as source:
+        with tempfile.NamedTemporaryFile(
+            prefix="odoo-addons-parser-", suffix=".tar", delete=False
+        ) as target:
+            shutil.copyfileobj(source, target)
+    return target.name
+
+
+class ArchiveTree(Tree):
+    """Files of a zip or tar archive.
+
+    Entries of zip members are identified by their CRC and size. Tar
+    archives don't store a checksum of their members (modification times
+    are often the same, e.g. in reproducible archives), so their content is
+    hashed when they are read (see `Entry`). Symbolic links and special
+    files are not scanned.
+
+    `data_path` is the decompressed copy of a compressed tar archive, given
+    by the process owning it (it is created otherwise).
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike],
+        data_path: typing.Optional[str] = None,
+    ):
+        super().__init__()
+        self.path = pathlib.Path(path).resolve()
+        if not self.path.is_file():
+            raise ValueError(f"'{path}' doesn't exist")
+        self._members = {}  # {path: ZipInfo or (offset, size)}
+        self._lock = threading.Lock()
+        self._file = None
+        self._finalizer = None
+        self.data_path = None
+        if zipfile.is_zipfile(self.path):
+            self.format = "zip"
+            self._list_zip()
+            return
+        self.format = "tar"
+        if data_path is None:
+            data_path = _decompress(self.path)
+            if data_path:
+                # Owned by this process, removed once unused
+                self._finalizer = weakref.finalize(self, os.unlink, data_path)
+        self.data_path = data_path
+        try:
+            self._list_tar()
+        except tarfile.TarError as exc:
+            self.close()
+            raise ValueError(f"'{path}' is not a zip or tar archive") from exc
+
+    def __reduce__(self):
+        return (_get_archive, (str(self.path), self.data_path))
+
+    def __str__(self):
+        return f"archive {self.path}"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    @property
+    def name(self) -> str:
+        """Return the file name of the archive, without its extension."""
+        name = self.path.name
+        for suffix in sorted(ARCHIVE_SUFFIXES, key=len, reverse=True):
+            if name.lower().endswith(suffix):
+                return name[: -len(suffix)]
+        return name
+
+    def _list_zip(self):
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    self._add(info.filename, Entry("tree", None, 0))
+                    continue
+                mode = info.external_attr >> 16
+                if stat.S_ISLNK(mode):
+                    self._add(info.filename, Entry("link", None, 0))
+                    continue
+                key = self._key(info.filename)
+                self._members[key] = info
+                entry_id = f"{info.CRC:08x}-{info.file_size}"
+                self._add(key, Entry("blob", entry_id, info.file_size))
+
+    def _list_tar(self):
+        with tarfile.open(self.data_path or self.path, "r:") as archive:
+            for member in archive:
+                key = self._key(member.name)
+                if member.isdir():
+                    self._add(key, Entry("tree", None, 0))
+                elif member.isfile() and not member.issparse():
+                    self._members[key] = (member.offset_data, member.size)
+                    self._add(key, Entry("blob", None, member.size))
+                else:
+                    self._add(key, Entry("link", None, 0))
+
+    def _read(self, path, entry):
+        member = self._members[path]
+        with self._lock:
+            if self._file is None:
+                if self.format == "zip":
+                    self._file = zipfile.ZipFile(self.path)
+                else:
+                    self._file = open(self.data_path or self.path, "rb")
+            if self.format == "zip":
+                return self._file.read(member)
+            offset, size = member
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def close(self):
+        """Close the archive, and remove its decompressed copy if any."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+class ArchiveModuleParser(TreeModuleParser):
+    """Parser of an Odoo module stored in an archive.
+
+    `folder_path` is the path of the module in the archive (by default the
+    folder at the root of the archive, see `Tree.root`).
+
+    E.g:
+        >>> data = ArchiveModuleParser(ArchiveTree("./sale_foo.zip")).to_dict()
+    """
+
+    def __init__(
+        self,
+        tree: ArchiveTree,
+        folder_path: typing.Union[str, os.PathLike, None] = None,
+        **kwargs,
+    ):
+        if folder_path is None:
+            folder_path = tree.root
+        super().__init__(tree, folder_path, **kwargs)
+
+    @property
+    def name(self) -> str:
+        # Modules at the root of their archive are named after it
+        return self.folder_path.name or self.tree.name
+
+
+class _ArchiveParser:
+    """Options shared by the parsers of addons paths stored in an archive.
+
+    `archive` is an `ArchiveTree` or the path of an archive, `folder_path`
+    the path of the addons path in the archive (by default the folder at
+    the root of the archive, see `Tree.root`), and `name` defaults to the
+    name of this folder, or of the archive for files at its root.
+    """
+
+    def __init__(
+        self,
+        archive: typing.Union[str, os.PathLike, ArchiveTree],
+        folder_path: typing.Union[str, os.PathLike, None] = None,
+        name: typing.Optional[str] = None,
+        cache: typing.Optional[typing.MutableMapping] = None,
+        **kwargs,
+    ):
+        if not isinstance(archive, ArchiveTree):
+            archive = ArchiveTree(archive)
+        self.archive = archive
+        if folder_path is None:
+            folder_path = archive.root
+        if name is None:
+            name = pathlib.PurePosixPath(folder_path).name or archive.name
+        super().__init__(folder_path, cache=cache, name=name, **kwargs)
+
+    @property
+    def tree(self) -> ArchiveTree:
+        return self.archive
+
+
+class ArchiveRepositoryParser(_ArchiveParser, TreeRepositoryParser):
+    """Parser of an addons path stored in an archive.
+
+    See `_ArchiveParser` for the archive options, other parameters are the
+    ones of `TreeRepositoryParser`.
+    """
+
+    module_parser_class = ArchiveModuleParser
+
+
+class ArchiveOdooParser(_ArchiveParser, TreeOdooParser):
+    """Parser of the Odoo repository stored in an archive.
+
+    See `OdooParser` and `ArchiveRepositoryParser`.
+
+    E.g:
+        >>> data = ArchiveOdooParser("./odoo-18.0.tar.gz", code_stats=False).to_dict()
+    """
+
+    def _new_repository_parser(self, folder_path, **kwargs):
+        return ArchiveRepositoryParser(self.archive, folder_path=folder_path, **kwargs)
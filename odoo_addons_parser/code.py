@@ -2,12 +2,14 @@
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 """Parse Python module files and extract Odoo data models from them."""
 
+import mmap
 import pathlib
 import typing
 
-from tree_sitter import Node
+from tree_sitter import Node, Parser
 
 from . import treesitter_utils as ts_utils
+from .reader import Buffer, MappedFile
 
 BASE_CLASSES = [
     "AbstractModel",
@@ -43,56 +45,288 @@ FIELD_TYPES = [
     "Many2manyCustom",  # base_m2m_custom_field from OCA
 ]
 
+# Byte strings one of which is found in any file declaring models: the
+# `_name`/`_inherit` attributes, or the names of ORM base classes
+MODEL_MARKERS = (b"_name", b"_inherit", b"Model")
+
+
+def may_contain_models(content: typing.Union[bytes, mmap.mmap]) -> bool:
+    """Return False if `content` can't declare any Odoo model.
+
+    This is a cheap search of bytes, done before parsing a file.
+    """
+    if content.find(b"class") == -1:
+        return False
+    return any(content.find(marker) != -1 for marker in MODEL_MARKERS)
+
+
+def _get_point(content: bytes, offset: int) -> tuple[int, int]:
+    """Return the (row, column) tree-sitter point of a bytes offset."""
+    line_start = content.rfind(b"\n", 0, offset) + 1
+    return content.count(b"\n", 0, offset), offset - line_start
+
 
 class PyFile:
     """Python module file.
 
     Such file could contain Odoo model definitions.
+
+    The file is memory-mapped while models are extracted (see `MappedFile`),
+    then unmapped: `tree` nodes can't give their text afterwards.
+
+    Files that can't declare any model (see `may_contain_models()`) are not
+    parsed (`parsed` is False and `tree` is None) unless `prefilter` is
+    disabled.
+
+    The content can be given with `content` instead of being read from
+    `path` (e.g. an unsaved buffer of an editor). It can then be modified
+    with `edit()`: the file is parsed again incrementally, and only the
+    classes whose code changed are analyzed again.
     """
 
-    def __init__(self, path: pathlib.Path, module_path: pathlib.Path = None):
+    # Default value of the `prefilter` parameter
+    prefilter = True
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        module_path: pathlib.Path = None,
+        parser: typing.Optional[Parser] = None,
+        prefilter: typing.Optional[bool] = None,
+        content: typing.Optional[bytes] = None,
+    ):
         self.path = path
         self.module_path = module_path
-        self.lines, self.tree = self._parse_file()
-        self.models = self._get_models()
+        self.parser = parser or ts_utils.get_parser()
+        if prefilter is not None:
+            self.prefilter = prefilter
+        # (start_byte, end_byte, row, model key, model data) of each class,
+        # used by `edit()` to reuse data of classes not edited
+        self._classes = []
+        self.source, self.tree = self._parse_file(content)
+        try:
+            self.models = self._get_models()
+        finally:
+            self.source.close()
 
-    def _parse_file(self):
+    def _parse_file(self, content: typing.Optional[bytes] = None, old_tree=None):
         try:
-            with open(self.path, "rb") as file_:
-                content = file_.read()
-            lines = content.decode("utf-8").split("\n")
-            parser = ts_utils.get_parser()
-            tree = parser.parse(content)
-            return lines, tree
+            source = MappedFile(self.path) if content is None else Buffer(content)
         except Exception as exc:
             raise RuntimeError(f"Unable to parse file {self.path}") from exc
+        if self.prefilter and not may_contain_models(source.buffer):
+            return source, None
+        try:
+            if old_tree is None:
+                tree = self.parser.parse(source.buffer)
+            else:
+                tree = self.parser.parse(source.buffer, old_tree)
+            return source, tree
+        except Exception as exc:
+            source.close()
+            raise RuntimeError(f"Unable to parse file {self.path}") from exc
+
+    def edit(
+        self, start: int, old_end: int, new_text: typing.Union[str, bytes]
+    ) -> dict:
+        """Replace bytes from `start` to `old_end` by `new_text`.
+
+        Return the updated models. See `apply_edits()`.
+        """
+        return self.apply_edits([(start, old_end, new_text)])
+
+    def apply_edits(
+        self, edits: typing.Iterable[tuple[int, int, typing.Union[str, bytes]]]
+    ) -> dict:
+        """Apply text edits to the file content and update its models.
+
+        Each edit is a `(start, old_end, new_text)` tuple replacing bytes
+        from `start` to `old_end` (offsets in bytes, relative to the content
+        resulting from the previous edits) by `new_text`.
+        If the file has been read from `path`, it is read again first.
+        The syntax tree is updated and parsed again incrementally, and
+        models of classes whose code didn't change are reused.
+        Return the updated models.
+        """
+        content = old_content = self.source.buffer
+        if isinstance(content, mmap.mmap):
+            # Mapping closed once models were extracted
+            with open(self.path, "rb") as file_:
+                content = old_content = file_.read()
+        # Bytes range containing all changes, in the new content
+        changed = None
+        for start, old_end, new_text in edits:
+            if isinstance(new_text, str):
+                new_text = new_text.encode("utf-8")
+            new_end = start + len(new_text)
+            start_point = _get_point(content, start)
+            old_end_point = _get_point(content, old_end)
+            content = content[:start] + new_text + content[old_end:]
+            if self.tree is not None:
+                self.tree.edit(
+                    start_byte=start,
+                    old_end_byte=old_end,
+                    new_end_byte=new_end,
+                    start_point=start_point,
+                    old_end_point=old_end_point,
+                    new_end_point=_get_point(content, new_end),
+                )
+            if changed is None:
+                changed = (start, new_end)
+            else:
+                changed_end = changed[1]
+                if changed_end >= old_end:
+                    changed_end += new_end - old_end
+                elif changed_end > start:
+                    changed_end = new_end
+                changed = (min(changed[0], start), max(changed_end, new_end))
+        if changed is None:
+            return self.models
+        old_tree = self.tree
+        self.source, self.tree = self._parse_file(content, old_tree=old_tree)
+        if old_tree is None or self.tree is None:
+            self.models = self._get_models()
+            return self.models
+        # Parts of the file whose syntax changed because of the edits
+        # (e.g. an unclosed string), out of the edited ranges
+        start, end = changed
+        for range_ in old_tree.changed_ranges(self.tree):
+            start = min(start, range_.start_byte)
+            end = max(end, range_.end_byte)
+        try:
+            self.models = self._update_models(old_content, start, end)
+        except RuntimeError:
+            # Classes data are partially updated, analyze again the whole
+            # file on next edit
+            self.tree = None
+            raise
+        return self.models
+
+    @classmethod
+    def parse_files(
+        cls,
+        paths: typing.Iterable[pathlib.Path],
+        module_path: pathlib.Path = None,
+        parser: typing.Optional[Parser] = None,
+    ) -> typing.Iterator["PyFile"]:
+        """Parse Python files one after the other with the same parser.
+
+        Files are yielded as soon as they are parsed, so `paths` can be a
+        stream (e.g. a generator walking a folder).
+        """
+        parser = parser or ts_utils.get_parser()
+        for path in paths:
+            yield cls(path, module_path=module_path, parser=parser)
+
+    def get_code(self, node: Node) -> str:
+        """Return the source code of the lines spanned by `node`."""
+        return self.source.get_lines_at(node.start_byte, node.end_byte)
+
+    @property
+    def parsed(self) -> bool:
+        return self.tree is not None
 
     def _get_models(self) -> dict:
-        models = {}
+        self._classes = []
+        if self.parsed:
+            for class_node in ts_utils.find_class_definitions(self.tree.root_node):
+                self._classes.append(self._get_class(class_node))
+        return self._classes_models()
+
+    def _get_class(self, class_node: Node) -> tuple:
+        key, data = self._get_model(class_node)
+        return (
+            class_node.start_byte,
+            class_node.end_byte,
+            class_node.start_point[0],
+            key,
+            data,
+        )
+
+    def _classes_models(self) -> dict:
+        return {key: data for __, __, __, key, data in self._classes if key is not None}
+
+    def _update_models(self, old_content: bytes, start: int, end: int) -> dict:
+        """Update models after edits of the bytes from `start` to `end`.
+
+        Only classes on the lines of these bytes are analyzed again, the
+        others being moved if needed.
+        """
+        content = self.source.buffer
+        # Code of fields and methods are made of full lines
+        start, end = self.source.get_lines_span(start, end)
+        bytes_offset = len(content) - len(old_content)
+        old_end = end - bytes_offset
+        rows_offset = content.count(b"\n", start, end) - old_content.count(
+            b"\n", start, old_end
+        )
+        classes = []
+        for class_ in self._classes:
+            class_start, class_end, row, key, data = class_
+            if class_end < start:
+                classes.append(class_)
+            elif class_start > old_end:
+                if rows_offset:
+                    key, data = self._move_model(key, data, rows_offset)
+                classes.append(
+                    (
+                        class_start + bytes_offset,
+                        class_end + bytes_offset,
+                        row + rows_offset,
+                        key,
+                        data,
+                    )
+                )
         root_node = self.tree.root_node
+        for class_node in ts_utils.find_class_definitions(root_node, start, end):
+            classes.append(self._get_class(class_node))
+        self._classes = sorted(classes, key=lambda class_: class_[0])
+        return self._classes_models()
 
-        for class_node in ts_utils.find_class_definitions(root_node):
-            try:
-                if OdooModel.is_model(class_node):
-                    model = OdooModel(self, class_node)
-                    # Support corner case where the same data model is
-                    # declared/inherited multiple times in the same file
-                    # (each of them will add a new model definition entry).
-                    class_name = ts_utils.get_class_name(class_node)
-                    lineno = class_node.start_point[0] + 1
-                    key = f"{self.path}:{class_name}:{lineno}"
-                    models[key] = model.to_dict()
-                elif OdooModel.is_base_class(class_node):
-                    model = OdooModel(self, class_node)
-                    class_name = ts_utils.get_class_name(class_node)
-                    models[class_name] = model.to_dict()
-            except Exception as exc:
-                class_name = ts_utils.get_class_name(class_node) or "unknown"
+    def _get_model(self, class_node: Node) -> tuple:
+        """Return the key and data of the model declared by `class_node`."""
+        try:
+            if OdooModel.is_model(class_node):
+                model = OdooModel(self, class_node)
+                # Support corner case where the same data model is
+                # declared/inherited multiple times in the same file
+                # (each of them will add a new model definition entry).
+                class_name = ts_utils.get_class_name(class_node)
                 lineno = class_node.start_point[0] + 1
-                raise RuntimeError(
-                    f"Unable to parse class {class_name}:{lineno} in file {self.path}"
-                ) from exc
-        return models
+                key = f"{self.path}:{class_name}:{lineno}"
+                return key, model.to_dict()
+            elif OdooModel.is_base_class(class_node):
+                model = OdooModel(self, class_node)
+                class_name = ts_utils.get_class_name(class_node)
+                return class_name, model.to_dict()
+        except Exception as exc:
+            class_name = ts_utils.get_class_name(class_node) or "unknown"
+            lineno = class_node.start_point[0] + 1
+            raise RuntimeError(
+                f"Unable to parse class {class_name}:{lineno} in file {self.path}"
+            ) from exc
+        return None, None
+
+    def _move_model(self, key: typing.Optional[str], data: dict, offset: int):
+        """Return the key and data of a model moved by `offset` lines."""
+        if key is None:
+            return key, data
+        if key.startswith(f"{self.path}:"):
+            path_class_name, lineno = key.rsplit(":", 1)
+            key = f"{path_class_name}:{int(lineno) + offset}"
+        data = dict(data)
+        for attr in ("fields", "methods"):
+            if attr not in data:
+                continue
+            data[attr] = {
+                name: dict(
+                    item,
+                    lineno=item["lineno"] + offset,
+                    end_lineno=item["end_lineno"] + offset,
+                )
+                for name, item in data[attr].items()
+            }
+        return key, data
 
     def to_dict(self):
         return {"models": self.models}
@@ -293,7 +527,7 @@ class OdooField:
         self.type_ = self._extract_type(assign_node)
         self.lineno = assign_node.start_point[0] + 1
         self.end_lineno = assign_node.end_point[0] + 1
-        self.code = "\n".join(self.pyfile.lines[self.lineno - 1 : self.end_lineno])
+        self.code = self.pyfile.get_code(assign_node)
         self.args, self.kwargs = self._extract_arguments(assign_node)
         self.comodel_name = self._extract_comodel_name()
         self.inverse_name = self._extract_inverse_name()
@@ -443,7 +677,8 @@ class OdooMethod:
         self.signature = self._extract_method_signature(func_node)
         self.lineno = func_node.start_point[0] + 1
         self.end_lineno = func_node.end_point[0] + 1
-        self.code = "\n".join(self.pyfile.lines[self.lineno - 1 : self.end_lineno])
+        self.code = self.pyfile.get_code(func_node)
+        self.calls_super = ts_utils.calls_super(func_node)
 
     @classmethod
     def is_method(cls, func_node: Node) -> bool:
@@ -492,4 +727,6 @@ class OdooMethod:
         }
         if self.decorators:
             data["decorators"] = self.decorators
+        if self.calls_super:
+            data["super"] = True
         return data
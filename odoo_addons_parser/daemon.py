@@ -0,0 +1,383 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Long-lived scanner keeping modules data up to date, queried over a socket.
+
+Usage:
+
+    python -m odoo_addons_parser.daemon --socket /tmp/addons.sock \\
+        ./server-tools ./server-ux
+
+Then, from another process:
+
+    >>> from odoo_addons_parser.daemon import query
+    >>> query("/tmp/addons.sock", "model", name="res.partner")
+    {'base': {...}, 'server_environment': {...}}
+"""
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import socket
+import socketserver
+import threading
+import time
+import traceback
+import typing
+
+from .module import MANIFEST_FILES, get_manifest_path
+from .odoo import OdooParser
+from .repository import MODULE_FAILED, MODULE_FINISHED, RepositoryParser
+from .watch import Watcher, get_watcher
+
+_logger = logging.getLogger(__name__)
+
+
+class ScanDaemon:
+    """Keep the data of modules of several addons paths up to date.
+
+    Modules of the parsers (`RepositoryParser` or `OdooParser`) are scanned
+    once, then the addons paths are watched (see `odoo_addons_parser.watch`)
+    and only the modules containing changed files are scanned again. The
+    results of files analysis are cached per module, so only changed files
+    are parsed again (`PyFile`, `XmlFile`, `CsvFile`...), other results
+    being merged again in the module data.
+    When a module is available in several addons paths, the first one wins.
+    ORM base models of an `OdooParser` are scanned once at startup, and kept
+    apart from the modules data (see `base_models`), in case a module has
+    the same name as their `base_models_key`.
+
+    Data can be queried with `query()`, directly or through a Unix socket
+    (see `serve_forever()`), each request and response being a JSON object
+    on its own line:
+        {"method": "module", "params": {"name": "base"}}
+        {"result": {"name": "base", ...}}
+
+    E.g:
+        >>> daemon = ScanDaemon([RepositoryParser("./server-tools")])
+        >>> daemon.scan()
+        >>> daemon.query({"method": "modules"})
+        {'result': ['base_technical_user', ...]}
+    """
+
+    def __init__(
+        self,
+        parsers: typing.Iterable[typing.Union[RepositoryParser, OdooParser]],
+        socket_path: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        polling: bool = False,
+        poll_interval: float = 1.0,
+    ):
+        self.parsers = list(parsers)
+        self.repositories = []
+        for parser in self.parsers:
+            # OdooParser is a set of repositories
+            self.repositories.extend(getattr(parser, "repositories", [parser]))
+        self.socket_path = socket_path
+        self.polling = polling
+        self.poll_interval = poll_interval
+        self.data = {}
+        # ORM base models of the `OdooParser`, by `base_models_key`
+        self.base_models = {}
+        self.updated = None
+        self._module_paths = {}  # {module: (repository, module_path)}
+        self._caches = {}  # {module: {file_key: file_results}}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server = None
+
+    def _find_module(self, module: str) -> typing.Optional[tuple]:
+        """Return the repository and path of `module` (first one wins)."""
+        for repo in self.repositories:
+            module_path = repo.folder_path.joinpath(module)
+            if not get_manifest_path(module_path):
+                continue
+            if not repo.is_selected(module):
+                continue
+            return repo, module_path
+        return None
+
+    def scan(self):
+        """Scan all modules."""
+        data = {}
+        base_models = {}
+        module_paths = {}
+        for parser in self.parsers:
+            if isinstance(parser, OdooParser):
+                base_models.update(parser.base_models_to_dict())
+        for repo in self.repositories:
+            for module_path in repo.module_paths:
+                module_paths.setdefault(module_path.name, (repo, module_path))
+        for module, (repo, module_path) in sorted(module_paths.items()):
+            if repo.workers:
+                continue
+            self._caches[module] = {}
+            data[module] = self._scan_module(module, repo, module_path)
+        # Modules of repositories with workers are scanned in parallel,
+        # without caching files results (it will be done on first change)
+        for repo in self.repositories:
+            if not repo.workers:
+                continue
+            for event in repo.iter_events():
+                module = event["module"]
+                if module_paths[module][0] is not repo:
+                    continue
+                if event["event"] == MODULE_FINISHED:
+                    data[module] = event["data"]
+                elif event["event"] == MODULE_FAILED:
+                    data[module] = {"name": module, "error": event["error"]}
+        with self._lock:
+            self.data = data
+            self.base_models = base_models
+            self._module_paths = module_paths
+            self.updated = time.time()
+
+    def _scan_module(self, module: str, repo, module_path) -> dict:
+        cache = self._caches.setdefault(module, {})
+        try:
+            parser = repo.get_module_parser(module_path, cache=cache)
+            module_data = parser.to_dict()
+        except Exception:
+            _logger.exception(f"Unable to scan module {module}")
+            cache.clear()
+            return {"name": module, "error": traceback.format_exc()}
+        # Drop results of files changed or removed
+        for key in cache.keys() - parser.cache_keys:
+            del cache[key]
+        return module_data
+
+    def _get_changed_modules(self, paths: typing.Iterable[pathlib.Path]) -> set[str]:
+        modules = set()
+        reset_repositories = set()
+        for path in paths:
+            for repo in self.repositories:
+                try:
+                    relative_path = path.relative_to(repo.folder_path)
+                except ValueError:
+                    continue
+                if repo.modules is not None and (
+                    not relative_path.parts
+                    or len(relative_path.parts) == 2
+                    and relative_path.name in MANIFEST_FILES
+                ):
+                    # Dependencies of the selected modules could have changed
+                    reset_repositories.add(repo)
+                if not relative_path.parts:
+                    # Unknown changes in the whole addons path
+                    modules.update(
+                        module_path.name for module_path in repo.all_module_paths
+                    )
+                    modules.update(
+                        module
+                        for module, (module_repo, __) in self._module_paths.items()
+                        if module_repo is repo
+                    )
+                else:
+                    modules.add(relative_path.parts[0])
+        for repo in reset_repositories:
+            repo.reset_selection()
+            # Modules added to (or removed from) the dependencies
+            scanned = {
+                module
+                for module, (module_repo, __) in self._module_paths.items()
+                if module_repo is repo
+            }
+            modules.update(
+                scanned ^ {module_path.name for module_path in repo.module_paths}
+            )
+        return modules
+
+    def update(self, paths: typing.Iterable[pathlib.Path]) -> set[str]:
+        """Scan again modules containing `paths`, return their names.
+
+        Modules added (or removed) are scanned (or removed) too.
+        """
+        modules = self._get_changed_modules(paths)
+        updates = {}
+        module_paths = {}
+        for module in modules:
+            found = self._find_module(module)
+            if found is None:
+                if module not in self._module_paths:
+                    # Not a module (e.g. '.git' folder)
+                    continue
+                updates[module] = module_paths[module] = None
+                self._caches.pop(module, None)
+                continue
+            repo, module_path = found
+            if self._module_paths.get(module, (None, None))[1] != module_path:
+                # Module added, or moved to another addons path
+                self._caches.pop(module, None)
+            module_paths[module] = found
+            updates[module] = self._scan_module(module, repo, module_path)
+        with self._lock:
+            for module, module_data in updates.items():
+                if module_data is None:
+                    self.data.pop(module, None)
+                    self._module_paths.pop(module, None)
+                else:
+                    self.data[module] = module_data
+                    self._module_paths[module] = module_paths[module]
+            if updates:
+                self.updated = time.time()
+        if updates:
+            _logger.info(f"Modules updated: {', '.join(sorted(updates))}")
+        return set(updates)
+
+    def _get_module_data(self, name: str) -> typing.Optional[dict]:
+        """Return the data of a module, with the base models stored under
+        its name if any (see `OdooParser.base_models_key`).
+        """
+        module_data = self.data.get(name)
+        base_data = self.base_models.get(name)
+        if base_data is None or module_data is None:
+            return base_data if module_data is None else module_data
+        models = dict(base_data.get("models", {}), **module_data.get("models", {}))
+        return dict(module_data, models=models)
+
+    def query(self, request: dict) -> dict:
+        """Answer a request, returning `{"result": ...}` or `{"error": ...}`.
+
+        The result is a snapshot of the data, serialized by the caller.
+        Available methods (with their `params`) are:
+            - `status`: number of modules and time of the last update
+            - `modules`: names of the available modules
+            - `module` (`name`): data of a module
+            - `model` (`name`): data of a model, by module declaring it
+            - `data`: data of all modules
+        """
+        method = request.get("method")
+        params = request.get("params") or {}
+        with self._lock:
+            if method == "status":
+                result = {"modules": len(self.data), "updated": self.updated}
+            elif method == "modules":
+                result = sorted(self.data.keys() | self.base_models.keys())
+            elif method == "module":
+                name = params.get("name")
+                result = self._get_module_data(name)
+                if result is None:
+                    return {"error": f"Unknown module {name!r}"}
+                result = dict(result)
+            elif method == "model":
+                name = params.get("name")
+                result = {}
+                for module in sorted(self.data.keys() | self.base_models.keys()):
+                    models = self._get_module_data(module).get("models", {})
+                    if name in models:
+                        result[module] = models[name]
+            elif method == "data":
+                result = {
+                    module: self._get_module_data(module)
+                    for module in sorted(self.data.keys() | self.base_models.keys())
+                }
+            else:
+                return {"error": f"Unknown method {method!r}"}
+        # Data of modules are replaced on update, never modified in place, so
+        # containers copied while holding the lock are consistent snapshots
+        return {"result": result}
+
+    def get_watcher(self) -> Watcher:
+        return get_watcher(
+            [repo.folder_path for repo in self.repositories],
+            polling=self.polling,
+            interval=self.poll_interval,
+        )
+
+    def serve_forever(self):
+        """Scan modules, then serve queries while watching files, until `stop()`."""
+        # Start watching before the initial scan to not miss any change
+        with self.get_watcher() as watcher:
+            self.scan()
+            if self.socket_path:
+                self._start_server()
+            try:
+                while not self._stop.is_set():
+                    changes = watcher.wait(timeout=1)
+                    if changes:
+                        self.update(changes)
+            finally:
+                self._stop_server()
+
+    def stop(self):
+        self._stop.set()
+
+    def _start_server(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.query(json.loads(line))
+                    except Exception as exc:
+                        response = {"error": str(exc)}
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        socket_path = pathlib.Path(self.socket_path)
+        if socket_path.is_socket():
+            socket_path.unlink()
+        self._server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _stop_server(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        pathlib.Path(self.socket_path).unlink(missing_ok=True)
+
+
+def query(
+    socket_path: typing.Union[str, os.PathLike], method: str, **params
+) -> typing.Any:
+    """Send a request to a daemon, return the result.
+
+    Raise `RuntimeError` if the daemon returns an error.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        request = {"method": method, "params": params}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as file_:
+            response = json.loads(file_.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["result"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("addons_paths", nargs="*", help="Addons paths to scan")
+    parser.add_argument("--odoo", help="Path of the Odoo source code repository")
+    parser.add_argument("--socket", required=True, help="Path of the Unix socket")
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--no-code-stats", dest="code_stats", action="store_false")
+    parser.add_argument("--polling", action="store_true")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    options = {"workers": args.workers, "code_stats": args.code_stats}
+    parsers = []
+    if args.odoo:
+        parsers.append(OdooParser(args.odoo, **options))
+    parsers.extend(RepositoryParser(path, **options) for path in args.addons_paths)
+    if not parsers:
+        parser.error("no addons path to scan")
+    daemon = ScanDaemon(
+        parsers,
+        socket_path=args.socket,
+        polling=args.polling,
+        poll_interval=args.poll_interval,
+    )
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
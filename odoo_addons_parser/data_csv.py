@@ -2,6 +2,7 @@
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 
 import csv
+import io
 import logging
 import pathlib
 from typing import Any, Dict, List, Optional
@@ -16,10 +17,18 @@ class CsvParseError(Exception):
 
 
 class CsvFile:
-    """Parse and extract data from Odoo CSV files."""
+    """Parse and extract data from Odoo CSV files.
+
+    The content can be given with `content` instead of being read from
+    `file_path` (e.g. a blob read from a git repository).
+    """
 
     def __init__(
-        self, module_path: pathlib.Path, file_path: pathlib.Path, loaded: bool = False
+        self,
+        module_path: pathlib.Path,
+        file_path: pathlib.Path,
+        loaded: bool = False,
+        content: Optional[bytes] = None,
     ):
         self.module_path = module_path
         self.module_name = self.module_path.name
@@ -27,7 +36,7 @@ class CsvFile:
         self.relative_file_path = self.file_path.relative_to(self.module_path)
         self.loaded = loaded
         self.model_name = self._extract_model_name()
-        self.records = self._parse_csv()
+        self.records = self._parse_csv(content)
 
     def _extract_model_name(self) -> str:
         """Extract model name from filename.
@@ -38,11 +47,15 @@ class CsvFile:
             return self.file_path.stem
         raise CsvParseError(f"Invalid CSV filename: {self.file_path.name}")
 
-    def _parse_csv(self) -> List[Dict[str, Any]]:
+    def _parse_csv(self, content: Optional[bytes] = None) -> List[Dict[str, Any]]:
         """Parse CSV file and return list of records."""
         records = []
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file_:
+            if content is None:
+                file_ = open(self.file_path, "r", encoding="utf-8")
+            else:
+                file_ = io.StringIO(content.decode("utf-8"), newline=None)
+            with file_:
                 reader = csv.DictReader(file_)
                 for row_num, row in enumerate(reader, start=2):
                     try:
@@ -1,6 +1,7 @@
 # Copyright 2025 Sebastien Alix <https://github.com/sebalix>
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 
+import io
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional, Any
 import pathlib
@@ -21,26 +22,40 @@ class XmlValidationError(Exception):
     pass
 
 
+def get_full_xmlid(module: str, xmlid: Optional[str]) -> Optional[str]:
+    """Return the full XML ID (`module.id`) of an XML ID used in `module`."""
+    if not xmlid:
+        return None
+    return xmlid if "." in xmlid else f"{module}.{xmlid}"
+
+
 class XmlFile:
     """XML backend data file.
 
     Such file could contain record definitions such as views, menu, records...
+
+    The content can be given with `content` instead of being read from
+    `file_path` (e.g. a blob read from a git repository).
     """
 
     def __init__(
-        self, module_path: pathlib.Path, file_path: pathlib.Path, loaded: bool = False
+        self,
+        module_path: pathlib.Path,
+        file_path: pathlib.Path,
+        loaded: bool = False,
+        content: Optional[bytes] = None,
     ):
         self.module_path = module_path
         self.module_name = self.module_path.name
         self.file_path = file_path
         self.relative_file_path = self.file_path.relative_to(self.module_path)
         self.loaded = loaded
-        self.elements = self._parse_file()
+        self.elements = self._parse_file(content)
 
-    def _parse_file(self) -> Dict:
+    def _parse_file(self, content: Optional[bytes] = None) -> Dict:
         """Parse the XML file and extract relevant elements."""
         try:
-            tree = ET.parse(self.file_path)
+            tree = ET.parse(self.file_path if content is None else io.BytesIO(content))
             root = tree.getroot()
             # Handle both 'odoo' and 'openerp' root tags
             if root.tag not in ("odoo", "openerp"):
@@ -264,6 +279,10 @@ class XmlRecord(XmlTag):
                 # This handles cases like <field name="inherit_id" ref="base.view_id"/>
                 if field.get("ref"):
                     data[field_name] = field.get("ref")
+                # Keep 'eval' expressions as is, e.g. to find the XML IDs they
+                # reference: <field name="groups_id" eval="[(4, ref('base.group_user'))]"/>
+                elif field.get("eval"):
+                    data[field_name] = field.get("eval")
                 else:
                     # For XML fields, extract the full XML content including child elements
                     if self.model == "ir.ui.view" and field.get("name") == "arch":
@@ -0,0 +1,230 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Compare two scans through Merkle-like fingerprints of their content.
+
+Each level of a scan gets a fingerprint (a hash) computed from the ones of
+its children: scan -> module -> model -> field/method, and
+scan -> module -> data model -> record (by XML ID). Two fingerprints being
+equal means their whole subtrees are, so a diff only walks what changed.
+
+E.g:
+    >>> old = fingerprint(RepositoryParser("./server-tools").to_dict())
+    >>> # ... checkout another branch
+    >>> new = fingerprint(RepositoryParser("./server-tools").to_dict())
+    >>> diff(old, new)
+    {'added': ['base_new_module'], 'changed': {'base_technical_user': {...}}}
+"""
+
+import hashlib
+import json
+import typing
+
+# Keys of fields and methods ignored by default: code moved to other lines
+# is not a change
+POSITION_KEYS = frozenset(["lineno", "end_lineno"])
+
+# Module keys containing data records, by model
+RECORDS_KEYS = ("data", "demo")
+
+
+# Values are hashed from their canonical JSON encoding
+_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def _hash(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class Fingerprint:
+    """Fingerprint of a value (leaf) or of a mapping of fingerprints (node)."""
+
+    __slots__ = ("hash", "children")
+
+    def __init__(
+        self,
+        hash_: str,
+        children: typing.Optional[dict[str, "Fingerprint"]] = None,
+    ):
+        self.hash = hash_
+        self.children = children
+
+    @classmethod
+    def leaf(cls, value: typing.Any) -> "Fingerprint":
+        return cls(_hash(_encoder.encode(value).encode()))
+
+    @classmethod
+    def node(cls, children: dict[str, "Fingerprint"]) -> "Fingerprint":
+        content = "\0".join(
+            f"{key}\0{children[key].hash}" for key in sorted(children)
+        ).encode()
+        return cls(_hash(content), children)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Fingerprint) and self.hash == other.hash
+
+    def __hash__(self) -> int:
+        return hash(self.hash)
+
+    def __repr__(self) -> str:
+        return f"<Fingerprint {self.hash}>"
+
+    def to_dict(self) -> typing.Union[str, dict]:
+        """Return a JSON serializable version of the fingerprint (see `from_dict()`)."""
+        if self.children is None:
+            return self.hash
+        return {
+            "hash": self.hash,
+            "children": {key: child.to_dict() for key, child in self.children.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: typing.Union[str, dict]) -> "Fingerprint":
+        if isinstance(data, str):
+            return cls(data)
+        children = {
+            key: cls.from_dict(child) for key, child in data["children"].items()
+        }
+        return cls(data["hash"], children)
+
+
+def _fingerprint_items(
+    items: dict, ignored_keys: typing.Collection[str]
+) -> Fingerprint:
+    """Return the fingerprint of fields or methods, by name."""
+    return Fingerprint.node(
+        {
+            name: Fingerprint.leaf(
+                {key: value for key, value in item.items() if key not in ignored_keys}
+            )
+            for name, item in items.items()
+        }
+    )
+
+
+def fingerprint_model(
+    model: dict, ignored_keys: typing.Collection[str] = POSITION_KEYS
+) -> Fingerprint:
+    """Return the fingerprint of a model, with its fields, methods and attributes."""
+    children = {}
+    for key, value in model.items():
+        if key in ("fields", "methods"):
+            children[key] = _fingerprint_items(value, ignored_keys)
+        else:
+            children[key] = Fingerprint.leaf(value)
+    return Fingerprint.node(children)
+
+
+def fingerprint_records(records: dict[str, list[dict]]) -> Fingerprint:
+    """Return the fingerprint of data records, by model then by XML ID."""
+    children = {}
+    for model, model_records in records.items():
+        by_xmlid = {}
+        for record in model_records:
+            # Records without XML ID are compared together
+            by_xmlid.setdefault(record.get("id") or "", []).append(record)
+        children[model] = Fingerprint.node(
+            {
+                xmlid: Fingerprint.leaf(xmlid_records)
+                for xmlid, xmlid_records in by_xmlid.items()
+            }
+        )
+    return Fingerprint.node(children)
+
+
+def fingerprint_module(
+    module_data: dict, ignored_keys: typing.Collection[str] = POSITION_KEYS
+) -> Fingerprint:
+    """Return the fingerprint of the data of a module."""
+    children = {}
+    for key, value in module_data.items():
+        if key == "models":
+            children[key] = Fingerprint.node(
+                {
+                    model: fingerprint_model(model_data, ignored_keys)
+                    for model, model_data in value.items()
+                }
+            )
+        elif key in RECORDS_KEYS:
+            children[key] = fingerprint_records(value)
+        else:
+            children[key] = Fingerprint.leaf(value)
+    return Fingerprint.node(children)
+
+
+def fingerprint(
+    data: dict, ignored_keys: typing.Collection[str] = POSITION_KEYS
+) -> Fingerprint:
+    """Return the fingerprint of a scan, by module.
+
+    `data` is the output of `RepositoryParser.to_dict()` or
+    `OdooParser.to_dict()`. Keys of fields and methods in `ignored_keys`
+    (line numbers by default) are not part of their fingerprints.
+    """
+    return Fingerprint.node(
+        {
+            module: fingerprint_module(module_data, ignored_keys)
+            for module, module_data in data.items()
+        }
+    )
+
+
+def diff(old: Fingerprint, new: Fingerprint) -> dict:
+    """Return the differences between two fingerprints.
+
+    At each level, the result contains the sorted keys `added` and
+    `removed`, and the `changed` keys with the diff of their subtree (or
+    True for values). Empty entries are omitted, so the diff of identical
+    fingerprints is `{}`. E.g. for two scans:
+        {
+            "added": ["new_module"],
+            "changed": {
+                "sale": {
+                    "changed": {
+                        "manifest": True,
+                        "models": {
+                            "changed": {
+                                "sale.order": {
+                                    "changed": {"fields": {"added": ["foo"]}},
+                                },
+                            },
+                        },
+                        "data": {"changed": {"ir.ui.view": {"removed": ["view_bar"]}}},
+                    },
+                },
+            },
+        }
+    """
+    if old.hash == new.hash:
+        return {}
+    result = {}
+    old_children = old.children or {}
+    new_children = new.children or {}
+    added = sorted(new_children.keys() - old_children.keys())
+    if added:
+        result["added"] = added
+    removed = sorted(old_children.keys() - new_children.keys())
+    if removed:
+        result["removed"] = removed
+    changed = {}
+    for key in sorted(old_children.keys() & new_children.keys()):
+        old_child, new_child = old_children[key], new_children[key]
+        if old_child.hash == new_child.hash:
+            continue
+        if old_child.children is None or new_child.children is None:
+            changed[key] = True
+        else:
+            changed[key] = diff(old_child, new_child)
+    if changed:
+        result["changed"] = changed
+    return result
+
+
+def diff_scans(
+    old_data: dict,
+    new_data: dict,
+    ignored_keys: typing.Collection[str] = POSITION_KEYS,
+) -> dict:
+    """Return the differences between two scans, see `fingerprint()` and `diff()`."""
+    return diff(
+        fingerprint(old_data, ignored_keys), fingerprint(new_data, ignored_keys)
+    )
@@ -0,0 +1,261 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Scan modules straight from the objects of a git repository.
+
+Trees are listed with `git ls-tree` and files contents are streamed by a
+long-lived `git cat-file --batch` process, so branches can be scanned
+without being checked out. Files results are cached by blob SHA (see
+`ModuleParser.cache`): files unchanged between branches are parsed once.
+
+E.g:
+    >>> repository = GitRepository("./server-tools")
+    >>> cache = {}
+    >>> data = {
+    ...     version: GitRepositoryParser(repository, rev=f"origin/{version}", cache=cache).to_dict()
+    ...     for version in ("16.0", "17.0", "18.0")
+    ... }
+"""
+
+import os
+import pathlib
+import subprocess
+import threading
+import typing
+import weakref
+
+from .tree import (
+    Entry,
+    Tree,
+    TreeModuleParser,
+    TreeOdooParser,
+    TreeRepositoryParser,
+)
+
+# Modes of entries not scanned: symbolic links and submodules
+SYMLINK_MODE = "120000"
+SUBMODULE_MODE = "160000"
+
+
+class GitError(Exception):
+    """Exception raised when a git command fails."""
+
+
+# Repositories opened in the current process, by path (see `GitRepository`)
+_repositories = {}
+
+
+def _stop_process(process: subprocess.Popen):
+    """Stop a `git cat-file --batch` process, once its input is closed."""
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+    process.wait()
+    process.stdout.close()
+
+
+def _get_repository(path: str) -> "GitRepository":
+    try:
+        return _repositories[path]
+    except KeyError:
+        repository = _repositories[path] = GitRepository(path)
+        return repository
+
+
+class GitRepository:
+    """Read the trees and blobs of a git repository.
+
+    Blobs are read by one `git cat-file --batch` process, started on first
+    use and kept until `close()` (or the end of a `with` block, or the
+    repository being garbage collected). Trees are listed once per commit.
+
+    Sent to a worker process, a repository is opened again there (once per
+    process, whatever the number of modules it scans).
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        self.path = pathlib.Path(path).resolve()
+        self._process = None
+        self._finalizer = None
+        self._lock = threading.Lock()
+        self._trees = {}
+
+    def __reduce__(self):
+        return (_get_repository, (str(self.path),))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def run(self, *args: str) -> bytes:
+        """Run a git command in the repository, return its output."""
+        result = subprocess.run(
+            ["git", "-C", str(self.path), *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode:
+            error = result.stderr.decode(errors="replace").strip()
+            raise GitError(f"'git {args[0]}' failed in {self.path}: {error}")
+        return result.stdout
+
+    def resolve(self, rev: str) -> str:
+        """Return the SHA of the commit `rev` (branch, tag, SHA...) points to."""
+        return self.run("rev-parse", "--verify", f"{rev}^{{commit}}").decode().strip()
+
+    def get_tree(self, rev: str = "HEAD") -> "GitTree":
+        """Return the files of the commit `rev`."""
+        # Parsers give commit SHAs, already resolved
+        commit = rev if rev in self._trees else self.resolve(rev)
+        if commit not in self._trees:
+            self._trees[commit] = GitTree(self, commit)
+        return self._trees[commit]
+
+    def read_blob(self, sha: str) -> bytes:
+        """Return the content of the blob `sha`."""
+        with self._lock:
+            if self._process is None:
+                self._process = subprocess.Popen(
+                    ["git", "-C", str(self.path), "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+                # Stopped once unused, if not closed before
+                self._finalizer = weakref.finalize(self, _stop_process, self._process)
+            stdin, stdout = self._process.stdin, self._process.stdout
+            try:
+                stdin.write(sha.encode() + b"\n")
+                stdin.flush()
+                header = stdout.readline()
+            except OSError as exc:
+                header = b""
+                error = exc
+            else:
+                error = None
+            if not header:
+                self._close_process()
+                raise GitError(f"'git cat-file' stopped in {self.path}") from error
+            # '<sha> <type> <size>' or '<object> missing'
+            parts = header.split()
+            if parts[-1] == b"missing":
+                raise GitError(f"Object {sha} not found in {self.path}")
+            content = stdout.read(int(parts[2]))
+            # Each content is followed by a line break
+            stdout.read(1)
+            return content
+
+    def _close_process(self):
+        if self._process is None:
+            return
+        self._process = None
+        self._finalizer()
+
+    def close(self):
+        """Stop the `git cat-file` process."""
+        with self._lock:
+            self._close_process()
+
+
+class GitTree(Tree):
+    """Files of a git commit, listed once with `git ls-tree`.
+
+    Entries are identified by their blob SHA.
+    """
+
+    def __init__(self, repository: GitRepository, commit: str):
+        super().__init__()
+        self.repository = repository
+        self.commit = commit
+        output = repository.run("ls-tree", "-r", "-t", "-l", "-z", commit)
+        for line in output.split(b"\0"):
+            if not line:
+                continue
+            info, path = line.split(b"\t", 1)
+            mode, type_, sha, size = info.decode().split()
+            if mode in (SYMLINK_MODE, SUBMODULE_MODE):
+                type_ = mode
+            self._add(
+                os.fsdecode(path), Entry(type_, sha, int(size) if size != "-" else 0)
+            )
+
+    def __str__(self):
+        return f"commit {self.commit}"
+
+    def _read(self, path, entry):
+        return self.repository.read_blob(entry.id)
+
+
+class GitRepositoryParser(TreeRepositoryParser):
+    """Parser of an addons path stored in a git repository, at a given commit.
+
+    `folder_path` is the path of the addons path relative to the root of
+    the repository (the root by default). Other parameters are the ones of
+    `RepositoryParser`.
+
+    Without workers, results of files are stored in `cache` (a mapping
+    shared between the parsers of several commits), so files unchanged
+    between these commits are parsed only once.
+    """
+
+    module_parser_class = TreeModuleParser
+
+    def __init__(
+        self,
+        repository: typing.Union[str, os.PathLike, GitRepository],
+        rev: str = "HEAD",
+        folder_path: typing.Union[str, os.PathLike] = "",
+        name: typing.Optional[str] = None,
+        cache: typing.Optional[typing.MutableMapping] = None,
+        **kwargs,
+    ):
+        if not isinstance(repository, GitRepository):
+            repository = GitRepository(repository)
+        self.repository = repository
+        self.rev = rev
+        self.commit = repository.resolve(rev)
+        if name is None:
+            name = pathlib.PurePosixPath(repository.path.name, folder_path).as_posix()
+        super().__init__(folder_path, cache=cache, name=name, **kwargs)
+
+    @property
+    def tree(self) -> GitTree:
+        return self.repository.get_tree(self.commit)
+
+
+class GitOdooParser(TreeOdooParser):
+    """Parser of the Odoo repository stored in git, at a given commit.
+
+    See `OdooParser` and `GitRepositoryParser`.
+
+    E.g:
+        >>> data = GitOdooParser("./odoo", rev="origin/18.0", code_stats=False).to_dict()
+    """
+
+    def __init__(
+        self,
+        repository: typing.Union[str, os.PathLike, GitRepository],
+        rev: str = "HEAD",
+        name: typing.Optional[str] = None,
+        cache: typing.Optional[typing.MutableMapping] = None,
+        **kwargs,
+    ):
+        if not isinstance(repository, GitRepository):
+            repository = GitRepository(repository)
+        self.repository = repository
+        self.rev = rev
+        self.commit = repository.resolve(rev)
+        if name is None:
+            name = repository.path.name
+        super().__init__("", cache=cache, name=name, **kwargs)
+
+    @property
+    def tree(self) -> GitTree:
+        return self.repository.get_tree(self.commit)
+
+    def _new_repository_parser(self, folder_path, **kwargs):
+        return GitRepositoryParser(
+            self.repository, rev=self.commit, folder_path=folder_path, **kwargs
+        )
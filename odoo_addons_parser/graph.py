@@ -0,0 +1,313 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Build the dependency graph of Odoo modules from their manifests."""
+
+import functools
+import heapq
+import typing
+
+if typing.TYPE_CHECKING:
+    from .odoo import OdooParser
+    from .repository import RepositoryParser
+
+
+class DependencyCycleError(Exception):
+    """Exception raised when modules depend on each other in a cycle."""
+
+    def __init__(self, cycles: list[list[str]]):
+        self.cycles = cycles
+        desc = "; ".join(" <-> ".join(cycle) for cycle in cycles)
+        super().__init__(f"Dependency cycle(s) detected: {desc}")
+
+
+class DependencyGraph:
+    """Dependency graph of Odoo modules.
+
+    Each module is mapped to a bit position, and the transitive closures of
+    dependencies (and of reverse dependencies) are stored as Python integers
+    used as bitsets. They are computed once on first use, then any query
+    such as "which modules are impacted by a change in module X" is a few
+    bitwise operations.
+
+    Modules listed in `depends` but not available in the scanned sources are
+    part of the graph too, see `missing`.
+
+    E.g:
+        >>> graph = DependencyGraph.from_parsers(RepositoryParser("./server-tools"))
+        >>> graph.load_order()
+        ['base', 'web', ...]
+        >>> graph.dependents("base_technical_user")
+        ['server_environment', ...]
+    """
+
+    def __init__(self, depends: typing.Mapping[str, typing.Iterable[str]]):
+        self.available = frozenset(depends)
+        modules = set(depends)
+        for deps in depends.values():
+            modules.update(deps)
+        self.modules = tuple(sorted(modules))
+        self._index = {module: i for i, module in enumerate(self.modules)}
+        self._depends = [0] * len(self.modules)
+        for module, deps in depends.items():
+            mask = 0
+            for dep in deps:
+                mask |= 1 << self._index[dep]
+            self._depends[self._index[module]] = mask
+
+    @classmethod
+    def from_manifests(cls, manifests: typing.Mapping[str, dict]) -> "DependencyGraph":
+        """Build the graph from a `{module_name: manifest}` mapping."""
+        return cls(
+            {
+                module: manifest.get("depends", [])
+                for module, manifest in manifests.items()
+            }
+        )
+
+    @classmethod
+    def from_dict(cls, *datasets: dict) -> "DependencyGraph":
+        """Build the graph from one or several `to_dict()` outputs.
+
+        The datasets are outputs of `RepositoryParser.to_dict()` or
+        `OdooParser.to_dict()`. When a module is available in several of
+        them, the first one wins (like in an Odoo addons path).
+        """
+        manifests = {}
+        for data in datasets:
+            for module, module_data in data.items():
+                if "manifest" not in module_data:
+                    # E.g. the '__odoo__' base models entry
+                    continue
+                manifests.setdefault(module, module_data["manifest"])
+        return cls.from_manifests(manifests)
+
+    @classmethod
+    def from_parsers(
+        cls, *parsers: typing.Union["RepositoryParser", "OdooParser"]
+    ) -> "DependencyGraph":
+        """Build the graph by reading the manifests of the parsers' modules.
+
+        Only manifest files are read, modules are not scanned. When a module
+        is available in several repositories, the first one wins.
+        """
+        manifests = {}
+        for parser in parsers:
+            # OdooParser is a set of repositories
+            repositories = getattr(parser, "repositories", [parser])
+            for repo in repositories:
+                for module_path in repo.all_module_paths:
+                    if module_path.name in manifests:
+                        continue
+                    manifests[module_path.name] = repo.read_manifest(module_path)
+        return cls.from_manifests(manifests)
+
+    def __contains__(self, module: str) -> bool:
+        return module in self._index
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    @property
+    def missing(self) -> dict[str, list[str]]:
+        """Return dependencies not available, with the modules requiring them."""
+        missing = {}
+        for module in sorted(self.available):
+            for dep in self._names(self._depends[self._index[module]]):
+                if dep not in self.available:
+                    missing.setdefault(dep, []).append(module)
+        return missing
+
+    def _names(self, mask: int) -> list[str]:
+        """Return the module names of the bits set in `mask`."""
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self.modules[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
+
+    def _mask(self, modules: typing.Union[str, typing.Iterable[str]]) -> int:
+        if isinstance(modules, str):
+            modules = [modules]
+        mask = 0
+        for module in modules:
+            if module not in self._index:
+                raise KeyError(f"Module '{module}' is not part of the graph")
+            mask |= 1 << self._index[module]
+        return mask
+
+    @functools.cached_property
+    def _components(self) -> list[list[int]]:
+        """Return strongly connected components, dependencies first.
+
+        Iterative implementation of Tarjan's algorithm (no recursion limit
+        to worry about with thousands of modules).
+        """
+        index_of = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in range(len(self.modules)):
+            if root in index_of:
+                continue
+            work = [(root, iter(self._names(self._depends[root])))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, deps = work[-1]
+                for dep_name in deps:
+                    dep = self._index[dep_name]
+                    if dep not in index_of:
+                        index_of[dep] = lowlink[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(self._names(self._depends[dep]))))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def cycles(self) -> list[list[str]]:
+        """Return the groups of modules depending on each other."""
+        cycles = []
+        for component in self._components:
+            node = component[0]
+            if len(component) > 1 or self._depends[node] >> node & 1:
+                cycles.append(sorted(self.modules[i] for i in component))
+        return sorted(cycles)
+
+    @functools.cached_property
+    def _closures(self) -> list[int]:
+        """Transitive dependencies of each module, as bitsets."""
+        closures = [0] * len(self.modules)
+        # Components are sorted dependencies first, so the closures of
+        # dependencies are always known when a component is processed.
+        for component in self._components:
+            mask = 0
+            for node in component:
+                mask |= self._depends[node]
+            closure = mask
+            while mask:
+                low_bit = mask & -mask
+                closure |= closures[low_bit.bit_length() - 1]
+                mask ^= low_bit
+            for node in component:
+                closures[node] = closure
+        return closures
+
+    @functools.cached_property
+    def _reverse_closures(self) -> list[int]:
+        """Transitive reverse dependencies of each module, as bitsets."""
+        direct = [0] * len(self.modules)
+        for node, mask in enumerate(self._depends):
+            node_bit = 1 << node
+            while mask:
+                low_bit = mask & -mask
+                direct[low_bit.bit_length() - 1] |= node_bit
+                mask ^= low_bit
+        reverse = [0] * len(self.modules)
+        # Walk components dependents first, so the reverse closures of the
+        # direct dependents are always known when a component is processed.
+        for component in reversed(self._components):
+            mask = 0
+            for node in component:
+                mask |= direct[node]
+            closure = mask
+            while mask:
+                low_bit = mask & -mask
+                closure |= reverse[low_bit.bit_length() - 1]
+                mask ^= low_bit
+            for node in component:
+                reverse[node] = closure
+        return reverse
+
+    def dependencies(
+        self, modules: typing.Union[str, typing.Iterable[str]]
+    ) -> list[str]:
+        """Return the transitive dependencies of `modules`."""
+        mask = self._mask(modules)
+        closure = 0
+        while mask:
+            low_bit = mask & -mask
+            closure |= self._closures[low_bit.bit_length() - 1]
+            mask ^= low_bit
+        return self._names(closure)
+
+    def dependents(self, modules: typing.Union[str, typing.Iterable[str]]) -> list[str]:
+        """Return the modules depending (transitively) on `modules`."""
+        mask = self._mask(modules)
+        closure = 0
+        while mask:
+            low_bit = mask & -mask
+            closure |= self._reverse_closures[low_bit.bit_length() - 1]
+            mask ^= low_bit
+        return self._names(closure)
+
+    def closure(self, modules: typing.Union[str, typing.Iterable[str]]) -> list[str]:
+        """Return `modules` with all their transitive dependencies."""
+        return self._names(self._mask(modules) | self._mask(self.dependencies(modules)))
+
+    def impacted(self, modules: typing.Union[str, typing.Iterable[str]]) -> list[str]:
+        """Return `modules` with all the modules depending on them.
+
+        This is the set of modules to test when `modules` are changed.
+        """
+        return self._names(self._mask(modules) | self._mask(self.dependents(modules)))
+
+    def load_order(
+        self, modules: typing.Optional[typing.Iterable[str]] = None
+    ) -> list[str]:
+        """Return modules sorted so that dependencies come first.
+
+        If `modules` is set, only these modules and their dependencies are
+        returned. Among modules of the same level, the order is alphabetical
+        so the result is stable.
+        Raise `DependencyCycleError` if the graph contains cycles.
+        """
+        if modules is None:
+            selected = (1 << len(self.modules)) - 1
+        else:
+            selected = self._mask(self.closure(modules))
+        cycles = [cycle for cycle in self.cycles() if selected & self._mask(cycle)]
+        if cycles:
+            raise DependencyCycleError(cycles)
+        remaining = {}
+        dependents = {}
+        for node in range(len(self.modules)):
+            if not selected >> node & 1:
+                continue
+            deps = self._names(self._depends[node])
+            remaining[node] = len(deps)
+            for dep in deps:
+                dependents.setdefault(self._index[dep], []).append(node)
+        # Heap ordered by node index, which follows the alphabetical order
+        heap = [node for node, count in remaining.items() if not count]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            node = heapq.heappop(heap)
+            order.append(self.modules[node])
+            for dependent in dependents.get(node, []):
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(heap, dependent)
+        return order
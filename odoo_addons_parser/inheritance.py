@@ -0,0 +1,313 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Resolve the effective fields and methods of models across modules.
+
+A model is the result of its definitions in all the installed modules,
+applied in the load order of the modules, on top of the models it inherits
+from (`_inherit` with another `_name`) and of the fields of the models it
+delegates to (`_inherits`). The successive definitions of a method are
+its override chain.
+
+All models are built on top of the ORM base classes (`BaseModel`, then
+`Model`, `TransientModel`... according to their type) when they are
+scanned (see `OdooParser`).
+"""
+
+import typing
+
+from .code import BASE_CLASSES
+from .graph import DependencyGraph
+
+# Module of the ORM base models in `OdooParser.to_dict()`, loaded first
+BASE_MODELS_KEY = "__odoo__"
+
+# Root of all the ORM base classes
+ROOT_BASE_CLASS = "BaseModel"
+
+
+def _as_list(value: typing.Union[str, list, None]) -> list:
+    if not value:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+class ModelResolver:
+    """Effective fields and methods of models, for a set of installed modules.
+
+    `datasets` are outputs of `RepositoryParser.to_dict()` or
+    `OdooParser.to_dict()` (when a module is available in several of them,
+    the first one wins). Modules are loaded in the order of their
+    dependencies, given by `graph` (built from the manifests by default).
+
+    Results are computed once per model and set of installed modules, then
+    returned from a cache: they must not be modified.
+
+    E.g:
+        >>> resolver = ModelResolver(OdooParser("./odoo").to_dict())
+        >>> fields = resolver.fields("sale.order", modules=["sale_stock"])
+        >>> fields["warehouse_id"]["module"]
+        'sale_stock'
+    """
+
+    def __init__(self, *datasets: dict, graph: typing.Optional[DependencyGraph] = None):
+        self.graph = graph or DependencyGraph.from_dict(*datasets)
+        self.modules = {}
+        for data in datasets:
+            for module, module_data in data.items():
+                self.modules.setdefault(module, module_data)
+        order = [module for module in self.graph.load_order() if module in self.modules]
+        if BASE_MODELS_KEY in self.modules:
+            order.insert(0, BASE_MODELS_KEY)
+        # Definitions of each model, in the load order of their modules
+        self._definitions = {}  # {model: [(module, model data)]}
+        self._base_classes = {}  # {class name: [(module, class data)]}
+        for module in order:
+            for model, model_data in self.modules[module].get("models", {}).items():
+                if not (model_data.get("name") or model_data.get("inherit")):
+                    if model in BASE_CLASSES:
+                        self._base_classes.setdefault(model, []).append(
+                            (module, model_data)
+                        )
+                    continue
+                self._definitions.setdefault(model, []).append((module, model_data))
+        self._all_modules = frozenset(self.modules)
+        self._closures = {}  # {frozenset(modules): installed modules}
+        self._cache = {}  # {(model, installed modules): resolved model}
+
+    def _installed(
+        self, modules: typing.Optional[typing.Iterable[str]]
+    ) -> frozenset[str]:
+        """Return the installed modules: `modules` and their dependencies."""
+        if modules is None:
+            return self._all_modules
+        key = frozenset([modules] if isinstance(modules, str) else modules)
+        if key not in self._closures:
+            installed = {
+                module
+                for module in self.graph.closure(key & set(self.graph.modules))
+                if module in self.modules
+            }
+            installed.update(module for module in key if module in self.modules)
+            if BASE_MODELS_KEY in self.modules:
+                installed.add(BASE_MODELS_KEY)
+            self._closures[key] = frozenset(installed)
+        return self._closures[key]
+
+    def models(
+        self, modules: typing.Optional[typing.Iterable[str]] = None
+    ) -> list[str]:
+        """Return the names of the models defined by the installed modules."""
+        installed = self._installed(modules)
+        return sorted(
+            model
+            for model, definitions in self._definitions.items()
+            if any(module in installed for module, __ in definitions)
+        )
+
+    def resolve(
+        self, model: str, modules: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Optional[dict]:
+        """Return the effective model once `modules` (all by default) are
+        installed, or None if they don't define it.
+
+        The result contains the `modules` defining or extending the model
+        (in load order), the models it inherits from (`inherit`) or
+        delegates to (`inherits`), and its `fields` and `methods`. Each
+        field and method gets the `module` defining it last and the
+        `modules` defining it (in load order); fields are merged with their
+        overrides (`kwargs` included), methods get their `overrides` (see
+        `OverrideIndex`). Fields of the models delegated to get their model
+        in `delegated`. Fields and methods of the ORM base classes come first.
+        """
+        return self._resolve(model, self._installed(modules), ())
+
+    def fields(
+        self, model: str, modules: typing.Optional[typing.Iterable[str]] = None
+    ) -> dict[str, dict]:
+        """Return the effective fields of a model, see `resolve()`."""
+        resolved = self.resolve(model, modules)
+        return resolved["fields"] if resolved else {}
+
+    def methods(
+        self, model: str, modules: typing.Optional[typing.Iterable[str]] = None
+    ) -> dict[str, dict]:
+        """Return the effective methods of a model, see `resolve()`."""
+        resolved = self.resolve(model, modules)
+        return resolved["methods"] if resolved else {}
+
+    def _resolve(
+        self, model: str, installed: frozenset[str], resolving: tuple[str, ...]
+    ) -> typing.Optional[dict]:
+        key = (model, installed)
+        if key in self._cache:
+            return self._cache[key]
+        definitions = [
+            (module, model_data)
+            for module, model_data in self._definitions.get(model, [])
+            if module in installed
+        ]
+        if not definitions:
+            return None
+        resolving += (model,)
+        parents, inherits = [], {}
+        for __, model_data in definitions:
+            for parent in _as_list(model_data.get("inherit")):
+                if parent != model and parent not in parents:
+                    parents.append(parent)
+            if isinstance(model_data.get("inherits"), dict):
+                inherits.update(model_data["inherits"])
+        fields, methods = {}, {}
+        for base_class in self._get_base_classes(definitions, installed):
+            for module, class_data in self._base_classes[base_class]:
+                if module in installed:
+                    self._apply(fields, methods, module, base_class, class_data)
+        # Models resolved within an inheritance cycle are incomplete
+        complete = True
+        # The first parent has the priority, as in the MRO of the model class
+        for parent in reversed(parents):
+            if parent in resolving:
+                complete = False
+                continue
+            resolved_parent = self._resolve(parent, installed, resolving)
+            if resolved_parent:
+                fields.update(resolved_parent["fields"])
+                methods.update(resolved_parent["methods"])
+        for module, model_data in definitions:
+            self._apply(fields, methods, module, model, model_data)
+        for parent in inherits:
+            if parent in resolving:
+                complete = False
+                continue
+            resolved_parent = self._resolve(parent, installed, resolving)
+            if not resolved_parent:
+                continue
+            for name, field in resolved_parent["fields"].items():
+                if name not in fields:
+                    fields[name] = dict(field, delegated=parent)
+        resolved = {
+            "name": model,
+            "modules": [module for module, __ in definitions],
+            "inherit": parents,
+            "inherits": inherits,
+            "fields": fields,
+            "methods": methods,
+        }
+        if complete:
+            self._cache[key] = resolved
+        return resolved
+
+    def _get_base_classes(
+        self, definitions: list[tuple[str, dict]], installed: frozenset[str]
+    ) -> list[str]:
+        """Return the ORM base classes of a model, from the root one."""
+        if not self._base_classes:
+            return []
+        current = next(
+            (
+                model_data["type"]
+                for __, model_data in definitions
+                if model_data.get("type") in BASE_CLASSES
+            ),
+            "Model",
+        )
+        # E.g. ['TransientModel', 'Model', 'AbstractModel']
+        classes = []
+        while current in BASE_CLASSES and current not in classes:
+            classes.append(current)
+            class_definitions = [
+                class_data
+                for module, class_data in self._base_classes.get(current, [])
+                if module in installed
+            ]
+            current = class_definitions[-1].get("type") if class_definitions else None
+        if ROOT_BASE_CLASS not in classes:
+            # E.g. 'AbstractModel = BaseModel'
+            classes.append(ROOT_BASE_CLASS)
+        return [name for name in reversed(classes) if name in self._base_classes]
+
+    def _apply(
+        self, fields: dict, methods: dict, module: str, model: str, model_data: dict
+    ):
+        """Apply a definition of `model` in `module` to its fields and methods."""
+        for name, field in model_data.get("fields", {}).items():
+            fields[name] = self._override(fields.get(name), field, module)
+        for name, method in model_data.get("methods", {}).items():
+            methods[name] = self._override_method(
+                methods.get(name), method, module, model, model_data
+            )
+
+    @staticmethod
+    def _override(previous: typing.Optional[dict], item: dict, module: str) -> dict:
+        """Return a field or method overridden by `item` in `module`."""
+        if previous is None:
+            return dict(item, module=module, modules=[module])
+        result = dict(previous)
+        result.update(item)
+        if "kwargs" in previous and "kwargs" in item:
+            result["kwargs"] = dict(previous["kwargs"], **item["kwargs"])
+        result.pop("delegated", None)
+        result["module"] = module
+        result["modules"] = [*previous["modules"], module]
+        return result
+
+    @staticmethod
+    def _override_method(
+        previous: typing.Optional[dict],
+        method: dict,
+        module: str,
+        model: str,
+        model_data: dict,
+    ) -> dict:
+        """Return a method overridden by `method` in `module`."""
+        override = {
+            "module": module,
+            "model": model,
+            "file_path": model_data.get("file_path"),
+            "lineno": method.get("lineno"),
+            "super": bool(method.get("super")),
+        }
+        return dict(
+            method,
+            module=module,
+            modules=[*previous["modules"], module] if previous else [module],
+            overrides=[*previous["overrides"], override] if previous else [override],
+        )
+
+
+class OverrideIndex:
+    """Override chains of the methods of all models, computed once.
+
+    The chain of a method lists its definitions, from the first one (e.g.
+    in `base`) to the last override (the first one called), including the
+    ones of the models it inherits from. Each one gives its `module`,
+    `model`, `file_path`, `lineno`, and whether it calls `super()`.
+
+    E.g:
+        >>> index = OverrideIndex(ModelResolver(OdooParser("./odoo").to_dict()))
+        >>> [(o["module"], o["super"]) for o in index.chain("res.partner", "write")]
+        [('base', False), ('mail', True), ('account', True), ...]
+    """
+
+    def __init__(
+        self,
+        resolver: ModelResolver,
+        modules: typing.Optional[typing.Iterable[str]] = None,
+    ):
+        self.chains = {}  # {(model, method): [override]}
+        for model in resolver.models(modules):
+            for name, method in resolver.methods(model, modules).items():
+                self.chains[model, name] = method["overrides"]
+
+    def chain(self, model: str, method: str) -> list[dict]:
+        """Return the override chain of a method (empty if unknown)."""
+        return self.chains.get((model, method), [])
+
+    def breaks(self, model: str, method: str) -> list[dict]:
+        """Return the overrides not calling `super()`, hiding the previous
+        definitions of the method.
+        """
+        return [
+            override
+            for override in self.chain(model, method)[1:]
+            if not override["super"]
+        ]
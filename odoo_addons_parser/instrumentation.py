@@ -0,0 +1,216 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Timings and counters of the different scan phases."""
+
+import os
+import time
+import typing
+
+# Phases recorded by the parsers
+PHASES = (
+    "module",  # Whole module scan
+    "walk",  # Listing of module files
+    "manifest",  # Reading of manifest files
+    "code_stats",  # pygount analysis
+    "py_file",  # Python files parsing (tree-sitter)
+    "py_file_skipped",  # Python files not parsed, without models (count only)
+    "xml_file",  # XML data files parsing
+    "csv_file",  # CSV data files parsing
+    "merge",  # Merge of files data into modules/repositories data
+)
+
+
+def _new_stats() -> dict:
+    return {"wall": 0.0, "cpu": 0.0, "count": 0, "bytes": 0}
+
+
+class _Phase:
+    """Context manager recording one occurrence of a phase."""
+
+    __slots__ = ("instrumentation", "name", "module", "bytes_", "wall", "cpu")
+
+    def __init__(self, instrumentation, name, module, bytes_):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.module = module
+        self.bytes_ = bytes_
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instrumentation.add(
+            self.name,
+            module=self.module,
+            wall=time.perf_counter() - self.wall,
+            cpu=time.process_time() - self.cpu,
+            bytes_=self.bytes_,
+        )
+        return False
+
+
+class _NullPhase:
+    """Context manager doing nothing, shared by all disabled phases."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Instrumentation:
+    """Collect wall/CPU time, bytes read and items count per phase and module.
+
+    Give an instance to the parsers (`instrumentation` parameter) to enable
+    it. Metrics are aggregated globally (`phases`) and per module
+    (`modules`), including those collected by workers processes.
+    `callback` is called with the module name and its metrics each time
+    a module scan is done.
+
+    E.g:
+        >>> instrumentation = Instrumentation()
+        >>> data = RepositoryParser("./server-tools", instrumentation=instrumentation).to_dict()
+        >>> instrumentation.phases["py_file"]
+        {'wall': 0.51, 'cpu': 0.49, 'count': 112, 'bytes': 623104}
+    """
+
+    enabled = True
+
+    def __init__(
+        self, callback: typing.Optional[typing.Callable[[str, dict], None]] = None
+    ):
+        self.callback = callback
+        self.phases = {}
+        self.modules = {}
+
+    def __reduce__(self):
+        # Sent to worker processes as a new empty instance: metrics collected
+        # there are sent back explicitly, and callbacks run in the main process
+        return (self.__class__, ())
+
+    def phase(
+        self,
+        name: str,
+        module: typing.Optional[str] = None,
+        path: typing.Optional[os.PathLike] = None,
+        bytes_: typing.Optional[int] = None,
+    ) -> _Phase:
+        """Return a context manager recording one occurrence of a phase.
+
+        `bytes_` is recorded as bytes read, or if not given the size of the
+        file at `path` (if set).
+        """
+        if bytes_ is None:
+            bytes_ = 0
+            if path is not None:
+                try:
+                    bytes_ = os.path.getsize(path)
+                except OSError:
+                    pass
+        return _Phase(self, name, module, bytes_)
+
+    def iter_phase(
+        self,
+        name: str,
+        iterable: typing.Iterable,
+        module: typing.Optional[str] = None,
+    ) -> typing.Iterator:
+        """Yield items of `iterable`, recording time spent to produce them."""
+        iterator = iter(iterable)
+        while True:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(
+                    name,
+                    module=module,
+                    wall=time.perf_counter() - wall,
+                    cpu=time.process_time() - cpu,
+                    count=0,
+                )
+                return
+            self.add(
+                name,
+                module=module,
+                wall=time.perf_counter() - wall,
+                cpu=time.process_time() - cpu,
+            )
+            yield item
+
+    def add(
+        self,
+        name: str,
+        module: typing.Optional[str] = None,
+        wall: float = 0.0,
+        cpu: float = 0.0,
+        count: int = 1,
+        bytes_: int = 0,
+    ):
+        """Record metrics of a phase."""
+        targets = [self.phases]
+        if module is not None:
+            targets.append(self.modules.setdefault(module, {}))
+        for phases in targets:
+            stats = phases.get(name)
+            if stats is None:
+                stats = phases[name] = _new_stats()
+            stats["wall"] += wall
+            stats["cpu"] += cpu
+            stats["count"] += count
+            stats["bytes"] += bytes_
+
+    def module_done(self, module: str):
+        """Notify the callback that metrics of `module` are complete."""
+        if self.callback:
+            self.callback(module, self.modules.get(module, {}))
+
+    def merge(self, metrics: dict):
+        """Merge metrics returned by `to_dict()` (e.g. from a worker process)."""
+        for name, stats in metrics.get("phases", {}).items():
+            target = self.phases.setdefault(name, _new_stats())
+            for key, value in stats.items():
+                target[key] += value
+        for module, phases in metrics.get("modules", {}).items():
+            module_phases = self.modules.setdefault(module, {})
+            for name, stats in phases.items():
+                target = module_phases.setdefault(name, _new_stats())
+                for key, value in stats.items():
+                    target[key] += value
+            self.module_done(module)
+
+    def to_dict(self) -> dict:
+        return {"phases": self.phases, "modules": self.modules}
+
+
+class NullInstrumentation(Instrumentation):
+    """Disabled instrumentation, used by default by the parsers."""
+
+    enabled = False
+
+    def phase(self, name, module=None, path=None, bytes_=None):
+        return _NULL_PHASE
+
+    def iter_phase(self, name, iterable, module=None):
+        return iterable
+
+    def add(self, name, module=None, wall=0.0, cpu=0.0, count=1, bytes_=0):
+        pass
+
+    def module_done(self, module):
+        pass
+
+    def merge(self, metrics):
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
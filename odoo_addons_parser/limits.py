@@ -0,0 +1,123 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Time and memory limits applied while scanning modules."""
+
+import contextlib
+import signal
+import threading
+import time
+import typing
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (Windows)
+    resource = None
+
+
+class ScanTimeoutError(BaseException):
+    """Exception raised when a time budget is exceeded.
+
+    Like `KeyboardInterrupt`, it doesn't inherit from `Exception` so it is not
+    swallowed by the parsers handling errors of files they can't parse.
+    """
+
+    def __init__(self, scope: str, seconds: float):
+        self.scope = scope
+        self.seconds = seconds
+        super().__init__(f"Time budget of {scope} exceeded ({seconds}s)")
+
+    def __reduce__(self):
+        return (self.__class__, (self.scope, self.seconds))
+
+
+class _Deadline:
+    __slots__ = ("time", "scope", "seconds", "expired")
+
+    def __init__(self, seconds: float, scope: str):
+        self.time = time.monotonic() + seconds
+        self.scope = scope
+        self.seconds = seconds
+        self.expired = False
+
+
+# Stack of active time limits
+_deadlines = []
+
+
+def _on_alarm(signum, frame):
+    now = time.monotonic()
+    # Raise for the outermost expired limit, so that a module budget is not
+    # handled as a file budget by the code catching the latter
+    for deadline in _deadlines:
+        if not deadline.expired and deadline.time <= now:
+            # Each limit raises only once
+            deadline.expired = True
+            _arm_timer()
+            raise ScanTimeoutError(deadline.scope, deadline.seconds)
+    _arm_timer()
+
+
+def _arm_timer():
+    deadlines = [deadline.time for deadline in _deadlines if not deadline.expired]
+    if not deadlines:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        return
+    # 0 would disarm the timer
+    signal.setitimer(
+        signal.ITIMER_REAL, max(min(deadlines) - time.monotonic(), 0.000001)
+    )
+
+
+def time_limits_available() -> bool:
+    """Return True if time limits can be enforced in the current thread."""
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+@contextlib.contextmanager
+def time_limit(seconds: typing.Optional[float], scope: str):
+    """Raise `ScanTimeoutError` if the block runs for more than `seconds`.
+
+    Limits rely on SIGALRM, so they are enforced only on Unix and in the
+    main thread (otherwise, or if `seconds` is not set, this does nothing).
+    They can be nested. Code running in C extensions (e.g. tree-sitter
+    parsing a file) is interrupted only once it gives back control to Python.
+    The previous SIGALRM handler is restored once the outermost limit ends.
+    """
+    if not seconds or not time_limits_available():
+        yield
+        return
+    outermost = not _deadlines
+    if outermost:
+        previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+    deadline = _Deadline(seconds, scope)
+    try:
+        _deadlines.append(deadline)
+        _arm_timer()
+        yield
+    finally:
+        if deadline in _deadlines:
+            _deadlines.remove(deadline)
+        _arm_timer()
+        if outermost:
+            # None if the handler was not installed from Python
+            signal.signal(
+                signal.SIGALRM,
+                signal.SIG_DFL if previous_handler is None else previous_handler,
+            )
+
+
+def set_memory_limit(limit: typing.Optional[int]):
+    """Limit the address space of the current process to `limit` bytes.
+
+    Allocations beyond it raise `MemoryError`. Does nothing if `limit` is
+    not set or on platforms without the `resource` module.
+    """
+    if not limit or resource is None:
+        return
+    __, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
@@ -0,0 +1,64 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import multiprocessing
+import os
+import pathlib
+import typing
+
+from .module import read_manifest
+from .repository import RepositoryParser
+
+
+def _read_module_manifest(module_path: pathlib.Path) -> dict:
+    return {"name": module_path.name, "manifest": read_manifest(module_path)}
+
+
+class ManifestParser:
+    """Parser reading only the manifests of modules of one or several addons paths.
+
+    Module folders are not walked, only `__manifest__.py` (or `__openerp__.py`)
+    files are read, which makes it suitable to inventory thousands of modules.
+    Data returned has the same structure as `RepositoryParser.to_dict()`
+    restricted to the `name` and `manifest` keys.
+    When a module is available in several addons paths, the first one wins.
+
+    E.g:
+        >>> data = ManifestParser(["./odoo/addons", "./server-tools"]).to_dict()
+        >>> data["server_environment"]["manifest"]["depends"]
+        ['base', 'base_sparse_field']
+    """
+
+    def __init__(
+        self,
+        folder_paths: typing.Union[
+            str, os.PathLike, typing.Iterable[typing.Union[str, os.PathLike]]
+        ],
+        workers: int = 0,
+    ):
+        if isinstance(folder_paths, (str, os.PathLike)):
+            folder_paths = [folder_paths]
+        self.folder_paths = [pathlib.Path(path).resolve() for path in folder_paths]
+        self.workers = workers
+
+    @property
+    def module_paths(self) -> list[pathlib.Path]:
+        module_paths = {}
+        for folder_path in self.folder_paths:
+            for module_path in RepositoryParser(folder_path).all_module_paths:
+                module_paths.setdefault(module_path.name, module_path)
+        return list(module_paths.values())
+
+    def to_dict(self) -> dict:
+        module_paths = self.module_paths
+        # Multiworkers
+        if self.workers:
+            chunksize = max(1, len(module_paths) // (self.workers * 4))
+            with multiprocessing.Pool(self.workers) as pool:
+                results = pool.map(
+                    _read_module_manifest, module_paths, chunksize=chunksize
+                )
+        # Monoprocess
+        else:
+            results = map(_read_module_manifest, module_paths)
+        return {module_data["name"]: module_data for module_data in results}
@@ -2,6 +2,8 @@
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 
 import ast
+import hashlib
+import io
 import logging
 import os
 import pathlib
@@ -9,9 +11,12 @@ import typing
 
 import pygount
 
+from . import treesitter_utils as ts_utils
 from .code import PyFile
 from .data_csv import CsvFile
 from .data_xml import XmlFile
+from .instrumentation import NULL_INSTRUMENTATION, Instrumentation
+from .limits import ScanTimeoutError, time_limit
 
 if typing.TYPE_CHECKING:
     from .repository import RepositoryParser
@@ -20,6 +25,101 @@ _logger = logging.getLogger(__name__)
 
 MANIFEST_FILES = ["__openerp__.py", "__manifest__.py"]
 
+# Folders never containing code or data
+ALWAYS_SKIPPED_DIRS = frozenset(["__pycache__"])
+# Files never counted as code by pygount (SVG files are XML, so kept)
+BINARY_EXTENSIONS = frozenset(
+    [
+        ".pyc",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".ico",
+        ".bmp",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+        ".mp3",
+        ".mp4",
+        ".ogg",
+        ".wav",
+        ".pdf",
+        ".zip",
+        ".gz",
+    ]
+)
+
+
+def get_manifest_path(
+    folder_path: typing.Union[str, os.PathLike],
+) -> typing.Optional[pathlib.Path]:
+    """Return the manifest file path of a module folder, if any."""
+    for manifest_name in MANIFEST_FILES:
+        manifest_path = pathlib.Path(folder_path, manifest_name)
+        if manifest_path.exists():
+            return manifest_path
+    return None
+
+
+def read_manifest(folder_path: typing.Union[str, os.PathLike]) -> dict:
+    """Read the manifest of a module folder without scanning the module."""
+    manifest_path = get_manifest_path(folder_path)
+    if not manifest_path:
+        return {}
+    with open(manifest_path) as file_:
+        return parse_manifest(file_.read())
+
+
+def parse_manifest(content: typing.Union[str, bytes]) -> dict:
+    """Evaluate the content of a manifest file, return {} if invalid."""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    try:
+        return ast.literal_eval(content)
+    except ValueError:
+        return {}
+
+
+# Byte order marks of text files (see `pygount.analysis.is_binary_file()`)
+TEXT_BOMS = (
+    b"\xfe\xff",
+    b"\xff\xfe",
+    b"\x00\x00\xfe\xff",
+    b"\xff\xfe\x00\x00",
+    b"\xef\xbb\xbf",
+)
+
+
+def analyze_source(
+    file_path: os.PathLike, group: str, content: typing.Optional[bytes] = None
+) -> pygount.SourceAnalysis:
+    """Count the lines of code of a file with pygount.
+
+    The file is read from disk, unless its `content` is given.
+    """
+    if content is None:
+        return pygount.SourceAnalysis.from_file(
+            file_path, group=group, encoding="utf-8"
+        )
+    # Checks done by pygount before reading a file, skipped with a file handle
+    source_path = str(file_path)
+    state = None
+    if not content:
+        state = pygount.SourceState.empty
+    elif b"\0" in content[:8192] and not content.startswith(TEXT_BOMS):
+        state = pygount.SourceState.binary
+    elif not pygount.analysis.has_lexer(source_path):
+        state = pygount.SourceState.unknown
+    if state is not None:
+        return pygount.SourceAnalysis.from_state(source_path, group, state)
+    return pygount.SourceAnalysis.from_file(
+        source_path, group=group, encoding="utf-8", file_handle=io.BytesIO(content)
+    )
+
 
 class ModuleParser:
     def __init__(
@@ -30,17 +130,29 @@ class ModuleParser:
         code_stats: bool = True,
         scan_models: bool = True,
         scan_data: bool = True,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        file_timeout: typing.Optional[float] = None,
+        cache: typing.Optional[typing.MutableMapping] = None,
+        hash_files: bool = False,
     ):
-        self.folder_path = pathlib.Path(folder_path).resolve()
-        if not self.folder_path.exists():
-            raise ValueError(f"'{folder_path}' doesn't exist")
-        if not self._get_manifest_path(self.folder_path):
-            raise ValueError(f"'{folder_path}' is not an Odoo module")
+        self.folder_path = self._get_folder_path(folder_path)
         self.languages = languages
         self.repo_parser = repo_parser
         self._code_stats = code_stats
         self._scan_models = scan_models
         self._scan_data = scan_data
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        # Files exceeding this time budget (in seconds) are skipped
+        self.file_timeout = file_timeout
+        self.skipped_files = []
+        # Results of files analysis, reused as long as files don't change
+        self.cache = cache
+        self.cache_keys = set()
+        # Identify files by their content (see `_get_file_key()`)
+        self.hash_files = hash_files
+        self._content = None  # (file path, content) of the last file read
+        # Parser reused for all Python files of the module
+        self._py_parser = ts_utils.get_parser()
         self.summary = pygount.ProjectSummary()
         self.code = {}
         self.models = {}
@@ -48,48 +160,101 @@ class ModuleParser:
         self.demo = {}
         self._run()
 
+    def _get_folder_path(self, folder_path) -> pathlib.Path:
+        """Return the path of the module folder, checking it is a module."""
+        module_path = pathlib.Path(folder_path).resolve()
+        if not module_path.exists():
+            raise ValueError(f"'{folder_path}' doesn't exist")
+        if not self._get_manifest_path(module_path):
+            raise ValueError(f"'{folder_path}' is not an Odoo module")
+        return module_path
+
     @staticmethod
     def _get_manifest_path(folder_path):
-        for manifest_name in MANIFEST_FILES:
-            manifest_path = pathlib.Path(folder_path, manifest_name)
-            if manifest_path.exists():
-                return manifest_path
+        return get_manifest_path(folder_path)
 
     @property
     def name(self) -> str:
         return self.folder_path.name
 
     @property
-    def file_paths(self) -> list[pathlib.Path]:
-        paths = []
-        for dirpath, _dirnames, filenames in os.walk(
-            self.folder_path, followlinks=False
-        ):
-            for f in filenames:
-                file_path = pathlib.Path(dirpath).joinpath(f)
-                if file_path.is_symlink():
+    def file_paths(self) -> typing.Iterator[pathlib.Path]:
+        """Yield paths of module files relevant for the enabled scans.
+
+        Folders and files that cannot contribute to any enabled scan are
+        pruned (e.g. `static/` when code stats are disabled).
+        Symbolic links are ignored.
+        """
+        skipped_dirs = set(ALWAYS_SKIPPED_DIRS)
+        extensions = None  # All files
+        if not self._code_stats:
+            skipped_dirs.add("static")
+            extensions = set()
+            if self._scan_models:
+                extensions.add(".py")
+            if self._scan_data:
+                extensions.update((".xml", ".csv"))
+                if not self._scan_models:
+                    skipped_dirs.add("tests")
+        yield from self._walk(self.folder_path, skipped_dirs, extensions)
+
+    @classmethod
+    def _walk(
+        cls,
+        dir_path: typing.Union[str, os.PathLike],
+        skipped_dirs: set,
+        extensions: typing.Optional[set],
+    ) -> typing.Iterator[pathlib.Path]:
+        # 'os.scandir' gives file types from the directory listing itself,
+        # sparing a 'stat' syscall per file
+        subdirs = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
                     continue
-                paths.append(file_path)
-        return paths
+                if entry.is_dir():
+                    if entry.name not in skipped_dirs:
+                        subdirs.append(entry.path)
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in BINARY_EXTENSIONS:
+                    continue
+                if extensions is not None and ext not in extensions:
+                    continue
+                yield pathlib.Path(entry.path)
+        for subdir in subdirs:
+            # Skipped folders (e.g. 'static', 'tests') are pruned only at the
+            # root of the module, apart from the ones always skipped
+            yield from cls._walk(subdir, ALWAYS_SKIPPED_DIRS, extensions)
 
     @property
     def manifest(self) -> dict:
-        manifest_path = self._get_manifest_path(self.folder_path)
-        with open(manifest_path) as file_:
-            try:
-                manifest = ast.literal_eval(file_.read())
-            except ValueError:
-                return {}
-            return manifest
+        return read_manifest(self.folder_path)
 
     def _run(self):
-        for file_path in self.file_paths:
-            if self._code_stats:
-                self._run_code_stats(file_path)
-            if self._scan_models and file_path.suffix == ".py":
-                self._run_scan_models(file_path)
-            if self._scan_data and file_path.suffix in [".xml", ".csv"]:
-                self._run_scan_data(file_path)
+        if not (self._code_stats or self._scan_models or self._scan_data):
+            # Nothing to collect apart from the manifest, skip the files walk
+            return
+        with self.instrumentation.phase("module", self.name):
+            self._run_files()
+        self.instrumentation.module_done(self.name)
+
+    def _run_files(self):
+        file_paths = self.instrumentation.iter_phase("walk", self.file_paths, self.name)
+        for file_path in file_paths:
+            try:
+                with time_limit(self.file_timeout, "file"):
+                    self._run_file(file_path)
+            except ScanTimeoutError as exc:
+                if exc.scope != "file":
+                    raise
+                _logger.warning(f"Skipping {file_path}: {exc}")
+                self.skipped_files.append(
+                    {
+                        "file_path": str(file_path.relative_to(self.folder_path)),
+                        "reason": str(exc),
+                    }
+                )
         if self._code_stats:
             summaries = dict.fromkeys(self.languages, 0)
             for summary in self.summary.language_to_language_summary_map.values():
@@ -99,13 +264,77 @@ class ModuleParser:
                     summaries[language] += summary.code_count
             self.code = summaries
 
-    def _run_code_stats(self, file_path: pathlib.Path):
+    def _run_file(self, file_path: pathlib.Path):
         try:
-            source_analysis = pygount.SourceAnalysis.from_file(
-                file_path,
-                group=self.folder_path.name,
-                encoding="utf-8",
+            if self._code_stats:
+                self._run_code_stats(file_path)
+            if self._scan_models and file_path.suffix == ".py":
+                self._run_scan_models(file_path)
+            if self._scan_data and file_path.suffix in [".xml", ".csv"]:
+                self._run_scan_data(file_path)
+        finally:
+            self._content = None
+
+    def _read_file(self, file_path: pathlib.Path) -> typing.Optional[bytes]:
+        """Return the content of a file to parse.
+
+        None means that parsers read the file from disk themselves.
+        """
+        if self.hash_files:
+            return self._read_content(file_path)
+        return None
+
+    def _read_content(self, file_path: pathlib.Path) -> bytes:
+        # Files are read once, to get both their hash and their data
+        if self._content is None or self._content[0] != file_path:
+            self._content = (file_path, file_path.read_bytes())
+        return self._content[1]
+
+    def _get_file_key(self, file_path: pathlib.Path) -> tuple:
+        """Return a key identifying the current content of a file.
+
+        It is the path and modification time of the file, or with
+        `hash_files` its path relative to the addons path and the hash of
+        its content (so results can be shared by several checkouts).
+        """
+        if self.hash_files:
+            content = self._read_content(file_path)
+            return (
+                str(file_path.relative_to(self.folder_path.parent)),
+                hashlib.blake2b(content, digest_size=16).digest(),
             )
+        stat = file_path.stat()
+        return (str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _file_phase(self, name: str, file_path: pathlib.Path):
+        """Return a context manager recording a phase run on a file."""
+        return self.instrumentation.phase(name, self.name, file_path)
+
+    def _cached(self, key: tuple, file_path: pathlib.Path, func: typing.Callable):
+        """Return the result of `func()` for a file, from the cache if possible.
+
+        `key` identifies the analysis done on the file, results are cached
+        per analysis and file content. Errors are not cached.
+        """
+        if self.cache is None:
+            return func()
+        key = key + self._get_file_key(file_path)
+        self.cache_keys.add(key)
+        try:
+            return self.cache[key]
+        except KeyError:
+            result = self.cache[key] = func()
+            return result
+
+    def _run_code_stats(self, file_path: pathlib.Path):
+        def analyze():
+            with self._file_phase("code_stats", file_path):
+                return analyze_source(
+                    file_path, self.folder_path.name, self._read_file(file_path)
+                )
+
+        try:
+            source_analysis = self._cached(("code_stats",), file_path, analyze)
         except Exception:
             _logger.warning(
                 f"Unable to analyze {file_path}", stack_info=True, exc_info=True
@@ -114,12 +343,29 @@ class ModuleParser:
             self.summary.add(source_analysis)
 
     def _run_scan_models(self, file_path: pathlib.Path):
+        def parse():
+            with self._file_phase("py_file", file_path):
+                pyfile = PyFile(
+                    file_path,
+                    module_path=self.folder_path,
+                    parser=self._py_parser,
+                    content=self._read_file(file_path),
+                )
+            # Files not parsed have no data
+            return pyfile.to_dict() if pyfile.parsed else None
+
         try:
-            pyfile = PyFile(file_path, module_path=self.folder_path)
+            data = self._cached(("py_file",), file_path, parse)
         except RuntimeError as exc:
             _logger.warning(str(exc))
             return
-        data = pyfile.to_dict()
+        if data is None:
+            self.instrumentation.add("py_file_skipped", self.name)
+            return
+        with self.instrumentation.phase("merge", self.name):
+            self._merge_models(data)
+
+    def _merge_models(self, data: dict):
         for model in data["models"].values():
             key = model.get("name") or model.get("inherit")
             if isinstance(key, list):
@@ -128,7 +374,12 @@ class ModuleParser:
                 # element as current model name
                 key = key[0]
             if key not in self.models:
-                self.models.setdefault(key, {}).update(model)
+                # Copy dicts updated by other files, `data` could be cached
+                model = dict(model)
+                for attr in ("fields", "methods"):
+                    if attr in model:
+                        model[attr] = dict(model[attr])
+                self.models[key] = model
             else:
                 if model.get("fields"):
                     self.models[key].setdefault("fields", {}).update(model["fields"])
@@ -144,7 +395,8 @@ class ModuleParser:
 
     def _run_scan_data(self, file_path: pathlib.Path):
         """Parse XML and CSV files and extract data records."""
-        manifest = self.manifest
+        with self.instrumentation.phase("manifest", self.name):
+            manifest = self.manifest
         data_paths = [pathlib.Path(path) for path in manifest.get("data", [])]
         demo_paths = [pathlib.Path(path) for path in manifest.get("demo", [])]
         try:
@@ -163,20 +415,39 @@ class ModuleParser:
                     loaded = True
                     demo = True
                 # Handle different file types
+                instrumentation = self.instrumentation
                 if file_path.suffix == ".xml":
-                    xml_file = XmlFile(self.folder_path, file_path, loaded=loaded)
-                    file_data = xml_file.to_dict()
+
+                    def parse():
+                        with self._file_phase("xml_file", file_path):
+                            return XmlFile(
+                                self.folder_path,
+                                file_path,
+                                loaded=loaded,
+                                content=self._read_file(file_path),
+                            ).to_dict()
+
                 elif file_path.suffix == ".csv":
-                    csv_file = CsvFile(self.folder_path, file_path, loaded=loaded)
-                    file_data = csv_file.to_dict()
+
+                    def parse():
+                        with self._file_phase("csv_file", file_path):
+                            return CsvFile(
+                                self.folder_path,
+                                file_path,
+                                loaded=loaded,
+                                content=self._read_file(file_path),
+                            ).to_dict()
+
                 else:
                     return
+                file_data = self._cached(("data_file", loaded), file_path, parse)
                 # Merge into self.data or self.demo structure
-                collection = self.demo if demo else self.data
-                for model_name, records in file_data.items():
-                    if model_name not in collection:
-                        collection[model_name] = []
-                    collection[model_name].extend(records)
+                with instrumentation.phase("merge", self.name):
+                    collection = self.demo if demo else self.data
+                    for model_name, records in file_data.items():
+                        if model_name not in collection:
+                            collection[model_name] = []
+                        collection[model_name].extend(records)
         except NotImplementedError:
             _logger.error(f"Unable to parse data file {file_path}")
             raise
@@ -197,4 +468,6 @@ class ModuleParser:
                 data["data"] = self.data
             if self.demo:
                 data["demo"] = self.demo
+        if self.skipped_files:
+            data["skipped_files"] = self.skipped_files
         return data
@@ -6,6 +6,8 @@ import pathlib
 import typing
 
 from .code import PyFile
+from .graph import DependencyGraph
+from .instrumentation import NULL_INSTRUMENTATION, Instrumentation
 from .repository import RepositoryParser
 
 
@@ -33,6 +35,16 @@ class OdooParser:
     In case `base_models_key` is set with an existing module name (e.g. `base`)
     the ORM data will be merged into that one.
 
+    If `modules` is set, only these modules and their dependencies (resolved
+    across all addons paths) are scanned.
+
+    `callback` is called with the events emitted while scanning modules,
+    see `RepositoryParser.iter_events()`.
+
+    `costs` (`{module: seconds}`, e.g. the `timings` of the repositories
+    of a previous scan) is used to dispatch the most expensive modules
+    first to the workers, see `RepositoryParser`. So is `hash_files`.
+
     E.g:
         >>> data = OdooParser("./odoo/odoo", code_stats=False).to_dict()
         >>> list(data["__odoo__"]["models"])
@@ -55,8 +67,13 @@ class OdooParser:
         ),
         base_models_paths: tuple[os.PathLike, ...] = ODOO_BASE_MODELS_PATHS,
         base_models_key: str = "__odoo__",
+        modules: typing.Optional[typing.Iterable[str]] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        callback: typing.Optional[typing.Callable[[dict], None]] = None,
+        costs: typing.Optional[typing.Mapping[str, float]] = None,
+        hash_files: bool = False,
     ):
-        self.folder_path = pathlib.Path(folder_path).resolve()
+        self.folder_path = self._get_folder_path(folder_path)
         self.languages = languages
         self.name = self.folder_path.name if name is None else name
         self.workers = workers
@@ -66,39 +83,69 @@ class OdooParser:
         self._base_models_paths = []
         for base_models_path in base_models_paths:
             # Keep only existing base models file paths
-            if self.folder_path.joinpath(base_models_path).exists():
+            if self._exists(base_models_path):
                 self._base_models_paths.append(pathlib.Path(base_models_path))
         self._base_models_key = base_models_key
+        self.modules = tuple(modules) if modules is not None else None
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        self.callback = callback
+        self.costs = costs
+        self.hash_files = hash_files
         self.base_models = []
         self.repositories = []
         self._run()
 
+    def _get_folder_path(self, folder_path) -> pathlib.Path:
+        return pathlib.Path(folder_path).resolve()
+
+    def _exists(self, path: os.PathLike) -> bool:
+        """Return True if `path` (relative to the repository) exists."""
+        return self.folder_path.joinpath(path).exists()
+
+    def _parse_base_models(self) -> typing.Iterator[PyFile]:
+        return PyFile.parse_files(
+            [self.folder_path.joinpath(path) for path in self._base_models_paths],
+            module_path=self.folder_path,
+        )
+
+    def _get_repository_parser(self, addons_path: os.PathLike) -> RepositoryParser:
+        return RepositoryParser(
+            self.folder_path.joinpath(addons_path),
+            languages=self.languages,
+            name=str(addons_path),
+            workers=self.workers,
+            code_stats=self._code_stats,
+            scan_models=self._scan_models,
+            instrumentation=self.instrumentation,
+            callback=self.callback,
+            costs=self.costs,
+            hash_files=self.hash_files,
+        )
+
     def _run(self):
         # Scan base models
-        for base_models_path in self._base_models_paths:
-            base_models_path = self.folder_path.joinpath(base_models_path)
-            self.base_models.append(
-                PyFile(base_models_path, module_path=self.folder_path)
+        self.base_models.extend(
+            self.instrumentation.iter_phase(
+                "py_file", self._parse_base_models(), module=self._base_models_key
             )
+        )
         # Scan addons paths
         for addons_path in self._addons_paths:
-            full_addons_path = self.folder_path.joinpath(addons_path)
-            if not full_addons_path.exists():
+            if not self._exists(addons_path):
                 continue
-            self.repositories.append(
-                RepositoryParser(
-                    full_addons_path,
-                    languages=self.languages,
-                    name=str(addons_path),
-                    workers=self.workers,
-                    code_stats=self._code_stats,
-                    scan_models=self._scan_models,
-                )
-            )
+            self.repositories.append(self._get_repository_parser(addons_path))
+        if self.modules is not None:
+            # Resolve dependencies across all addons paths by reading manifests,
+            # once: repositories don't resolve them again
+            graph = DependencyGraph.from_parsers(*self.repositories)
+            roots = [module for module in self.modules if module in graph]
+            closure = graph.closure(roots)
+            for repo in self.repositories:
+                repo.select(closure)
 
-    def to_dict(self) -> dict:
+    def base_models_to_dict(self) -> dict:
+        """Return data of the ORM base models, by `base_models_key`."""
         data = {}
-        # Base models
         for base_models in self.base_models:
             # Put these data in a special module name '__odoo__'
             data.setdefault(self._base_models_key, {})
@@ -110,11 +157,13 @@ class OdooParser:
                     data[self._base_models_key][key].update(base_data[key])
                 else:
                     data[self._base_models_key][key] = base_data[key]
-        # Addons paths
-        for repo in self.repositories:
-            repo_data = repo.to_dict()
-            # In case 'base_models_key' was set with an existing module name
-            # we need to merge both dataset
+        return data
+
+    def _merge_repository_data(self, data: dict, repo_data: dict):
+        """Merge the data of a repository into `data`."""
+        # In case 'base_models_key' was set with an existing module name
+        # we need to merge both dataset
+        with self.instrumentation.phase("merge"):
             for module_name, module_data in repo_data.items():
                 data.setdefault(module_name, {})
                 # NOTE: only key to merge is 'models' currently
@@ -124,6 +173,11 @@ class OdooParser:
                         data[module_name][key].update(module_data[key])
                         continue
                     data[module_name][key] = module_data[key]
-            else:
-                data[module_name] = module_data
+
+    def to_dict(self) -> dict:
+        # Base models
+        data = self.base_models_to_dict()
+        # Addons paths
+        for repo in self.repositories:
+            self._merge_repository_data(data, repo.to_dict())
         return data
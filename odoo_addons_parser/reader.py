@@ -0,0 +1,77 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Read files through memory mappings."""
+
+import mmap
+import os
+import typing
+
+
+class Buffer:
+    """Content of a file, sliced on demand.
+
+    Content is sliced by full lines around bytes offsets (e.g. from
+    tree-sitter nodes), without splitting the whole content in lines.
+    """
+
+    def __init__(self, buffer: typing.Union[bytes, mmap.mmap]):
+        self.buffer = buffer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        pass
+
+    def get_lines_span(self, start: int, end: int) -> tuple[int, int]:
+        """Return the offsets of the full lines containing bytes `start` to `end`.
+
+        The last line break is not included.
+        """
+        buffer = self.buffer
+        start = buffer.rfind(b"\n", 0, start) + 1
+        end = buffer.find(b"\n", end)
+        if end == -1:
+            end = len(buffer)
+        return start, end
+
+    def get_lines_at(self, start: int, end: int) -> str:
+        """Return the text of the full lines containing bytes `start` to `end`.
+
+        The last line break is not included.
+        """
+        start, end = self.get_lines_span(start, end)
+        return self.buffer[start:end].decode("utf-8")
+
+
+class MappedFile(Buffer):
+    """Read-only memory mapping of a file.
+
+    The content (`buffer`) is paged in by the OS on access instead of being
+    copied in memory, so it can be given as is to tree-sitter and sliced on
+    demand (see `Buffer`).
+    Use it as a context manager, the buffer is not available once closed.
+
+    E.g:
+        >>> with MappedFile("models/res_partner.py") as file_:
+        ...     file_.get_lines_at(0, 1)
+        '# Copyright ...'
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        self.path = path
+        with open(path, "rb") as file_:
+            if os.fstat(file_.fileno()).st_size:
+                buffer = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Empty files can't be mapped
+                buffer = b""
+        super().__init__(buffer)
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
@@ -1,15 +1,84 @@
 # Copyright 2023 Sebastien Alix <https://github.com/sebalix>
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 
+import functools
+import logging
 import multiprocessing
 import os
 import pathlib
+import pickle
+import queue
+import signal
+import time
+import traceback
 import typing
 
-from .module import ModuleParser
+from .graph import DependencyGraph
+from .instrumentation import NULL_INSTRUMENTATION, Instrumentation
+from .limits import ScanTimeoutError, set_memory_limit, time_limit
+from .module import ModuleParser, read_manifest
+from .scheduling import estimate_module_cost, module_files_stats, sort_by_cost
+
+_logger = logging.getLogger(__name__)
+
+# Events emitted while scanning modules
+MODULE_STARTED = "module_started"
+MODULE_FINISHED = "module_finished"
+MODULE_FAILED = "module_failed"
+
+# Queue used by worker processes to send events to the main process
+_worker_events = None
+
+
+# Extra time given to a worker before being killed once it exceeded its
+# module time budget (e.g. stuck in C code not interruptible by signals)
+KILL_GRACE_TIME = 10
+
+
+def _init_worker(events_queue, memory_limit):
+    global _worker_events
+    _worker_events = events_queue
+    set_memory_limit(memory_limit)
 
 
 class RepositoryParser:
+    """Parser of a folder containing Odoo modules (an addons path).
+
+    If `modules` is set, only these modules and their dependencies
+    available in the repository are scanned. Manifests are read first to
+    resolve the dependencies, then only the selected modules are parsed.
+    To resolve dependencies across several repositories, compute the closure
+    with `DependencyGraph.from_parsers(...).closure(modules)` and give it to
+    `select()` of each of them.
+
+    Progress can be followed with `callback`, called with each event
+    emitted while scanning (see `iter_events()`). A module failing to be
+    scanned doesn't abort the whole scan: its data is replaced by an
+    `error` entry.
+
+    Time budgets can be set per file (`file_timeout`, the file is skipped)
+    and per module (`module_timeout`, the module is scanned again without
+    code stats, then fails if it is still too slow). They are enforced with
+    SIGALRM, so on Unix only, in worker processes or in the main thread.
+    In worker mode, `worker_memory_limit` caps the memory (in bytes) of each
+    worker, and `max_tasks_per_worker` recycles workers regularly. A worker
+    interrupted by a limit can't be trusted anymore (memory fragmentation,
+    interrupted C code...), so with limits set, workers scan one module
+    each unless `max_tasks_per_worker` is given. Workers still running after
+    twice the module budget (e.g. stuck in C code) are killed.
+
+    In worker mode, modules are dispatched one by one to the first idle
+    worker, the most expensive ones first so that a few big modules don't
+    delay the end of the scan. Their cost is estimated from the number and
+    size of their files, or taken from `costs` (`{module: seconds}`, e.g.
+    the `timings` of a previous scan) when available. Set `schedule` to
+    False to dispatch them in alphabetical order.
+
+    With `hash_files`, files results cached by modules (see
+    `ModuleParser.cache`) are identified by the content of files instead of
+    their modification time, so they can be shared between checkouts.
+    """
+
     def __init__(
         self,
         folder_path: typing.Union[str, os.PathLike],
@@ -18,43 +87,346 @@ class RepositoryParser:
         workers: int = 0,
         code_stats: bool = True,
         scan_models: bool = True,
+        modules: typing.Optional[typing.Iterable[str]] = None,
+        instrumentation: typing.Optional[Instrumentation] = None,
+        callback: typing.Optional[typing.Callable[[dict], None]] = None,
+        file_timeout: typing.Optional[float] = None,
+        module_timeout: typing.Optional[float] = None,
+        worker_memory_limit: typing.Optional[int] = None,
+        max_tasks_per_worker: typing.Optional[int] = None,
+        schedule: bool = True,
+        costs: typing.Optional[typing.Mapping[str, float]] = None,
+        hash_files: bool = False,
     ):
-        self.folder_path = pathlib.Path(folder_path).resolve()
+        self.folder_path = self._get_folder_path(folder_path)
         self.languages = languages
         self.name = self.folder_path.name if name is None else name
         self.workers = workers
         self._code_stats = code_stats
         self._scan_models = scan_models
+        self.modules = tuple(modules) if modules is not None else None
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        self.callback = callback
+        self.file_timeout = file_timeout
+        self.module_timeout = module_timeout
+        self.worker_memory_limit = worker_memory_limit
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.schedule = schedule
+        self.costs = dict(costs or {})
+        # Scan duration of each module, to give as `costs` to the next scan
+        self.timings = {}
+        self.hash_files = hash_files
+
+    def _get_folder_path(self, folder_path) -> pathlib.Path:
+        return pathlib.Path(folder_path).resolve()
+
+    def __getstate__(self):
+        # Callbacks are run in the main process only (and could be lambdas)
+        state = self.__dict__.copy()
+        state["callback"] = None
+        return state
 
     @property
-    def module_paths(self) -> list[os.PathLike]:
+    def all_module_paths(self) -> list[os.PathLike]:
         return sorted(
             set(map(lambda fp: fp.parent, self.folder_path.glob("*/__manifest__.py")))
             | set(map(lambda fp: fp.parent, self.folder_path.glob("*/__openerp__.py")))
         )
 
-    def _scan_module(self, module_path):
-        parser = ModuleParser(
+    @property
+    def module_paths(self) -> list[os.PathLike]:
+        module_paths = self.all_module_paths
+        if self.modules is None:
+            return module_paths
+        return [path for path in module_paths if path.name in self._selected_modules]
+
+    def is_selected(self, module: str) -> bool:
+        """Return True if `module` is one of `modules` or their dependencies
+        (always True if `modules` is not set).
+        """
+        return self.modules is None or module in self._selected_modules
+
+    def select(self, modules: typing.Iterable[str]):
+        """Scan only `modules`, their dependencies being already resolved
+        (e.g. across several repositories, see `OdooParser`).
+        """
+        self.modules = tuple(modules)
+        self.__dict__["_selected_modules"] = frozenset(self.modules)
+
+    def reset_selection(self):
+        """Resolve again the dependencies of `modules` on next use, e.g.
+        once a manifest changed.
+        """
+        self.__dict__.pop("_selected_modules", None)
+
+    @functools.cached_property
+    def _selected_modules(self) -> frozenset:
+        """Return `modules` and their dependencies available in the repository."""
+        manifests = {
+            path.name: self.read_manifest(path) for path in self.all_module_paths
+        }
+        graph = DependencyGraph.from_manifests(manifests)
+        # Modules not available here could be found in other repositories
+        roots = [module for module in self.modules if module in manifests]
+        return frozenset(graph.closure(roots)) & frozenset(manifests)
+
+    def read_manifest(self, module_path: os.PathLike) -> dict:
+        """Return the manifest of a module of the repository."""
+        return read_manifest(module_path)
+
+    def _module_files_stats(self, module_path: os.PathLike) -> dict[str, list[int]]:
+        return module_files_stats(module_path)
+
+    def module_costs(
+        self, module_paths: typing.Optional[list[os.PathLike]] = None
+    ) -> dict[str, float]:
+        """Return the (estimated) scan cost in seconds of each module.
+
+        Costs given with `costs` are used as is, others are estimated
+        from a listing of the module files.
+        """
+        if module_paths is None:
+            module_paths = self.module_paths
+        costs = {}
+        for module_path in module_paths:
+            cost = self.costs.get(module_path.name)
+            if cost is None:
+                cost = estimate_module_cost(
+                    module_path,
+                    stats=self._module_files_stats(module_path),
+                    code_stats=self._code_stats,
+                    scan_models=self._scan_models,
+                )
+            costs[module_path.name] = cost
+        return costs
+
+    def get_module_parser(
+        self, module_path, instrumentation=None, code_stats=None, cache=None
+    ) -> ModuleParser:
+        """Return the parser of a module of the repository, with its options.
+
+        `code_stats` overrides the option of the repository, and `cache`
+        is the cache of files results of the module (see `ModuleParser`).
+        """
+        return ModuleParser(
             module_path,
             languages=self.languages,
             repo_parser=self,
-            code_stats=self._code_stats,
+            code_stats=self._code_stats if code_stats is None else code_stats,
             scan_models=self._scan_models,
+            instrumentation=instrumentation or self.instrumentation,
+            file_timeout=self.file_timeout,
+            cache=cache,
+            hash_files=self.hash_files,
+        )
+
+    def _scan_module(
+        self, module_path, instrumentation=None, code_stats=None, cache=None
+    ):
+        parser = self.get_module_parser(
+            module_path, instrumentation, code_stats, cache=cache
         )
         return parser.to_dict()
 
+    def _scan_module_limited(self, module_path, instrumentation=None, cache=None):
+        """Scan a module within its time budget.
+
+        If the budget is exceeded, the module is scanned again in a degraded
+        mode (without code stats, usually the most expensive part).
+        """
+        try:
+            with time_limit(self.module_timeout, "module"):
+                return self._scan_module(module_path, instrumentation, cache=cache)
+        except ScanTimeoutError as exc:
+            if not self._code_stats:
+                raise
+            reason = str(exc)
+        _logger.warning(f"{module_path.name}: {reason}, retrying without code stats")
+        with time_limit(self.module_timeout, "module"):
+            module_data = self._scan_module(
+                module_path, instrumentation, code_stats=False, cache=cache
+            )
+        module_data["degraded"] = {"reason": reason, "disabled": ["code_stats"]}
+        return module_data
+
+    def _iter_module_events(self, module_path, instrumentation=None, cache=None):
+        """Scan a module and yield the related events."""
+        event = {"repository": self.name, "module": module_path.name}
+        yield dict(event, event=MODULE_STARTED, time=time.time())
+        start = time.perf_counter()
+        try:
+            module_data = self._scan_module_limited(
+                module_path, instrumentation, cache=cache
+            )
+        except (Exception, ScanTimeoutError) as exc:
+            yield dict(
+                event,
+                event=MODULE_FAILED,
+                time=time.time(),
+                wall=time.perf_counter() - start,
+                error="".join(traceback.format_exception(*_exc_info(exc))),
+                exception=exc,
+            )
+        else:
+            yield dict(
+                event,
+                event=MODULE_FINISHED,
+                time=time.time(),
+                wall=time.perf_counter() - start,
+                data=module_data,
+            )
+
+    def _scan_module_worker(self, module_path):
+        """Scan a module in a worker process, sending events to the main process.
+
+        Metrics are collected per module and sent along the last event,
+        to be merged in the main process.
+        """
+        instrumentation = None
+        if self.instrumentation.enabled:
+            instrumentation = Instrumentation()
+        for event in self._iter_module_events(module_path, instrumentation):
+            event["pid"] = os.getpid()
+            if event["event"] == MODULE_FAILED:
+                event["exception"] = _picklable_exception(event["exception"])
+            if instrumentation and event["event"] != MODULE_STARTED:
+                event["metrics"] = instrumentation.to_dict()
+            _worker_events.put(event)
+
+    def _get_max_tasks_per_worker(self) -> typing.Optional[int]:
+        """Return the number of modules scanned by a worker before being replaced."""
+        if self.max_tasks_per_worker is not None:
+            return self.max_tasks_per_worker
+        limits = (self.file_timeout, self.module_timeout, self.worker_memory_limit)
+        # A pool can't replace a worker on demand once a limit interrupted it
+        return 1 if any(limits) else None
+
+    def _iter_events_workers(self, module_paths):
+        events_queue = multiprocessing.Queue()
+        with multiprocessing.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(events_queue, self.worker_memory_limit),
+            maxtasksperchild=self._get_max_tasks_per_worker(),
+        ) as pool:
+            result = pool.map_async(self._scan_module_worker, module_paths, chunksize=1)
+            pending = {module_path.name for module_path in module_paths}
+            running = {}  # {module: (pid, start_time)}
+            while pending:
+                try:
+                    event = events_queue.get(timeout=1)
+                except queue.Empty:
+                    if result.ready():
+                        # Re-raise errors occurring outside module scans
+                        result.get()
+                    yield from self._kill_stuck_workers(running, pending)
+                    continue
+                module = event["module"]
+                if module not in pending:
+                    # Module already reported as failed (worker killed)
+                    continue
+                if event["event"] == MODULE_STARTED:
+                    running[module] = (event["pid"], time.monotonic())
+                else:
+                    pending.discard(module)
+                    running.pop(module, None)
+                    metrics = event.pop("metrics", None)
+                    if metrics:
+                        self.instrumentation.merge(metrics)
+                yield event
+
+    def _kill_stuck_workers(self, running, pending):
+        """Kill workers exceeding their module time budget, yield related events."""
+        if not self.module_timeout:
+            return
+        # Degraded mode could take another module budget
+        max_duration = self.module_timeout * 2 + KILL_GRACE_TIME
+        now = time.monotonic()
+        for module, (pid, start) in list(running.items()):
+            if now - start < max_duration:
+                continue
+            _logger.error(f"{module}: killing worker {pid} after {now - start:.0f}s")
+            try:
+                os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except OSError:
+                pass
+            del running[module]
+            pending.discard(module)
+            exc = ScanTimeoutError("module", self.module_timeout)
+            yield {
+                "repository": self.name,
+                "module": module,
+                "event": MODULE_FAILED,
+                "time": time.time(),
+                "wall": now - start,
+                "error": f"Worker killed: {exc}",
+                "exception": exc,
+                "pid": pid,
+            }
+
+    def iter_events(self) -> typing.Iterator[dict]:
+        """Scan modules and yield events as soon as they happen.
+
+        Each event is a dictionary with the keys `event`, `repository`,
+        `module` and `time`. Events are:
+            - `module_started`
+            - `module_finished`, with the scan duration (`wall`) and the
+              module data (`data`)
+            - `module_failed`, with the scan duration (`wall`), the exception
+              (`exception`) and its traceback (`error`)
+        Stopping the iteration stops the scan (workers are terminated).
+        """
+        module_paths = self.module_paths
+        if self.workers:
+            if self.schedule:
+                module_paths = sort_by_cost(
+                    module_paths, self.module_costs(module_paths)
+                )
+            events = self._iter_events_workers(module_paths)
+        else:
+            events = (
+                event
+                for module_path in module_paths
+                for event in self._iter_module_events(module_path)
+            )
+        try:
+            for event in events:
+                if event["event"] in (MODULE_FINISHED, MODULE_FAILED):
+                    self.timings[event["module"]] = event["wall"]
+                yield event
+        finally:
+            # Stop the workers as soon as the iteration is stopped
+            events.close()
+
+    @staticmethod
+    def _get_event_data(event: dict) -> typing.Optional[dict]:
+        """Return the module data of a finished or failed module event."""
+        if event["event"] == MODULE_FINISHED:
+            return event["data"]
+        if event["event"] == MODULE_FAILED:
+            return {"name": event["module"], "error": event["error"]}
+        return None
+
     def to_dict(self) -> dict:
         data = {}
-        # Multiworkers
-        if self.workers:
-            with multiprocessing.Pool(self.workers) as pool:
-                results = pool.map(self._scan_module, self.module_paths)
+        for event in self.iter_events():
+            if self.callback:
+                self.callback(event)
+            module_data = self._get_event_data(event)
+            if module_data is not None:
+                data[event["module"]] = module_data
+        # Workers return modules in completion order
+        return dict(sorted(data.items()))
 
-            for module_data in results:
-                data[module_data["name"]] = module_data
-        # Monoprocess
-        else:
-            for module_path in self.module_paths:
-                module = module_path.name
-                data[module] = self._scan_module(module_path)
-        return data
+
+def _exc_info(exc: BaseException) -> tuple:
+    return type(exc), exc, exc.__traceback__
+
+
+def _picklable_exception(exc: Exception) -> Exception:
+    """Return `exc` if it can be sent to another process, a copy otherwise."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
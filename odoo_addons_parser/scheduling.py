@@ -0,0 +1,92 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Estimate the scan cost of modules to dispatch the biggest ones first."""
+
+import os
+import typing
+
+from .module import ALWAYS_SKIPPED_DIRS, BINARY_EXTENSIONS
+
+# Rough scan cost of each file and of each byte read, in seconds, measured
+# with the benchmarks. Only their ratios matter to sort modules.
+COST_PER_FILE = 0.0002
+COST_PER_BYTE = {
+    "code_stats": 0.0000017,  # pygount, all files
+    ".py": 0.0000008,  # tree-sitter
+    ".xml": 0.0000001,
+    ".csv": 0.00000008,
+}
+
+
+def module_files_stats(
+    module_path: typing.Union[str, os.PathLike],
+) -> dict[str, list[int]]:
+    """Return the number of files and their total size per file extension.
+
+    Only directory listings and `stat` calls are done, files are not read.
+    """
+    stats = {}
+    dir_paths = [module_path]
+    while dir_paths:
+        with os.scandir(dir_paths.pop()) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if entry.name not in ALWAYS_SKIPPED_DIRS:
+                        dir_paths.append(entry.path)
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in BINARY_EXTENSIONS:
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                ext_stats = stats.setdefault(ext, [0, 0])
+                ext_stats[0] += 1
+                ext_stats[1] += size
+    return stats
+
+
+def estimate_module_cost(
+    module_path: typing.Union[str, os.PathLike],
+    code_stats: bool = True,
+    scan_models: bool = True,
+    scan_data: bool = True,
+    stats: typing.Optional[dict[str, list[int]]] = None,
+) -> float:
+    """Return the estimated scan duration of a module (in seconds).
+
+    The estimation is based on the number and size of its files, according
+    to the enabled scans. `stats` are the files stats of the module (see
+    `module_files_stats()`), read from `module_path` if not given.
+    """
+    if stats is None:
+        stats = module_files_stats(module_path)
+    cost = 0.0
+    for ext, (count, size) in stats.items():
+        scanned = code_stats
+        if code_stats:
+            cost += size * COST_PER_BYTE["code_stats"]
+        if scan_models and ext == ".py" or scan_data and ext in (".xml", ".csv"):
+            scanned = True
+            cost += size * COST_PER_BYTE[ext]
+        if scanned:
+            cost += count * COST_PER_FILE
+    return cost
+
+
+def sort_by_cost(
+    module_paths: typing.Iterable[os.PathLike],
+    costs: typing.Mapping[str, float],
+) -> list[os.PathLike]:
+    """Return `module_paths` sorted by decreasing cost, then by name.
+
+    `costs` is a `{module_name: cost}` mapping covering all the modules (see
+    `RepositoryParser.module_costs()`).
+    """
+    return sorted(
+        module_paths,
+        key=lambda module_path: (-costs[module_path.name], module_path.name),
+    )
@@ -0,0 +1,243 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Search the code of fields, methods and views through a trigram index.
+
+Each piece of code (a document) is split into its trigrams (substrings of
+3 characters), and the index maps each trigram to the documents containing
+it. A substring is only looked for in the documents containing all of its
+trigrams, and a regular expression in the documents containing all the
+trigrams of its literal parts.
+
+E.g:
+    >>> index = CodeIndex()
+    >>> data = RepositoryParser("./server-tools", callback=index.add_event).to_dict()
+    >>> [(doc["module"], doc["name"]) for doc in index.search("_compute_amount")]
+    >>> index.search_regex(r"tracking=(True|1)", kinds=("field",))
+    >>> index.save("server-tools.idx")
+"""
+
+import array
+import json
+import os
+import re
+import sys
+import typing
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from .repository import MODULE_FINISHED
+
+# Kinds of documents
+FIELD = "field"
+METHOD = "method"
+VIEW = "view"
+
+# Header of index files, followed by the size of their JSON part
+MAGIC = b"OAPIDX1\n"
+
+# Postings are stored as unsigned 32 bits integers, little-endian
+_POSTING_TYPE = "I"
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _literals(parsed) -> list[str]:
+    """Return the literal strings any match of a parsed regex contains."""
+    literals, current = [], []
+    for op, value in parsed:
+        if op == sre_parse.LITERAL:
+            current.append(chr(value))
+            continue
+        literals.append("".join(current))
+        current = []
+        if op == sre_parse.SUBPATTERN:
+            # (group, add_flags, del_flags, pattern) since Python 3.6
+            if not value[1] & re.IGNORECASE:
+                literals.extend(_literals(value[-1]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and value[0] >= 1:
+            # At least one occurrence of the repeated pattern
+            literals.extend(_literals(value[2]))
+    literals.append("".join(current))
+    return [literal for literal in literals if len(literal) >= 3]
+
+
+class CodeIndex:
+    """Trigram index of the code of fields, methods and views.
+
+    Documents are added module by module, from the data of a scan
+    (`add_module()`, `add_scan()`) or while scanning (`add_event()` as the
+    `callback` of a parser). The index is saved to a file with `save()`,
+    and loaded back with `load()`.
+    """
+
+    def __init__(self):
+        # [(kind, module, model, name, code)]
+        self.documents = []
+        # {trigram: array of document indexes}, read from `_data` after `load()`
+        self._postings = {}
+        self._offsets = {}  # {trigram: (offset, count)}
+        self._data = None
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, kind: str, module: str, model: str, name: str, code: str):
+        """Add the code of a field, method or view to the index."""
+        doc_id = len(self.documents)
+        self.documents.append((kind, module, model, name, code))
+        for trigram in _trigrams(code):
+            postings = self._get_postings(trigram)
+            if postings is None:
+                postings = self._postings[trigram] = array.array(_POSTING_TYPE)
+            postings.append(doc_id)
+
+    def add_module(self, module: str, module_data: dict, views: bool = True):
+        """Add the fields, methods (and views) of the data of a module."""
+        for model, model_data in module_data.get("models", {}).items():
+            for kind, key in ((FIELD, "fields"), (METHOD, "methods")):
+                for name, item in model_data.get(key, {}).items():
+                    if item.get("code"):
+                        self.add(kind, module, model, name, item["code"])
+        if not views:
+            return
+        for records_key in ("data", "demo"):
+            for record in module_data.get(records_key, {}).get("ir.ui.view", []):
+                arch = record.get("data", {}).get("arch")
+                if arch:
+                    model = record.get("target_model") or record["data"].get("model")
+                    self.add(VIEW, module, model or "", record.get("id") or "", arch)
+
+    def add_scan(self, data: dict, views: bool = True):
+        """Add all the modules of a scan (output of `to_dict()`)."""
+        for module, module_data in data.items():
+            self.add_module(module, module_data, views=views)
+
+    def add_event(self, event: dict):
+        """Add the module of a `module_finished` event, see `RepositoryParser.callback`."""
+        if event["event"] == MODULE_FINISHED:
+            self.add_module(event["module"], event["data"])
+
+    def _get_postings(self, trigram: str) -> typing.Optional[array.array]:
+        postings = self._postings.get(trigram)
+        if postings is None and trigram in self._offsets:
+            # Decoded on first use
+            offset, count = self._offsets.pop(trigram)
+            postings = self._postings[trigram] = array.array(_POSTING_TYPE)
+            postings.frombytes(self._data[offset * 4 : (offset + count) * 4])
+            if sys.byteorder == "big":
+                postings.byteswap()
+        return postings
+
+    def _candidates(self, literals: typing.Iterable[str]) -> typing.Iterable[int]:
+        """Return the indexes of the documents containing all the `literals`."""
+        trigrams = set()
+        for literal in literals:
+            trigrams |= _trigrams(literal)
+        if not trigrams:
+            return range(len(self.documents))
+        postings = []
+        for trigram in trigrams:
+            trigram_postings = self._get_postings(trigram)
+            if not trigram_postings:
+                return []
+            postings.append(trigram_postings)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for trigram_postings in postings[1:]:
+            if len(trigram_postings) > 8 * len(candidates):
+                # Cheaper to check the remaining candidates than to walk
+                # the postings of frequent trigrams
+                break
+            candidates.intersection_update(trigram_postings)
+        return sorted(candidates)
+
+    def _to_dict(self, doc_id: int) -> dict:
+        kind, module, model, name, code = self.documents[doc_id]
+        return {
+            "kind": kind,
+            "module": module,
+            "model": model,
+            "name": name,
+            "code": code,
+        }
+
+    def _search(
+        self,
+        literals: typing.Iterable[str],
+        match: typing.Callable[[str], bool],
+        kinds: typing.Optional[typing.Collection[str]],
+    ) -> list[dict]:
+        results = []
+        for doc_id in self._candidates(literals):
+            kind, __, __, __, code = self.documents[doc_id]
+            if (kinds is None or kind in kinds) and match(code):
+                results.append(self._to_dict(doc_id))
+        return results
+
+    def search(
+        self, substring: str, kinds: typing.Optional[typing.Collection[str]] = None
+    ) -> list[dict]:
+        """Return the documents whose code contains `substring`.
+
+        Documents are dicts with `kind` (one of `kinds` if set: `field`,
+        `method` or `view`), `module`, `model`, `name` and `code`.
+        """
+        return self._search([substring], lambda code: substring in code, kinds)
+
+    def search_regex(
+        self,
+        pattern: typing.Union[str, re.Pattern],
+        kinds: typing.Optional[typing.Collection[str]] = None,
+    ) -> list[dict]:
+        """Return the documents whose code matches the regular expression
+        `pattern`, see `search()`.
+        """
+        regex = re.compile(pattern)
+        literals = []
+        if not regex.flags & re.IGNORECASE:
+            literals = _literals(sre_parse.parse(regex.pattern, regex.flags))
+        return self._search(literals, lambda code: regex.search(code), kinds)
+
+    def save(self, path: typing.Union[str, os.PathLike]):
+        """Save the index to a file, see `load()`."""
+        offsets = {}
+        data = array.array(_POSTING_TYPE)
+        for trigram in sorted(self._postings.keys() | self._offsets.keys()):
+            postings = self._get_postings(trigram)
+            offsets[trigram] = (len(data), len(postings))
+            data.extend(postings)
+        if sys.byteorder == "big":
+            data.byteswap()
+        header = json.dumps({"documents": self.documents, "trigrams": offsets})
+        header = header.encode()
+        with open(path, "wb") as file_:
+            file_.write(MAGIC)
+            file_.write(len(header).to_bytes(8, "little"))
+            file_.write(header)
+            file_.write(data.tobytes())
+
+    @classmethod
+    def load(cls, path: typing.Union[str, os.PathLike]) -> "CodeIndex":
+        """Load an index saved with `save()`.
+
+        Postings of a trigram are decoded when it is first looked for.
+        """
+        with open(path, "rb") as file_:
+            content = file_.read()
+        if not content.startswith(MAGIC):
+            raise ValueError(f"'{path}' is not an index file")
+        start = len(MAGIC) + 8
+        size = int.from_bytes(content[len(MAGIC) : start], "little")
+        header = json.loads(content[start : start + size])
+        index = cls()
+        index.documents = [tuple(document) for document in header["documents"]]
+        index._offsets = {
+            trigram: tuple(offset) for trigram, offset in header["trigrams"].items()
+        }
+        index._data = memoryview(content)[start + size :]
+        return index
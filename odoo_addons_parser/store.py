@@ -0,0 +1,372 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Store scans in a SQLite database, to query them without loading JSON dumps.
+
+Scans are split into tables (modules, dependencies, code stats, models,
+fields, methods and data records) indexed on what is usually looked for:
+model and field names, comodels and XML IDs. Each module is stored with
+its fingerprint (see `diff.fingerprint_module()`): loading a new scan only
+rewrites the modules that changed.
+
+E.g:
+    >>> store = ScanStore("scans.db")
+    >>> store.load(RepositoryParser("./server-tools").to_dict(), repository="server-tools")
+    {'inserted': [...], 'updated': [], 'unchanged': [], 'removed': []}
+    >>> store.fields(comodel="res.partner")
+    [{'module': 'base_technical_user', 'model': 'res.company', 'name': 'user_tech_id', ...}]
+"""
+
+import json
+import os
+import sqlite3
+import typing
+
+from .data_xml import get_full_xmlid
+from .diff import RECORDS_KEYS, fingerprint_module
+
+SCHEMA = """
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS modules (
+    id INTEGER PRIMARY KEY,
+    repository TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    manifest TEXT,
+    skipped_files TEXT,
+    UNIQUE (repository, name)
+);
+CREATE INDEX IF NOT EXISTS modules_name ON modules (name);
+CREATE TABLE IF NOT EXISTS dependencies (
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    depends TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dependencies_module_id ON dependencies (module_id);
+CREATE INDEX IF NOT EXISTS dependencies_depends ON dependencies (depends);
+CREATE TABLE IF NOT EXISTS code_stats (
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    language TEXT NOT NULL,
+    lines INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS code_stats_module_id ON code_stats (module_id);
+CREATE TABLE IF NOT EXISTS models (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    class_name TEXT,
+    type TEXT,
+    file_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS models_module_id ON models (module_id);
+CREATE INDEX IF NOT EXISTS models_model ON models (model);
+CREATE TABLE IF NOT EXISTS fields (
+    model_id INTEGER NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    type TEXT,
+    comodel_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fields_model_id ON fields (model_id);
+CREATE INDEX IF NOT EXISTS fields_name ON fields (name);
+CREATE INDEX IF NOT EXISTS fields_comodel_name ON fields (comodel_name);
+CREATE TABLE IF NOT EXISTS methods (
+    model_id INTEGER NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS methods_model_id ON methods (model_id);
+CREATE INDEX IF NOT EXISTS methods_name ON methods (name);
+CREATE TABLE IF NOT EXISTS records (
+    module_id INTEGER NOT NULL REFERENCES modules (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    xmlid TEXT,
+    file_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_module_id ON records (module_id);
+CREATE INDEX IF NOT EXISTS records_model ON records (model);
+CREATE INDEX IF NOT EXISTS records_xmlid ON records (xmlid);
+"""
+
+_FIELDS_QUERY = """
+SELECT modules.repository, modules.name, models.model, fields.data
+FROM fields
+JOIN models ON models.id = fields.model_id
+JOIN modules ON modules.id = models.module_id
+"""
+
+
+def _dumps(value: typing.Any) -> str:
+    return json.dumps(value, default=repr)
+
+
+class ScanStore:
+    """SQLite database of scans, one row per module, model, field...
+
+    `path` is the database file (in memory by default). Modules are
+    identified by their `repository` (a name given when loading a scan) and
+    their name. Modules are written `batch_size` at a time, each batch in
+    its own transaction.
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike] = ":memory:",
+        batch_size: int = 100,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        self.connection.close()
+
+    def fingerprints(self, repository: str = "") -> dict[str, str]:
+        """Return the fingerprint of the stored modules of a repository."""
+        rows = self.connection.execute(
+            "SELECT name, fingerprint FROM modules WHERE repository = ?",
+            (repository,),
+        )
+        return {row["name"]: row["fingerprint"] for row in rows}
+
+    def load(self, data: dict, repository: str = "", prune: bool = True) -> dict:
+        """Store a scan (the output of `RepositoryParser.to_dict()` or
+        `OdooParser.to_dict()`) under the name `repository`.
+
+        Modules unchanged since the last load (same fingerprint) are not
+        written again. With `prune`, stored modules missing from `data` are
+        removed. Return the names of modules by status: `inserted`,
+        `updated`, `unchanged` and `removed`.
+        """
+        stored = self.fingerprints(repository)
+        result = {"inserted": [], "updated": [], "unchanged": [], "removed": []}
+        batch = []
+        for name, module_data in data.items():
+            # Line numbers are stored too: code moved makes the module updated
+            fingerprint = fingerprint_module(module_data, ignored_keys=()).hash
+            if name not in stored:
+                result["inserted"].append(name)
+            elif stored[name] != fingerprint:
+                result["updated"].append(name)
+            else:
+                result["unchanged"].append(name)
+                continue
+            batch.append((name, module_data, fingerprint))
+            if len(batch) >= self.batch_size:
+                self._write(repository, batch)
+                batch = []
+        if prune:
+            result["removed"] = sorted(stored.keys() - data.keys())
+        if batch or result["removed"]:
+            self._write(repository, batch, result["removed"])
+        return result
+
+    def _write(
+        self, repository: str, batch: list[tuple], removed: typing.Iterable[str] = ()
+    ):
+        """Write modules in one transaction, replacing their previous version."""
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM modules WHERE repository = ? AND name = ?",
+                [(repository, name) for name in [*removed, *(mod[0] for mod in batch)]],
+            )
+            for name, module_data, fingerprint in batch:
+                self._insert_module(repository, name, module_data, fingerprint)
+
+    def _insert_module(
+        self, repository: str, name: str, module_data: dict, fingerprint: str
+    ):
+        cursor = self.connection.cursor()
+        manifest = module_data.get("manifest")
+        skipped_files = module_data.get("skipped_files")
+        cursor.execute(
+            "INSERT INTO modules (repository, name, fingerprint, manifest, skipped_files)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                repository,
+                name,
+                fingerprint,
+                _dumps(manifest) if manifest is not None else None,
+                _dumps(skipped_files) if skipped_files else None,
+            ),
+        )
+        module_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO dependencies (module_id, depends) VALUES (?, ?)",
+            [(module_id, depends) for depends in (manifest or {}).get("depends", [])],
+        )
+        cursor.executemany(
+            "INSERT INTO code_stats (module_id, language, lines) VALUES (?, ?, ?)",
+            [
+                (module_id, language, lines)
+                for language, lines in module_data.get("code", {}).items()
+            ],
+        )
+        fields, methods = [], []
+        for model, model_data in module_data.get("models", {}).items():
+            cursor.execute(
+                "INSERT INTO models (module_id, model, class_name, type, file_path, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    module_id,
+                    model,
+                    model_data.get("class_name"),
+                    model_data.get("type"),
+                    model_data.get("file_path"),
+                    _dumps(
+                        {
+                            key: value
+                            for key, value in model_data.items()
+                            if key not in ("fields", "methods")
+                        }
+                    ),
+                ),
+            )
+            model_id = cursor.lastrowid
+            fields.extend(
+                (
+                    model_id,
+                    field_name,
+                    field.get("type"),
+                    field.get("comodel_name"),
+                    _dumps(field),
+                )
+                for field_name, field in model_data.get("fields", {}).items()
+            )
+            methods.extend(
+                (model_id, method_name, _dumps(method))
+                for method_name, method in model_data.get("methods", {}).items()
+            )
+        cursor.executemany(
+            "INSERT INTO fields (model_id, name, type, comodel_name, data)"
+            " VALUES (?, ?, ?, ?, ?)",
+            fields,
+        )
+        cursor.executemany(
+            "INSERT INTO methods (model_id, name, data) VALUES (?, ?, ?)", methods
+        )
+        cursor.executemany(
+            "INSERT INTO records (module_id, kind, model, xmlid, file_path, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    module_id,
+                    kind,
+                    model,
+                    get_full_xmlid(name, record.get("id")),
+                    record.get("file_path"),
+                    _dumps(record),
+                )
+                for kind in RECORDS_KEYS
+                for model, records in module_data.get(kind, {}).items()
+                for record in records
+            ],
+        )
+
+    def modules(self, repository: typing.Optional[str] = None) -> list[str]:
+        """Return the names of the stored modules, of a repository or all."""
+        query = "SELECT DISTINCT name FROM modules"
+        params = ()
+        if repository is not None:
+            query += " WHERE repository = ?"
+            params = (repository,)
+        rows = self.connection.execute(query + " ORDER BY name", params)
+        return [row["name"] for row in rows]
+
+    def dependents(self, module: str) -> list[str]:
+        """Return the modules depending directly on `module`."""
+        rows = self.connection.execute(
+            "SELECT DISTINCT modules.name FROM dependencies"
+            " JOIN modules ON modules.id = dependencies.module_id"
+            " WHERE dependencies.depends = ? ORDER BY modules.name",
+            (module,),
+        )
+        return [row["name"] for row in rows]
+
+    def model_modules(self, model: str) -> list[str]:
+        """Return the modules defining or extending `model`."""
+        rows = self.connection.execute(
+            "SELECT DISTINCT modules.name FROM models"
+            " JOIN modules ON modules.id = models.module_id"
+            " WHERE models.model = ? ORDER BY modules.name",
+            (model,),
+        )
+        return [row["name"] for row in rows]
+
+    def fields(
+        self,
+        model: typing.Optional[str] = None,
+        name: typing.Optional[str] = None,
+        comodel: typing.Optional[str] = None,
+    ) -> list[dict]:
+        """Return the fields matching all the given criteria.
+
+        Each field is returned as scanned, with its `repository`, `module`
+        and `model`.
+        """
+        conditions, params = [], []
+        for column, value in (
+            ("models.model", model),
+            ("fields.name", name),
+            ("fields.comodel_name", comodel),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        query = _FIELDS_QUERY
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY modules.name, models.model, fields.name"
+        return [
+            dict(
+                json.loads(row["data"]),
+                repository=row["repository"],
+                module=row["name"],
+                model=row["model"],
+            )
+            for row in self.connection.execute(query, params)
+        ]
+
+    def records(
+        self,
+        xmlid: typing.Optional[str] = None,
+        model: typing.Optional[str] = None,
+    ) -> list[dict]:
+        """Return the data records matching the full `xmlid` and/or `model`.
+
+        Each record is returned as scanned, with its `repository`, `module`,
+        `kind` (`data` or `demo`) and full `xmlid`.
+        """
+        conditions, params = [], []
+        for column, value in (("records.xmlid", xmlid), ("records.model", model)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        query = (
+            "SELECT modules.repository, modules.name, records.kind, records.xmlid,"
+            " records.data FROM records"
+            " JOIN modules ON modules.id = records.module_id"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY modules.name, records.xmlid"
+        return [
+            dict(
+                json.loads(row["data"]),
+                repository=row["repository"],
+                module=row["name"],
+                kind=row["kind"],
+                xmlid=row["xmlid"],
+            )
+            for row in self.connection.execute(query, params)
+        ]
@@ -0,0 +1,185 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import os
+import pathlib
+import pickle
+import shutil
+import tarfile
+import tempfile
+
+from odoo_addons_parser import OdooParser, RepositoryParser
+from odoo_addons_parser.archive import (
+    ArchiveModuleParser,
+    ArchiveOdooParser,
+    ArchiveRepositoryParser,
+    ArchiveTree,
+)
+from odoo_addons_parser.instrumentation import Instrumentation
+
+from . import common
+
+
+def _reset_mtime(info):
+    info.mtime = 0
+    return info
+
+
+class TestArchive(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.source_path = pathlib.Path(self.tmp_dir.name, "repo-18.0")
+        shutil.copytree(
+            self.repo_path,
+            self.source_path,
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+
+    def _make_archive(self, format_):
+        # Archives containing one 'repo-18.0' folder
+        path = shutil.make_archive(
+            os.path.join(self.tmp_dir.name, "repo-18.0"),
+            format_,
+            root_dir=self.tmp_dir.name,
+            base_dir="repo-18.0",
+        )
+        archive = ArchiveTree(path)
+        self.addCleanup(archive.close)
+        return archive
+
+    def test_tree(self):
+        for format_ in ("zip", "tar", "gztar"):
+            with self.subTest(format=format_):
+                archive = self._make_archive(format_)
+                self.assertEqual(archive.name, "repo-18.0")
+                self.assertEqual(str(archive.root), "repo-18.0")
+                module_path = archive.root.joinpath(self.module_name)
+                self.assertTrue(archive.is_dir(module_path))
+                manifest_path = archive.get_manifest_path(module_path)
+                self.assertEqual(
+                    archive.read(manifest_path),
+                    self.module_path.joinpath("__manifest__.py").read_bytes(),
+                )
+                self.assertEqual(
+                    archive.read_manifest(module_path), self.module_manifest
+                )
+                with self.assertRaises(FileNotFoundError):
+                    archive.read("unknown.py")
+
+    def test_tree_decompressed_copy(self):
+        archive = self._make_archive("gztar")
+        data_path = archive.data_path
+        self.assertTrue(os.path.exists(data_path))
+        # Reused by worker processes, removed by the owner only
+        copy = pickle.loads(pickle.dumps(archive))
+        self.assertIsNot(copy, archive)
+        self.assertEqual(copy.data_path, data_path)
+        copy.close()
+        self.assertTrue(os.path.exists(data_path))
+        archive.close()
+        self.assertFalse(os.path.exists(data_path))
+
+    def test_not_an_archive(self):
+        path = self.source_path.joinpath("README.md")
+        path.write_text("Not an archive")
+        with self.assertRaises(ValueError):
+            ArchiveTree(path)
+
+    def test_module_parser(self):
+        archive = self._make_archive("zip")
+        parser = ArchiveModuleParser(archive, archive.root.joinpath(self.module_name))
+        data = self._order_mod_data(parser.to_dict())
+        self.assertDictEqual(data, self.module_to_dict)
+        with self.assertRaises(ValueError):
+            # The root folder is not a module
+            ArchiveModuleParser(archive)
+
+    def test_module_parser_root(self):
+        # Module files at the root of the archive
+        path = shutil.make_archive(
+            os.path.join(self.tmp_dir.name, self.module_name),
+            "zip",
+            root_dir=self.source_path.joinpath(self.module_name),
+        )
+        with ArchiveTree(path) as archive:
+            parser = ArchiveModuleParser(archive)
+            self.assertEqual(parser.name, self.module_name)
+            data = self._order_mod_data(parser.to_dict())
+            self.assertDictEqual(data, self.module_to_dict)
+
+    def test_repository_parser(self):
+        for format_ in ("zip", "gztar"):
+            with self.subTest(format=format_):
+                archive = self._make_archive(format_)
+                parser = ArchiveRepositoryParser(archive)
+                self.assertEqual(parser.name, "repo-18.0")
+                data = self._order_repo_data(parser.to_dict())
+                self.assertDictEqual(data, {self.module_name: self.module_to_dict})
+                self.assertEqual(list(parser.module_costs()), [self.module_name])
+
+    def test_instrumentation(self):
+        archive = self._make_archive("zip")
+        expected = Instrumentation()
+        RepositoryParser(self.source_path, instrumentation=expected).to_dict()
+        instrumentation = Instrumentation()
+        ArchiveRepositoryParser(archive, instrumentation=instrumentation).to_dict()
+        for phase in ("code_stats", "py_file", "xml_file", "csv_file"):
+            self.assertTrue(instrumentation.phases[phase]["bytes"])
+            self.assertEqual(
+                instrumentation.phases[phase]["bytes"],
+                expected.phases[phase]["bytes"],
+            )
+
+    def test_tar_shared_cache(self):
+        # Files of the same size and modification time, with another content
+        # (e.g. reproducible archives)
+        models_path = self.source_path.joinpath(
+            self.module_name, "models", "res_partner.py"
+        )
+        content = models_path.read_text()
+        cache = {}
+        for index, field_name in enumerate(("custom_field", "custom_fielx")):
+            models_path.write_text(content.replace("custom_field", field_name))
+            path = os.path.join(self.tmp_dir.name, f"repo-{index}.tar")
+            with tarfile.open(path, "w") as tar:
+                tar.add(
+                    self.source_path,
+                    arcname="repo-18.0",
+                    filter=_reset_mtime,
+                )
+            archive = ArchiveTree(path)
+            self.addCleanup(archive.close)
+            data = ArchiveRepositoryParser(archive, cache=cache).to_dict()
+            fields = data[self.module_name]["models"]["res.partner"]["fields"]
+            self.assertIn(field_name, fields)
+
+    def test_repository_parser_workers(self):
+        archive = self._make_archive("gztar")
+        parser = ArchiveRepositoryParser(archive.path, workers=2)
+        self.addCleanup(parser.archive.close)
+        data = self._order_repo_data(parser.to_dict())
+        self.assertDictEqual(data, {self.module_name: self.module_to_dict})
+
+    def test_odoo_parser(self):
+        models_path = self.source_path.joinpath("odoo", "models.py")
+        models_path.parent.mkdir()
+        models_path.write_text(
+            "class BaseModel(metaclass=MetaModel):\n"
+            "    _auto = False\n"
+            "    id = fields.Id()\n\n\n"
+            "class Model(AbstractModel):\n"
+            "    _auto = True\n"
+        )
+        archive = self._make_archive("tar")
+        options = {"addons_paths": ("",), "code_stats": False}
+        expected = OdooParser(self.source_path, **options).to_dict()
+        parser = ArchiveOdooParser(archive, **options)
+        self.assertEqual(parser.name, "repo-18.0")
+        data = parser.to_dict()
+        self.assertEqual(data["__odoo__"], expected["__odoo__"])
+        self.assertEqual(
+            self._order_mod_data(data[self.module_name]),
+            self._order_mod_data(expected[self.module_name]),
+        )
@@ -0,0 +1,145 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from odoo_addons_parser import RepositoryParser
+from odoo_addons_parser.code import PyFile
+from odoo_addons_parser.daemon import ScanDaemon, query
+from odoo_addons_parser.watch import PollingWatcher
+
+from . import common
+
+
+class TestScanDaemon(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.tmp_repo_path = pathlib.Path(self.tmp_dir.name, "repo")
+        shutil.copytree(self.repo_path, self.tmp_repo_path)
+        self.tmp_module_path = self.tmp_repo_path.joinpath(self.module_name)
+        self.daemon = ScanDaemon([RepositoryParser(self.tmp_repo_path)])
+
+    def _add_field(self):
+        path = self.tmp_module_path.joinpath("models", "res_users.py")
+        content = path.read_text()
+        path.write_text(content + "    new_field = fields.Char()\n")
+        return path
+
+    def test_scan(self):
+        self.daemon.scan()
+        self.assertEqual(
+            self.daemon.query({"method": "modules"}), {"result": [self.module_name]}
+        )
+        result = self.daemon.query(
+            {"method": "module", "params": {"name": self.module_name}}
+        )["result"]
+        self.assertEqual(result["models"].keys(), self.module_to_dict["models"].keys())
+        result = self.daemon.query({"method": "model", "params": {"name": "res.users"}})
+        self.assertEqual(list(result["result"]), [self.module_name])
+        self.assertIn("error", self.daemon.query({"method": "unknown"}))
+
+    def test_update(self):
+        self.daemon.scan()
+        snapshot = self.daemon.query({"method": "data"})["result"]
+        path = self._add_field()
+        with mock.patch.object(
+            PyFile, "__init__", side_effect=PyFile.__init__, autospec=True
+        ) as init:
+            updated = self.daemon.update({path})
+        self.assertEqual(updated, {self.module_name})
+        # Only the changed Python file has been parsed again
+        self.assertEqual([call.args[1] for call in init.call_args_list], [path])
+        fields = self.daemon.data[self.module_name]["models"]["res.users"]["fields"]
+        self.assertIn("new_field", fields)
+        # Results of previous queries are left untouched
+        models = snapshot[self.module_name]["models"]
+        self.assertNotIn("new_field", models["res.users"].get("fields", {}))
+
+    def test_update_base_models(self):
+        self.daemon.scan()
+        # Base models stored under the name of a module are kept on update
+        base_model = {"name": "base", "fields": {}}
+        self.daemon.base_models = {self.module_name: {"models": {"base": base_model}}}
+        self.daemon.update({self._add_field()})
+        result = self.daemon.query(
+            {"method": "module", "params": {"name": self.module_name}}
+        )["result"]
+        self.assertEqual(result["models"]["base"], base_model)
+        self.assertIn("new_field", result["models"]["res.users"]["fields"])
+        result = self.daemon.query({"method": "model", "params": {"name": "base"}})
+        self.assertEqual(result["result"], {self.module_name: base_model})
+
+    def test_update_module_removed(self):
+        self.daemon.scan()
+        manifest_path = self.tmp_module_path.joinpath("__manifest__.py")
+        manifest_path.unlink()
+        self.assertEqual(self.daemon.update({manifest_path}), {self.module_name})
+        self.assertEqual(self.daemon.data, {})
+        # Changes outside of modules are ignored
+        self.assertEqual(
+            self.daemon.update({self.tmp_repo_path.joinpath(".git")}), set()
+        )
+
+    def test_update_new_dependency(self):
+        # A module of the repository the selected module doesn't depend on
+        dependency_path = self.tmp_repo_path.joinpath("module_dependency")
+        dependency_path.mkdir()
+        dependency_path.joinpath("__manifest__.py").write_text(
+            '{"name": "Dependency", "depends": ["base"]}'
+        )
+        repo = RepositoryParser(self.tmp_repo_path, modules=[self.module_name])
+        daemon = ScanDaemon([repo])
+        daemon.scan()
+        self.assertEqual(list(daemon.data), [self.module_name])
+        manifest_path = self.tmp_module_path.joinpath("__manifest__.py")
+        manifest = manifest_path.read_text()
+        manifest_path.write_text(
+            manifest.replace(
+                '"depends": ["base"]', '"depends": ["base", "module_dependency"]'
+            )
+        )
+        self.assertEqual(
+            daemon.update({manifest_path}), {self.module_name, "module_dependency"}
+        )
+        self.assertEqual(sorted(daemon.data), ["module_dependency", self.module_name])
+        # And removed once not needed anymore
+        manifest_path.write_text(manifest)
+        self.assertEqual(
+            daemon.update({manifest_path}), {self.module_name, "module_dependency"}
+        )
+        self.assertEqual(list(daemon.data), [self.module_name])
+
+    def test_serve_forever(self):
+        socket_path = pathlib.Path(self.tmp_dir.name, "daemon.sock")
+        self.daemon.socket_path = socket_path
+        self.daemon.get_watcher = lambda: PollingWatcher(
+            [self.tmp_repo_path], interval=0.05
+        )
+        thread = threading.Thread(target=self.daemon.serve_forever)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while not socket_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(query(socket_path, "modules"), [self.module_name])
+            updated = query(socket_path, "status")["updated"]
+            self._add_field()
+            while time.monotonic() < deadline:
+                if query(socket_path, "status")["updated"] != updated:
+                    break
+                time.sleep(0.05)
+            model = query(socket_path, "model", name="res.users")[self.module_name]
+            self.assertIn("new_field", model["fields"])
+            with self.assertRaises(RuntimeError):
+                query(socket_path, "module", name="unknown")
+        finally:
+            self.daemon.stop()
+            thread.join()
+        self.assertFalse(socket_path.exists())
@@ -0,0 +1,89 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import copy
+import json
+
+from odoo_addons_parser.diff import Fingerprint, diff, diff_scans, fingerprint
+
+from . import common
+
+
+class TestDiff(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.old_data = {self.module_name: copy.deepcopy(self.module_to_dict)}
+        self.new_data = copy.deepcopy(self.old_data)
+        self.new_module = self.new_data[self.module_name]
+
+    def test_identical(self):
+        old = fingerprint(self.old_data)
+        new = fingerprint(self.new_data)
+        self.assertEqual(old, new)
+        self.assertEqual(diff(old, new), {})
+        # Fingerprints are stable and can be stored
+        stored = json.loads(json.dumps(old.to_dict()))
+        self.assertEqual(diff(Fingerprint.from_dict(stored), new), {})
+
+    def test_diff(self):
+        self.new_data["new_module"] = {"name": "new_module", "manifest": {}}
+        self.new_module["manifest"]["version"] = "1.0.1"
+        partner = self.new_module["models"]["res.partner"]
+        partner["fields"]["new_field"] = {"name": "new_field", "type": "Char"}
+        del partner["fields"]["foo_id"]
+        partner["methods"]["action_custom"]["code"] += "\n        return True"
+        # Moved code is not a change
+        partner["fields"]["custom_field"]["lineno"] += 10
+        del self.new_module["models"]["res.users"]
+        self.new_module["models"]["res.company"] = {"inherit": "res.company"}
+        self.new_module["models"]["res.partner"]["inherit"] = ["res.partner"]
+        records = self.new_module["data"]["res.partner"]
+        records[0]["data"]["name"] = "CEO"
+        records.append(dict(records[1], id="assistant"))
+        del self.new_module["demo"]
+        self.assertEqual(
+            diff_scans(self.old_data, self.new_data),
+            {
+                "added": ["new_module"],
+                "changed": {
+                    self.module_name: {
+                        "removed": ["demo"],
+                        "changed": {
+                            "data": {
+                                "changed": {
+                                    "res.partner": {
+                                        "added": ["assistant"],
+                                        "changed": {"accountant": True},
+                                    },
+                                },
+                            },
+                            "manifest": True,
+                            "models": {
+                                "added": ["res.company"],
+                                "removed": ["res.users"],
+                                "changed": {
+                                    "res.partner": {
+                                        "changed": {
+                                            "fields": {
+                                                "added": ["new_field"],
+                                                "removed": ["foo_id"],
+                                            },
+                                            "inherit": True,
+                                            "methods": {
+                                                "changed": {"action_custom": True},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        )
+        # Line numbers can be compared too
+        result = diff_scans(self.old_data, self.new_data, ignored_keys=())
+        fields_diff = result["changed"][self.module_name]["changed"]["models"][
+            "changed"
+        ]["res.partner"]["changed"]["fields"]
+        self.assertEqual(fields_diff["changed"], {"custom_field": True})
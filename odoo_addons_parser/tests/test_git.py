@@ -0,0 +1,167 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import gc
+import pathlib
+import pickle
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from odoo_addons_parser import OdooParser
+from odoo_addons_parser.code import PyFile
+from odoo_addons_parser.git import (
+    GitError,
+    GitOdooParser,
+    GitRepository,
+    GitRepositoryParser,
+)
+from odoo_addons_parser.tree import TreeModuleParser
+
+from . import common
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not available")
+class TestGit(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.git_path = pathlib.Path(self.tmp_dir.name, "git_repo")
+        shutil.copytree(
+            self.repo_path,
+            self.git_path,
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        self._git("init", "-q")
+        self._commit("Init")
+        self.repository = GitRepository(self.git_path)
+        self.addCleanup(self.repository.close)
+
+    def _git(self, *args):
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(self.git_path),
+                "-c",
+                "user.name=test",
+                "-c",
+                "user.email=test@example.com",
+                *args,
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+    def _commit(self, message):
+        self._git("add", "-A")
+        self._git("commit", "-q", "-m", message)
+
+    def _add_field(self):
+        path = self.git_path.joinpath(self.module_name, "models", "res_users.py")
+        path.write_text(path.read_text() + "    new_field = fields.Char()\n")
+        self._commit("Add field")
+        # The working tree is not read: drop it
+        shutil.rmtree(self.git_path.joinpath(self.module_name))
+
+    def test_tree(self):
+        tree = self.repository.get_tree("HEAD")
+        self.assertIs(self.repository.get_tree(tree.commit), tree)
+        self.assertTrue(tree.is_dir(self.module_name))
+        manifest_path = tree.get_manifest_path(self.module_name)
+        self.assertEqual(str(manifest_path), f"{self.module_name}/__manifest__.py")
+        self.assertEqual(
+            tree.read(manifest_path),
+            self.module_path.joinpath("__manifest__.py").read_bytes(),
+        )
+        self.assertEqual(tree.read_manifest(self.module_name), self.module_manifest)
+        with self.assertRaises(FileNotFoundError):
+            tree.read("unknown.py")
+        with self.assertRaises(GitError):
+            self.repository.get_tree("unknown")
+
+    def test_repository_closed(self):
+        with GitRepository(self.git_path) as repository:
+            repository.get_tree().read_manifest(self.module_name)
+            process = repository._process
+            self.assertIsNone(process.poll())
+        self.assertIsNotNone(process.poll())
+        # Stopped as well once the repository is not used anymore
+        repository = GitRepository(self.git_path)
+        repository.get_tree().read_manifest(self.module_name)
+        process = repository._process
+        del repository
+        gc.collect()
+        self.assertIsNotNone(process.poll())
+
+    def test_module_parser(self):
+        tree = self.repository.get_tree()
+        parser = TreeModuleParser(tree, self.module_name)
+        data = self._order_mod_data(parser.to_dict())
+        self.assertDictEqual(data, self.module_to_dict)
+        with self.assertRaises(ValueError):
+            TreeModuleParser(tree, "unknown")
+
+    def test_repository_parser(self):
+        self._add_field()
+        parser = GitRepositoryParser(self.repository, rev="HEAD~1")
+        self.assertEqual(parser.name, "git_repo")
+        data = self._order_repo_data(parser.to_dict())
+        self.assertDictEqual(data, {self.module_name: self.module_to_dict})
+        self.assertEqual(list(parser.module_costs()), [self.module_name])
+
+    def test_repository_parser_workers(self):
+        parser = GitRepositoryParser(self.git_path, workers=2)
+        self.addCleanup(parser.repository.close)
+        # Sent to workers without its 'git cat-file' process, and opened
+        # once per process
+        repository = pickle.loads(pickle.dumps(parser.repository))
+        self.assertEqual(repository.path, parser.repository.path)
+        self.assertIsNot(repository, parser.repository)
+        self.assertIs(pickle.loads(pickle.dumps(parser.repository)), repository)
+        data = self._order_repo_data(parser.to_dict())
+        self.assertDictEqual(data, {self.module_name: self.module_to_dict})
+
+    def test_repository_parser_cache(self):
+        cache = {}
+        GitRepositoryParser(self.repository, cache=cache, code_stats=False).to_dict()
+        self._add_field()
+        with mock.patch.object(
+            PyFile, "__init__", side_effect=PyFile.__init__, autospec=True
+        ) as init:
+            data = GitRepositoryParser(
+                self.repository, cache=cache, code_stats=False
+            ).to_dict()
+        # Only the changed Python file has been parsed again
+        self.assertEqual(
+            [str(call.args[1]) for call in init.call_args_list],
+            [f"{self.module_name}/models/res_users.py"],
+        )
+        fields = data[self.module_name]["models"]["res.users"]["fields"]
+        self.assertIn("new_field", fields)
+
+    def test_odoo_parser(self):
+        models_path = self.git_path.joinpath("odoo", "models.py")
+        models_path.parent.mkdir()
+        models_path.write_text(
+            "class BaseModel(metaclass=MetaModel):\n"
+            "    _auto = False\n"
+            "    id = fields.Id()\n\n\n"
+            "class Model(AbstractModel):\n"
+            "    _auto = True\n"
+        )
+        self._commit("Add base models")
+        options = {"addons_paths": ("",), "code_stats": False}
+        expected = OdooParser(self.git_path, **options).to_dict()
+        self.assertIn("__odoo__", expected)
+        parser = GitOdooParser(self.repository, **options)
+        self.assertEqual(parser.name, "git_repo")
+        data = parser.to_dict()
+        self.assertEqual(data["__odoo__"], expected["__odoo__"])
+        self.assertEqual(
+            self._order_mod_data(data[self.module_name]),
+            self._order_mod_data(expected[self.module_name]),
+        )
@@ -0,0 +1,100 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import unittest
+
+from odoo_addons_parser import DependencyGraph
+from odoo_addons_parser.graph import DependencyCycleError
+
+from . import common
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.graph = DependencyGraph(
+            {
+                "base": [],
+                "web": ["base"],
+                "mail": ["base", "web"],
+                "sale": ["mail", "product"],
+                "product": ["mail"],
+                "sale_stock": ["sale", "stock"],
+                "stock": ["product"],
+                "other": ["missing_module"],
+            }
+        )
+
+    def test_load_order(self):
+        self.assertEqual(
+            self.graph.load_order(),
+            [
+                "base",
+                "missing_module",
+                "other",
+                "web",
+                "mail",
+                "product",
+                "sale",
+                "stock",
+                "sale_stock",
+            ],
+        )
+
+    def test_load_order_subset(self):
+        self.assertEqual(
+            self.graph.load_order(["sale"]),
+            ["base", "web", "mail", "product", "sale"],
+        )
+
+    def test_dependencies(self):
+        self.assertEqual(
+            self.graph.dependencies("sale"), ["base", "mail", "product", "web"]
+        )
+        self.assertEqual(self.graph.dependencies("base"), [])
+        self.assertEqual(
+            self.graph.closure(["stock"]),
+            ["base", "mail", "product", "stock", "web"],
+        )
+
+    def test_dependents(self):
+        self.assertEqual(
+            self.graph.dependents("product"), ["sale", "sale_stock", "stock"]
+        )
+        self.assertEqual(self.graph.dependents("sale_stock"), [])
+        self.assertEqual(
+            self.graph.impacted(["stock", "sale"]), ["sale", "sale_stock", "stock"]
+        )
+
+    def test_unknown_module(self):
+        with self.assertRaises(KeyError):
+            self.graph.dependencies("unknown")
+
+    def test_missing(self):
+        self.assertEqual(self.graph.missing, {"missing_module": ["other"]})
+
+    def test_cycles(self):
+        graph = DependencyGraph(
+            {"a": ["b"], "b": ["c"], "c": ["a"], "d": ["a"], "e": ["e"]}
+        )
+        self.assertEqual(graph.cycles(), [["a", "b", "c"], ["e"]])
+        self.assertEqual(graph.dependencies("d"), ["a", "b", "c"])
+        self.assertEqual(graph.dependents("b"), ["a", "b", "c", "d"])
+        with self.assertRaises(DependencyCycleError):
+            graph.load_order()
+        with self.assertRaises(DependencyCycleError):
+            graph.load_order(["d"])
+        self.assertEqual(self.graph.cycles(), [])
+
+
+class TestDependencyGraphFromParsers(common.CommonCase):
+    def test_from_parsers(self):
+        repo = self._run_repo_parser()
+        graph = DependencyGraph.from_parsers(repo)
+        self.assertEqual(graph.load_order(), ["base", self.module_name])
+        self.assertEqual(graph.missing, {"base": [self.module_name]})
+
+    def test_from_dict(self):
+        repo = self._run_repo_parser(code_stats=False, scan_models=False)
+        graph = DependencyGraph.from_dict(repo.to_dict())
+        self.assertEqual(graph.dependents("base"), [self.module_name])
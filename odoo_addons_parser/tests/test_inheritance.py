@@ -0,0 +1,223 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import unittest
+
+from odoo_addons_parser.inheritance import ModelResolver, OverrideIndex
+
+
+def _field(name, **kwargs):
+    field = {"name": name, "type": "Char"}
+    if kwargs:
+        field["kwargs"] = kwargs
+    return field
+
+
+def _module(depends, models):
+    return {"manifest": {"depends": depends}, "models": models}
+
+
+class TestModelResolver(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            "base": _module(
+                [],
+                {
+                    "res.partner": {
+                        "name": "res.partner",
+                        "fields": {
+                            "name": _field("name", required=True),
+                            "email": _field("email"),
+                        },
+                        "methods": {"write": {"name": "write"}},
+                    },
+                    "mail.thread": {
+                        "name": "mail.thread",
+                        "type": "AbstractModel",
+                        "fields": {"message_ids": _field("message_ids")},
+                        "methods": {"message_post": {"name": "message_post"}},
+                    },
+                },
+            ),
+            "partner_mail": _module(
+                ["base"],
+                {
+                    "res.partner": {
+                        "inherit": ["res.partner", "mail.thread"],
+                        "fields": {"email": _field("email", tracking=True)},
+                        "methods": {"write": {"name": "write", "super": True}},
+                    },
+                },
+            ),
+            "partner_copy": _module(
+                ["base"],
+                {
+                    "res.partner.copy": {
+                        "name": "res.partner.copy",
+                        "inherit": "res.partner",
+                        "fields": {"copy_ref": _field("copy_ref")},
+                    },
+                    "res.users": {
+                        "name": "res.users",
+                        "inherits": {"res.partner": "partner_id"},
+                        "fields": {"login": _field("login")},
+                    },
+                },
+            ),
+            "partner_extra": _module(
+                ["partner_mail"],
+                {
+                    "res.partner": {
+                        "inherit": "res.partner",
+                        "fields": {"extra": _field("extra")},
+                    },
+                },
+            ),
+        }
+        self.resolver = ModelResolver(self.data)
+
+    def test_fields(self):
+        fields = self.resolver.fields("res.partner")
+        self.assertEqual(sorted(fields), ["email", "extra", "message_ids", "name"])
+        self.assertEqual(fields["name"]["module"], "base")
+        self.assertEqual(fields["email"]["module"], "partner_mail")
+        self.assertEqual(fields["email"]["modules"], ["base", "partner_mail"])
+        self.assertEqual(fields["email"]["kwargs"], {"tracking": True})
+        self.assertEqual(fields["extra"]["module"], "partner_extra")
+        self.assertEqual(fields["message_ids"]["module"], "base")
+        methods = self.resolver.methods("res.partner")
+        self.assertEqual(methods["write"]["modules"], ["base", "partner_mail"])
+
+    def test_installed_modules(self):
+        fields = self.resolver.fields("res.partner", modules=["base"])
+        self.assertEqual(sorted(fields), ["email", "name"])
+        self.assertNotIn("tracking", fields["email"].get("kwargs", {}))
+        # Dependencies are installed too
+        resolved = self.resolver.resolve("res.partner", modules="partner_extra")
+        self.assertEqual(resolved["modules"], ["base", "partner_mail", "partner_extra"])
+        self.assertIsNone(self.resolver.resolve("res.users", modules=["base"]))
+        self.assertEqual(
+            self.resolver.models(["partner_mail"]), ["mail.thread", "res.partner"]
+        )
+
+    def test_inheritance(self):
+        # Prototype inheritance: fields of the parent, as extended by all
+        # installed modules
+        fields = self.resolver.fields("res.partner.copy")
+        self.assertEqual(
+            sorted(fields), ["copy_ref", "email", "extra", "message_ids", "name"]
+        )
+        self.assertEqual(fields["copy_ref"]["module"], "partner_copy")
+        self.assertEqual(fields["extra"]["module"], "partner_extra")
+        # Delegation: fields of the parent are available on the model
+        fields = self.resolver.fields("res.users", modules=["partner_copy"])
+        self.assertEqual(sorted(fields), ["email", "login", "name"])
+        self.assertEqual(fields["name"]["delegated"], "res.partner")
+        self.assertNotIn("delegated", fields["login"])
+
+    def test_cache(self):
+        resolved = self.resolver.resolve("res.partner", modules=["partner_mail"])
+        self.assertIs(
+            self.resolver.resolve("res.partner", modules=["base", "partner_mail"]),
+            resolved,
+        )
+        self.assertIsNot(self.resolver.resolve("res.partner"), resolved)
+
+    def test_inheritance_cycle(self):
+        data = {
+            "base": _module(
+                [],
+                {
+                    "a": {
+                        "name": "a",
+                        "inherit": "b",
+                        "fields": {"f_a": _field("f_a")},
+                    },
+                    "b": {
+                        "name": "b",
+                        "inherit": "a",
+                        "fields": {"f_b": _field("f_b")},
+                    },
+                },
+            ),
+        }
+        resolver = ModelResolver(data)
+        self.assertEqual(sorted(resolver.fields("a")), ["f_a", "f_b"])
+        self.assertEqual(sorted(resolver.fields("b")), ["f_a", "f_b"])
+
+    def test_override_index(self):
+        self.data["partner_extra"]["models"]["res.partner"]["methods"] = {
+            "write": {"name": "write", "lineno": 10},
+            "message_post": {"name": "message_post", "super": True},
+        }
+        index = OverrideIndex(ModelResolver(self.data))
+        chain = index.chain("res.partner", "write")
+        self.assertEqual(
+            [(o["module"], o["model"], o["super"]) for o in chain],
+            [
+                ("base", "res.partner", False),
+                ("partner_mail", "res.partner", True),
+                ("partner_extra", "res.partner", False),
+            ],
+        )
+        self.assertEqual(chain[-1]["lineno"], 10)
+        self.assertEqual(index.breaks("res.partner", "write"), [chain[-1]])
+        # Definitions of the inherited models come first
+        self.assertEqual(
+            [
+                (o["module"], o["model"])
+                for o in index.chain("res.partner", "message_post")
+            ],
+            [("base", "mail.thread"), ("partner_extra", "res.partner")],
+        )
+        self.assertEqual(index.chain("res.partner", "unknown"), [])
+        # Installed modules only
+        index = OverrideIndex(ModelResolver(self.data), modules=["partner_mail"])
+        self.assertEqual(len(index.chain("res.partner", "write")), 2)
+
+    def test_base_classes(self):
+        self.data["__odoo__"] = {
+            "models": {
+                "BaseModel": {
+                    "class_name": "BaseModel",
+                    "type": None,
+                    "fields": {
+                        "id": _field("id"),
+                        "display_name": _field("display_name"),
+                    },
+                    "methods": {"write": {"name": "write"}},
+                },
+                # 'AbstractModel = BaseModel' is not a class
+                "Model": {"class_name": "Model", "type": "AbstractModel"},
+                "TransientModel": {
+                    "class_name": "TransientModel",
+                    "type": "Model",
+                    "methods": {"_transient_vacuum": {"name": "_transient_vacuum"}},
+                },
+            },
+        }
+        self.data["partner_copy"]["models"]["res.partner.wizard"] = {
+            "name": "res.partner.wizard",
+            "type": "TransientModel",
+        }
+        resolver = ModelResolver(self.data)
+        self.assertNotIn("BaseModel", resolver.models())
+        fields = resolver.fields("res.partner", modules=["base"])
+        self.assertEqual(sorted(fields), ["display_name", "email", "id", "name"])
+        self.assertEqual(fields["id"]["module"], "__odoo__")
+        methods = resolver.methods("res.partner")
+        self.assertNotIn("_transient_vacuum", methods)
+        self.assertEqual(
+            [(o["module"], o["model"]) for o in methods["write"]["overrides"]],
+            [
+                ("__odoo__", "BaseModel"),
+                ("base", "res.partner"),
+                ("partner_mail", "res.partner"),
+            ],
+        )
+        methods = resolver.methods("res.partner.wizard")
+        self.assertEqual(sorted(methods), ["_transient_vacuum", "write"])
+        # Delegated fields don't override the base ones
+        fields = resolver.fields("res.users")
+        self.assertNotIn("delegated", fields["id"])
+        self.assertEqual(fields["name"]["delegated"], "res.partner")
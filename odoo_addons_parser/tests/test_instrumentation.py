@@ -0,0 +1,53 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+from odoo_addons_parser import Instrumentation
+
+from . import common
+
+
+class TestInstrumentation(common.CommonCase):
+    def _check_metrics(self, instrumentation):
+        phases = instrumentation.phases
+        for phase in (
+            "module",
+            "walk",
+            "manifest",
+            "code_stats",
+            "py_file",
+            "xml_file",
+            "csv_file",
+            "merge",
+        ):
+            self.assertIn(phase, phases)
+            self.assertGreater(phases[phase]["count"], 0)
+            self.assertGreaterEqual(phases[phase]["wall"], 0)
+        self.assertEqual(phases["module"]["count"], 1)
+        self.assertEqual(phases["csv_file"]["count"], 1)
+        self.assertGreater(phases["py_file"]["bytes"], 0)
+        self.assertEqual(list(instrumentation.modules), [self.module_name])
+        self.assertEqual(
+            instrumentation.modules[self.module_name]["py_file"],
+            phases["py_file"],
+        )
+
+    def test_module_parser(self):
+        instrumentation = Instrumentation()
+        self._run_module_parser(instrumentation=instrumentation)
+        self._check_metrics(instrumentation)
+
+    def test_repository_parser_workers(self):
+        done = []
+        instrumentation = Instrumentation(
+            callback=lambda module, metrics: done.append(module)
+        )
+        repo = self._run_repo_parser(workers=2, instrumentation=instrumentation)
+        repo_data = self._order_repo_data(repo.to_dict())
+        self.assertDictEqual(repo_data, {self.module_name: self.module_to_dict})
+        self._check_metrics(instrumentation)
+        self.assertEqual(done, [self.module_name])
+
+    def test_disabled(self):
+        mod = self._run_module_parser()
+        self.assertFalse(mod.instrumentation.enabled)
+        self.assertFalse(mod.instrumentation.phases)
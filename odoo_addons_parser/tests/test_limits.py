@@ -0,0 +1,97 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pickle
+import signal
+import time
+import unittest
+
+from odoo_addons_parser.limits import (
+    ScanTimeoutError,
+    time_limit,
+    time_limits_available,
+)
+
+from . import common
+
+# Budget exceeded as soon as any work is done
+TINY_BUDGET = 0.000001
+
+
+@unittest.skipUnless(time_limits_available(), "Time limits not supported")
+class TestLimits(common.CommonCase):
+    def test_time_limit(self):
+        with self.assertRaises(ScanTimeoutError) as err:
+            with time_limit(0.01, "file"):
+                time.sleep(1)
+        self.assertEqual(err.exception.scope, "file")
+        # No limit
+        with time_limit(None, "file"):
+            time.sleep(0.01)
+
+    def test_time_limit_nested(self):
+        with self.assertRaises(ScanTimeoutError) as err:
+            with time_limit(0.01, "module"):
+                try:
+                    with time_limit(10, "file"):
+                        time.sleep(1)
+                except ScanTimeoutError as exc:
+                    if exc.scope == "file":
+                        self.fail("The file budget is not exceeded")
+                    raise
+        self.assertEqual(err.exception.scope, "module")
+
+    def test_time_limit_restore_handler(self):
+        def handler(signum, frame):
+            pass
+
+        previous = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, previous)
+        with time_limit(10, "module"):
+            with time_limit(10, "file"):
+                pass
+            self.assertIsNot(signal.getsignal(signal.SIGALRM), handler)
+        self.assertIs(signal.getsignal(signal.SIGALRM), handler)
+
+    def test_timeout_pickle(self):
+        exc = pickle.loads(pickle.dumps(ScanTimeoutError("module", 5)))
+        self.assertEqual(exc.scope, "module")
+        self.assertEqual(exc.seconds, 5)
+
+    def test_module_file_timeout(self):
+        mod = self._run_module_parser(file_timeout=TINY_BUDGET)
+        data = mod.to_dict()
+        self.assertTrue(data["skipped_files"])
+        self.assertEqual(set(data["skipped_files"][0]), {"file_path", "reason"})
+
+    def test_repository_module_timeout(self):
+        events = []
+        repo = self._run_repo_parser(module_timeout=TINY_BUDGET, callback=events.append)
+        data = repo.to_dict()
+        self.assertIn("ScanTimeoutError", data[self.module_name]["error"])
+        self.assertEqual(events[-1]["event"], "module_failed")
+
+    def test_repository_workers_recycled(self):
+        repo = self._run_repo_parser(
+            workers=1, file_timeout=TINY_BUDGET, max_tasks_per_worker=10
+        )
+        data = repo.to_dict()
+        self.assertTrue(data[self.module_name]["skipped_files"])
+
+    def test_repository_workers_max_tasks(self):
+        # Workers interrupted by a limit are not reused
+        repo = self._run_repo_parser(workers=1, module_timeout=60)
+        self.assertEqual(repo._get_max_tasks_per_worker(), 1)
+        repo = self._run_repo_parser(
+            workers=1, module_timeout=60, max_tasks_per_worker=5
+        )
+        self.assertEqual(repo._get_max_tasks_per_worker(), 5)
+        repo = self._run_repo_parser(workers=1)
+        self.assertIsNone(repo._get_max_tasks_per_worker())
+
+    def test_repository_workers_no_limit_exceeded(self):
+        repo = self._run_repo_parser(
+            workers=1, file_timeout=60, module_timeout=60, worker_memory_limit=2**34
+        )
+        data = self._order_repo_data(repo.to_dict())
+        self.assertDictEqual(data, {self.module_name: self.module_to_dict})
@@ -0,0 +1,37 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+from odoo_addons_parser import ManifestParser
+
+from . import common
+
+
+class TestManifest(common.CommonCase):
+    def test_to_dict(self):
+        data = ManifestParser(self.repo_path).to_dict()
+        self.assertDictEqual(
+            data,
+            {
+                self.module_name: {
+                    "name": self.module_name,
+                    "manifest": self.module_manifest,
+                }
+            },
+        )
+
+    def test_to_dict_workers(self):
+        parser = ManifestParser([self.repo_path], workers=2)
+        self.assertEqual(
+            parser.to_dict()[self.module_name]["manifest"], self.module_manifest
+        )
+
+    def test_to_dict_same_as_module_parser(self):
+        mod = self._run_module_parser(
+            code_stats=False, scan_models=False, scan_data=False
+        )
+        data = ManifestParser(self.repo_path).to_dict()
+        self.assertDictEqual(data[self.module_name], mod.to_dict())
+
+    def test_module_paths_first_wins(self):
+        parser = ManifestParser([self.repo_path, self.repo_path])
+        self.assertEqual(parser.module_paths, [self.module_path])
@@ -4,6 +4,7 @@
 import copy
 
 from odoo_addons_parser import ModuleParser
+from odoo_addons_parser.code import PyFile
 
 from . import common
 
@@ -79,3 +80,77 @@ class TestModule(common.CommonCase):
         del mod_to_dict["data"]
         del mod_to_dict["demo"]
         self.assertDictEqual(mod.to_dict(), mod_to_dict)
+
+    def test_to_dict_manifest_only(self):
+        mod = self._run_module_parser(
+            code_stats=False, scan_models=False, scan_data=False
+        )
+        self.assertDictEqual(
+            mod.to_dict(),
+            {"name": self.module_name, "manifest": self.module_manifest},
+        )
+
+    def test_file_paths_pruned(self):
+        mod = self._run_module_parser()
+        all_suffixes = {path.suffix for path in mod.file_paths}
+        self.assertEqual(all_suffixes, {".py", ".xml", ".csv"})
+        mod = self._run_module_parser(code_stats=False, scan_data=False)
+        self.assertEqual({path.suffix for path in mod.file_paths}, {".py"})
+        mod = self._run_module_parser(code_stats=False, scan_models=False)
+        relative_paths = [path.relative_to(self.module_path) for path in mod.file_paths]
+        self.assertEqual({path.suffix for path in relative_paths}, {".xml", ".csv"})
+        self.assertFalse([path for path in relative_paths if path.parts[0] == "tests"])
+
+    def test_pyfile_parse_files(self):
+        paths = sorted(self.module_path.glob("**/*.py"))
+        pyfiles = PyFile.parse_files(iter(paths), module_path=self.module_path)
+        for path, pyfile in zip(paths, pyfiles):
+            self.assertEqual(pyfile.path, path)
+            self.assertDictEqual(
+                pyfile.to_dict(),
+                PyFile(path, module_path=self.module_path).to_dict(),
+            )
+        self.assertIsNone(next(pyfiles, None))
+
+    def test_pyfile_prefilter(self):
+        init_path = self.module_path.joinpath("__init__.py")
+        self.assertFalse(PyFile(init_path).parsed)
+        self.assertTrue(PyFile(init_path, prefilter=False).parsed)
+        # Same output with or without the pre-filter
+        for path in self.module_path.glob("**/*.py"):
+            self.assertDictEqual(
+                PyFile(path, module_path=self.module_path).to_dict(),
+                PyFile(path, module_path=self.module_path, prefilter=False).to_dict(),
+            )
+
+    def test_pyfile_super(self):
+        path = self.module_path.joinpath("models", "res_partner.py")
+        content = (
+            b"class ResPartner(models.Model):\n"
+            b"    _inherit = 'res.partner'\n\n"
+            b"    def write(self, vals):\n"
+            b"        return super().write(vals)\n\n"
+            b"    def unlink(self):\n"
+            b"        return True\n"
+        )
+        (model,) = PyFile(path, content=content).models.values()
+        self.assertTrue(model["methods"]["write"]["super"])
+        self.assertNotIn("super", model["methods"]["unlink"])
+
+    def test_pyfile_edit(self):
+        path = self.module_path.joinpath("models", "res_partner.py")
+        content = path.read_bytes()
+        pyfile = PyFile(path, content=content)
+        first_key, last_key = list(pyfile.models)[0], list(pyfile.models)[-1]
+        last_model = pyfile.models[last_key]
+        # Edit the first class only
+        start = content.index(b"string=") + len(b"string=") + 1
+        models = pyfile.edit(start, start, "New ")
+        content = content[:start] + b"New " + content[start:]
+        self.assertDictEqual(models, PyFile(path, content=content).models)
+        self.assertIs(models[last_key], last_model)
+        # Insert lines at the beginning of the file: classes are moved
+        models = pyfile.apply_edits([(0, 0, "# Comment\n"), (0, 0, "\n")])
+        content = b"\n# Comment\n" + content
+        self.assertDictEqual(models, PyFile(path, content=content).models)
+        self.assertNotIn(first_key, models)
@@ -8,6 +8,7 @@ import urllib.request
 import zipfile
 
 from odoo_addons_parser import OdooParser
+from odoo_addons_parser.code import PyFile
 
 from . import common
 
@@ -99,3 +100,14 @@ class TestOdoo(common.CommonCase):
         self.assertIn("TransientModel", models)
         self.assertIn("res.partner", models)
         self.assertIn("base", models)
+
+    def test_to_dict_prefilter(self):
+        version = self.odoo_versions[-1]
+        folder_path = self.download_path.joinpath(f"odoo-{version}")
+        data = OdooParser(folder_path, code_stats=False).to_dict()
+        PyFile.prefilter = False
+        try:
+            data_no_prefilter = OdooParser(folder_path, code_stats=False).to_dict()
+        finally:
+            PyFile.prefilter = True
+        self.assertEqual(data, data_no_prefilter)
@@ -0,0 +1,48 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+import tempfile
+import unittest
+
+from odoo_addons_parser.reader import MappedFile
+
+
+class TestMappedFile(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = pathlib.Path(self.tmp_dir.name, "file.py")
+
+    def test_trailing_newline(self):
+        self.path.write_text("a = 1\n")
+        with MappedFile(self.path) as file_:
+            self.assertEqual(file_.get_lines_at(0, 0), "a = 1")
+            self.assertEqual(file_.get_lines_at(6, 6), "")
+
+    def test_empty_file(self):
+        self.path.touch()
+        with MappedFile(self.path) as file_:
+            self.assertEqual(file_.buffer, b"")
+            self.assertEqual(file_.get_lines_at(0, 0), "")
+
+    def test_close(self):
+        self.path.write_text("a = 1\n")
+        with MappedFile(self.path) as file_:
+            pass
+        with self.assertRaises(ValueError):
+            file_.buffer[0:1]
+
+    def test_get_lines_at(self):
+        content = "a = 1\nclass A:\n    b = fields.Char(\n        'B'\n    )\n"
+        self.path.write_text(content)
+        start = content.index("b =")
+        end = content.index(")") + 1
+        with MappedFile(self.path) as file_:
+            self.assertEqual(
+                file_.get_lines_at(start, end),
+                "    b = fields.Char(\n        'B'\n    )",
+            )
+            self.assertEqual(file_.get_lines_at(0, 1), "a = 1")
+            self.assertEqual(file_.get_lines_at(len(content), len(content)), "")
@@ -2,6 +2,12 @@
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
 
 import copy
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from odoo_addons_parser import RepositoryParser
 
 from . import common
 
@@ -30,3 +36,124 @@ class TestRepository(common.CommonCase):
         del mod_to_dict["models"]
         repo_data = self._order_repo_data(repo.to_dict())
         self.assertDictEqual(repo_data, {self.module_name: mod_to_dict})
+
+
+class TestRepositoryModules(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.repo_path = pathlib.Path(cls.tmp_dir.name)
+        modules = {
+            "mod_a": ["base"],
+            "mod_b": ["mod_a"],
+            "mod_c": ["mod_b", "mod_other_repo"],
+            "mod_d": ["mod_a"],
+        }
+        for module, depends in modules.items():
+            module_path = cls.repo_path.joinpath(module)
+            module_path.mkdir()
+            module_path.joinpath("__init__.py").touch()
+            module_path.joinpath("__manifest__.py").write_text(
+                repr({"name": module, "depends": depends})
+            )
+        # Unsupported XML tags make the module scan fail
+        cls.repo_path.joinpath("mod_d", "data.xml").write_text(
+            "<odoo><unsupported_tag/></odoo>"
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+        super().tearDownClass()
+
+    def test_module_paths(self):
+        repo = RepositoryParser(self.repo_path, modules=["mod_c"])
+        self.assertEqual(
+            [path.name for path in repo.module_paths], ["mod_a", "mod_b", "mod_c"]
+        )
+        self.assertEqual(len(repo.all_module_paths), 4)
+
+    def test_select(self):
+        repo = RepositoryParser(self.repo_path)
+        # Dependencies are already resolved, manifests are not read again
+        repo.read_manifest = mock.Mock(side_effect=AssertionError)
+        repo.select(["mod_a", "mod_c", "mod_other_repo"])
+        self.assertEqual([path.name for path in repo.module_paths], ["mod_a", "mod_c"])
+        self.assertTrue(repo.is_selected("mod_c"))
+        self.assertFalse(repo.is_selected("mod_b"))
+
+    def test_module_paths_unknown_module(self):
+        repo = RepositoryParser(self.repo_path, modules=["base"])
+        self.assertEqual(repo.module_paths, [])
+
+    def test_to_dict(self):
+        repo = RepositoryParser(self.repo_path, modules=["mod_b", "mod_d"])
+        self.assertEqual(sorted(repo.to_dict()), ["mod_a", "mod_b", "mod_d"])
+
+    def _test_events(self, workers):
+        events = []
+        repo = RepositoryParser(
+            self.repo_path, workers=workers, code_stats=False, callback=events.append
+        )
+        data = repo.to_dict()
+        self.assertEqual(list(data), ["mod_a", "mod_b", "mod_c", "mod_d"])
+        self.assertEqual(data["mod_a"]["name"], "mod_a")
+        self.assertIn("manifest", data["mod_a"])
+        self.assertEqual(data["mod_d"]["name"], "mod_d")
+        self.assertIn("NotImplementedError", data["mod_d"]["error"])
+        self.assertEqual(len(events), 8)
+        events_by_type = {}
+        for event in events:
+            self.assertEqual(event["repository"], repo.name)
+            events_by_type.setdefault(event["event"], []).append(event["module"])
+        self.assertEqual(
+            sorted(events_by_type["module_started"]),
+            ["mod_a", "mod_b", "mod_c", "mod_d"],
+        )
+        self.assertEqual(
+            sorted(events_by_type["module_finished"]), ["mod_a", "mod_b", "mod_c"]
+        )
+        self.assertEqual(events_by_type["module_failed"], ["mod_d"])
+        failed = [event for event in events if event["event"] == "module_failed"][0]
+        self.assertIsInstance(failed["exception"], NotImplementedError)
+        self.assertGreaterEqual(failed["wall"], 0)
+
+    def test_events(self):
+        self._test_events(workers=0)
+
+    def test_events_workers(self):
+        self._test_events(workers=2)
+
+    def test_iter_events_stop(self):
+        repo = RepositoryParser(self.repo_path, workers=2, code_stats=False)
+        for event in repo.iter_events():
+            if event["event"] == "module_finished":
+                break
+        self.assertEqual(event["event"], "module_finished")
+
+    def test_module_costs(self):
+        repo = RepositoryParser(self.repo_path, costs={"mod_b": 10.0})
+        costs = repo.module_costs()
+        self.assertEqual(sorted(costs), ["mod_a", "mod_b", "mod_c", "mod_d"])
+        self.assertEqual(costs["mod_b"], 10.0)
+        # 'mod_d' has a data file
+        self.assertGreater(costs["mod_d"], costs["mod_a"])
+
+    def test_schedule(self):
+        events = []
+        repo = RepositoryParser(
+            self.repo_path,
+            workers=1,
+            code_stats=False,
+            callback=events.append,
+            costs={"mod_a": 1, "mod_b": 3, "mod_c": 2},
+        )
+        repo.to_dict()
+        started = [
+            event["module"] for event in events if event["event"] == "module_started"
+        ]
+        # Most expensive modules first, 'mod_d' cost being estimated
+        self.assertEqual(started, ["mod_b", "mod_c", "mod_a", "mod_d"])
+        # Timings can be used as costs for the next scan
+        self.assertEqual(sorted(repo.timings), ["mod_a", "mod_b", "mod_c", "mod_d"])
@@ -0,0 +1,83 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+import tempfile
+
+from odoo_addons_parser import RepositoryParser
+from odoo_addons_parser.search import CodeIndex, _literals, sre_parse
+
+from . import common
+
+
+class TestSearch(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.index = CodeIndex()
+        self.index.add_scan({self.module_name: self.module_to_dict})
+
+    def _names(self, documents):
+        return [(doc["kind"], doc["model"], doc["name"]) for doc in documents]
+
+    def test_search(self):
+        self.assertEqual(
+            self._names(self.index.search("comodel_name=")),
+            [
+                ("field", "res.partner", "foo_id"),
+                ("field", "res.partner", "new_bar_ids"),
+            ],
+        )
+        self.assertEqual(
+            self._names(self.index.search("custom_field", kinds=("method", "view"))),
+            [
+                ("view", "res.partner", "res_partner_form_view"),
+                ("view", "res.partner", "res_partner_tree_view"),
+            ],
+        )
+        self.assertEqual(self.index.search("unknown_identifier"), [])
+        # Too short to be narrowed by the index
+        self.assertEqual(
+            len(self.index.search("=")),
+            len([doc for doc in self.index.documents if "=" in doc[-1]]),
+        )
+
+    def test_search_regex(self):
+        self.assertEqual(
+            self._names(self.index.search_regex(r"case \d+:", kinds=("method",))),
+            [("method", "res.partner", "action_custom")],
+        )
+        self.assertEqual(
+            self._names(self.index.search_regex(r"(?i)STRING=\"bars\"")),
+            [("field", "res.partner", "bar_ids")],
+        )
+
+    def test_literals(self):
+        def literals(pattern):
+            return _literals(sre_parse.parse(pattern))
+
+        self.assertEqual(literals(r"tracking=(True|1)"), ["tracking="])
+        self.assertEqual(
+            literals(r"def _compute_\w+\(self"), ["def _compute_", "(self"]
+        )
+        self.assertEqual(literals(r"(foo_id)+|bar_ids"), [])
+        self.assertEqual(literals(r"(?:store=True)?"), [])
+
+    def test_add_event(self):
+        index = CodeIndex()
+        RepositoryParser(self.repo_path, callback=index.add_event).to_dict()
+        self.assertEqual(sorted(index.documents), sorted(self.index.documents))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir, "repo.idx")
+            self.index.save(path)
+            index = CodeIndex.load(path)
+            self.assertEqual(len(index), len(self.index))
+            self.assertEqual(
+                index.search("comodel_name="), self.index.search("comodel_name=")
+            )
+            index.add("field", "other", "res.partner", "foo", "foo = fields.Char()")
+            self.assertEqual(len(index.search("fields.Char(")), 4)
+            path.write_bytes(b"not an index")
+            with self.assertRaises(ValueError):
+                CodeIndex.load(path)
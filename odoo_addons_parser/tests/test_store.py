@@ -0,0 +1,97 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import copy
+import pathlib
+import tempfile
+
+from odoo_addons_parser.store import ScanStore
+
+from . import common
+
+
+class TestStore(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.store = ScanStore()
+        self.addCleanup(self.store.close)
+        self.data = {self.module_name: copy.deepcopy(self.module_to_dict)}
+
+    def test_load(self):
+        result = self.store.load(self.data, repository="repo")
+        self.assertEqual(result["inserted"], [self.module_name])
+        self.assertEqual(self.store.modules(), [self.module_name])
+        self.assertEqual(self.store.modules("other"), [])
+        self.assertEqual(self.store.dependents("base"), [self.module_name])
+        self.assertEqual(self.store.model_modules("res.users"), [self.module_name])
+        code_stats = dict(
+            self.store.connection.execute("SELECT language, lines FROM code_stats")
+        )
+        self.assertEqual(code_stats, self.module_code_stats)
+
+    def test_fields(self):
+        self.store.load(self.data, repository="repo")
+        fields = self.store.fields(comodel="bar.model")
+        self.assertEqual(
+            [field["name"] for field in fields], ["bar_ids", "new_bar_ids"]
+        )
+        self.assertEqual(fields[0]["module"], self.module_name)
+        self.assertEqual(fields[0]["model"], "res.partner")
+        self.assertEqual(fields[0]["inverse_name"], "partner_id")
+        self.assertEqual(len(self.store.fields(model="res.partner")), 7)
+        self.assertEqual(self.store.fields(model="res.users", name="foo_id"), [])
+
+    def test_records(self):
+        self.store.load(self.data, repository="repo")
+        records = self.store.records(xmlid=f"{self.module_name}.employee")
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["kind"], "demo")
+        self.assertEqual(records[0]["data"], {"name": "Employee"})
+        records = self.store.records(model="ir.ui.menu")
+        self.assertEqual(
+            [record["id"] for record in records],
+            ["main_menu", "res_partner_menu", "submenu_menu"],
+        )
+
+    def test_load_incremental(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir, "scans.db")
+            with ScanStore(path) as store:
+                store.load(self.data, repository="repo")
+            other = copy.deepcopy(self.module_to_dict)
+            self.data["other_module"] = other
+            with ScanStore(path) as store:
+                result = store.load(self.data, repository="repo")
+                self.assertEqual(result["inserted"], ["other_module"])
+                self.assertEqual(result["unchanged"], [self.module_name])
+                other["models"]["res.users"]["fields"] = {
+                    "new_field": {"name": "new_field", "type": "Char"}
+                }
+                del self.data[self.module_name]
+                result = store.load(self.data, repository="repo")
+                self.assertEqual(result["updated"], ["other_module"])
+                self.assertEqual(result["removed"], [self.module_name])
+                self.assertEqual(store.modules(), ["other_module"])
+                self.assertEqual(
+                    [field["module"] for field in store.fields(name="new_field")],
+                    ["other_module"],
+                )
+                # Rows of the removed module are gone with it
+                records_count = sum(
+                    len(records)
+                    for kind in ("data", "demo")
+                    for records in other[kind].values()
+                )
+                count = store.connection.execute("SELECT COUNT(*) FROM records")
+                self.assertEqual(count.fetchone()[0], records_count)
+
+    def test_load_moved_code(self):
+        self.store.load(self.data, repository="repo")
+        fields = self.data[self.module_name]["models"]["res.partner"]["fields"]
+        fields["custom_field"]["lineno"] = 99
+        result = self.store.load(self.data, repository="repo")
+        self.assertEqual(result["updated"], [self.module_name])
+        self.assertEqual(
+            [field["lineno"] for field in self.store.fields(name="custom_field")],
+            [99],
+        )
@@ -56,6 +56,21 @@ class Outer:
         classes = list(ts_utils.find_class_definitions(root))
         self.assertEqual(len(classes), 2)
 
+    def test_find_class_definitions_in_range(self):
+        """Test finding class definitions overlapping a range of bytes."""
+        code = """
+class ClassA: pass
+def func():
+    class ClassB: pass
+class ClassC: pass
+"""
+        root = self._parse_code(code)
+        start = code.index("ClassB")
+        classes = list(ts_utils.find_class_definitions(root, start, start))
+        self.assertEqual([ts_utils.get_class_name(c) for c in classes], ["ClassB"])
+        classes = list(ts_utils.find_class_definitions(root, 0, len(code)))
+        self.assertEqual(len(classes), 3)
+
     def test_find_class_definitions_no_classes(self):
         """Test finding classes when there are none."""
         code = "x = 5"
@@ -377,6 +392,22 @@ class MyClass:
         name = ts_utils.get_function_name(func_node)
         self.assertEqual(name, "my_function")
 
+    # Tests for calls_super
+    def test_calls_super(self):
+        """Test detecting calls to super() in a function."""
+        cases = {
+            "def write(self, vals):\n    return super().write(vals)": True,
+            "def write(self, vals):\n    res = super(Partner, self).write(vals)": True,
+            "def write(self, vals):\n    if vals:\n        super().write(vals)": True,
+            "def write(self, vals):\n    self.superuser = True": False,
+            "def write(self, vals):\n    return self.super(vals)": False,
+            "def write(self, vals):\n    class A(B):\n        def f(self):\n            super().f()": False,
+        }
+        for code, expected in cases.items():
+            with self.subTest(code=code):
+                func_node = self._parse_code(code).children[0]
+                self.assertEqual(ts_utils.calls_super(func_node), expected)
+
     # Tests for get_function_parameters
     def test_get_function_parameters_no_params(self):
         """Test getting parameters from function with no parameters."""
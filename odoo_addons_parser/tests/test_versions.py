@@ -0,0 +1,76 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+import shutil
+import tempfile
+from unittest import mock
+
+from odoo_addons_parser.code import PyFile
+from odoo_addons_parser.versions import MultiVersionParser
+
+from . import common
+
+
+class TestMultiVersionParser(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.versions = {}
+        for version in ("17.0", "18.0"):
+            path = pathlib.Path(self.tmp_dir.name, version)
+            shutil.copytree(self.repo_path, path)
+            self.versions[version] = path
+        # One file differs between versions
+        path = self.versions["18.0"].joinpath(
+            self.module_name, "models", "res_users.py"
+        )
+        path.write_text(path.read_text() + "    new_field = fields.Char()\n")
+        self.changed_path = path
+
+    def test_to_dict(self):
+        parser = MultiVersionParser(self.versions)
+        with mock.patch.object(
+            PyFile, "__init__", side_effect=PyFile.__init__, autospec=True
+        ) as init:
+            data = parser.to_dict()
+        self.assertEqual(list(data), ["17.0", "18.0"])
+        self.assertDictEqual(
+            self._order_repo_data(data["17.0"]), {self.module_name: self.module_to_dict}
+        )
+        # Identical files are parsed once for both versions
+        parsed_paths = [call.args[1] for call in init.call_args_list]
+        py_paths = list(self.versions["17.0"].rglob("*.py"))
+        self.assertEqual(len(parsed_paths), len(py_paths) + 1)
+        self.assertIn(self.changed_path, parsed_paths)
+        models = data["18.0"][self.module_name]["models"]
+        self.assertIn("new_field", models["res.users"]["fields"])
+        self.assertNotIn(
+            "fields", data["17.0"][self.module_name]["models"]["res.users"]
+        )
+        # Same data as separate scans
+        self.assertEqual(
+            data["18.0"],
+            parser.parsers["18.0"].__class__(self.versions["18.0"]).to_dict(),
+        )
+
+    def test_to_dict_workers(self):
+        events = []
+        parser = MultiVersionParser(
+            self.versions, workers=2, code_stats=False, callback=events.append
+        )
+        data = parser.to_dict()
+        self.assertEqual(
+            data["17.0"][self.module_name]["models"].keys(),
+            self.module_to_dict["models"].keys(),
+        )
+        self.assertEqual(
+            [(event["version"], event["event"]) for event in events],
+            [
+                ("17.0", "module_started"),
+                ("17.0", "module_finished"),
+                ("18.0", "module_started"),
+                ("18.0", "module_finished"),
+            ],
+        )
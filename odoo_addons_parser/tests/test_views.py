@@ -0,0 +1,104 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+from odoo_addons_parser.views import ViewIndex
+
+from . import common
+
+
+def _view(xmlid, inherit_id=None, **data):
+    if inherit_id:
+        data["inherit_id"] = inherit_id
+    return {"id": xmlid, "model": "ir.ui.view", "type": "normal", "data": data}
+
+
+def _module(depends, views):
+    return {"manifest": {"depends": depends}, "data": {"ir.ui.view": views}}
+
+
+class TestViewIndex(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.data = {
+            "base": _module(["web"], [_view("view_partner_form", model="res.partner")]),
+            "web": _module([], [_view("layout")]),
+            "mail": _module(
+                ["base"],
+                [
+                    _view("view_partner_form", "base.view_partner_form"),
+                    _view("view_partner_form_chatter", "view_partner_form"),
+                ],
+            ),
+            "account": _module(
+                ["mail"],
+                [
+                    _view("view_partner_form", "base.view_partner_form", priority="5"),
+                    _view(
+                        "view_partner_simple", "base.view_partner_form", mode="primary"
+                    ),
+                    # Update of a view of another module
+                    _view("base.view_partner_form", model="res.partner"),
+                ],
+            ),
+        }
+        self.index = ViewIndex(self.data)
+
+    def test_views(self):
+        self.assertEqual(len(self.index), 6)
+        view = self.index.get("mail.view_partner_form")
+        self.assertEqual(view["module"], "mail")
+        self.assertEqual(view["parent"], "base.view_partner_form")
+        self.assertEqual(view["mode"], "extension")
+        self.assertEqual(
+            self.index.get("base.view_partner_form")["updated_by"], ["account"]
+        )
+        self.assertEqual(self.index.get("web.layout")["mode"], "primary")
+
+    def test_tree(self):
+        # Lower priority first, then load order
+        self.assertEqual(
+            self.index.children("base.view_partner_form"),
+            [
+                "account.view_partner_form",
+                "mail.view_partner_form",
+                "account.view_partner_simple",
+            ],
+        )
+        self.assertEqual(
+            self.index.descendants("base.view_partner_form"),
+            [
+                "account.view_partner_form",
+                "account.view_partner_simple",
+                "mail.view_partner_form",
+                "mail.view_partner_form_chatter",
+            ],
+        )
+        self.assertEqual(
+            self.index.ancestors("mail.view_partner_form_chatter"),
+            ["mail.view_partner_form", "base.view_partner_form"],
+        )
+        self.assertEqual(
+            self.index.root("mail.view_partner_form_chatter"), "base.view_partner_form"
+        )
+        # Primary views are not part of the extension chain
+        self.assertEqual(
+            self.index.chain("base.view_partner_form"),
+            [
+                "base.view_partner_form",
+                "account.view_partner_form",
+                "mail.view_partner_form",
+                "mail.view_partner_form_chatter",
+            ],
+        )
+
+    def test_scanned_module(self):
+        index = ViewIndex({self.module_name: self.module_to_dict})
+        self.assertIn(f"{self.module_name}.report_contact_badge", index)
+        self.assertEqual(
+            index.missing_parents(),
+            {
+                "base.res_partner_form_view": [
+                    f"{self.module_name}.res_partner_form_view"
+                ]
+            },
+        )
@@ -0,0 +1,67 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+import tempfile
+import threading
+import time
+import unittest
+
+from odoo_addons_parser.watch import InotifyWatcher, PollingWatcher, inotify_available
+
+
+class CommonWatcherCase:
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = pathlib.Path(self.tmp_dir.name).resolve()
+        self.path.joinpath("mod_a").mkdir()
+        self.path.joinpath("mod_a", "__manifest__.py").write_text("{}")
+        self.watcher = self._get_watcher()
+        self.addCleanup(self.watcher.close)
+
+    def test_wait(self):
+        self.assertEqual(self.watcher.wait(timeout=0.1), set())
+        manifest_path = self.path.joinpath("mod_a", "__manifest__.py")
+        manifest_path.write_text("{'name': 'A'}")
+        self.assertEqual(self.watcher.wait(timeout=5), {manifest_path})
+        # Files of new folders are detected
+        self.path.joinpath("mod_b").mkdir()
+        new_path = self.path.joinpath("mod_b", "__manifest__.py")
+        new_path.write_text("{}")
+        changes = self.watcher.wait(timeout=5)
+        # Some events of the new folder could come late
+        changes |= self.watcher.wait(timeout=0.2)
+        self.assertIn(new_path, changes)
+        manifest_path.unlink()
+        self.assertEqual(self.watcher.wait(timeout=5), {manifest_path})
+
+
+class TestPollingWatcher(CommonWatcherCase, unittest.TestCase):
+    def _get_watcher(self):
+        return PollingWatcher([self.path], interval=0.05)
+
+
+@unittest.skipUnless(inotify_available(), "inotify not available")
+class TestInotifyWatcher(CommonWatcherCase, unittest.TestCase):
+    def _get_watcher(self):
+        return InotifyWatcher([self.path])
+
+    def test_wait_timeout(self):
+        # Changes keep coming, they are returned once the time budget is spent
+        manifest_path = self.path.joinpath("mod_a", "__manifest__.py")
+        stop = threading.Event()
+
+        def write():
+            deadline = time.monotonic() + 3
+            while not stop.wait(0.01) and time.monotonic() < deadline:
+                manifest_path.write_text("{}")
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+        start = time.monotonic()
+        self.assertEqual(self.watcher.wait(timeout=0.2), {manifest_path})
+        self.assertLess(time.monotonic() - start, 1)
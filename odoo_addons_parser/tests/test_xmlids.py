@@ -0,0 +1,177 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+
+import pathlib
+
+from odoo_addons_parser import RepositoryParser
+from odoo_addons_parser.data_xml import XmlFile
+from odoo_addons_parser.xmlids import XmlIdRegistry
+
+from . import common
+
+
+def _record(xmlid, model, **data):
+    return {"id": xmlid, "model": model, "file_path": "data.xml", "data": data}
+
+
+class TestXmlIdRegistry(common.CommonCase):
+    def setUp(self):
+        super().setUp()
+        self.base = {
+            "base": {
+                "models": {
+                    "res.groups": {"name": "res.groups", "fields": {"name": {}}}
+                },
+                "data": {
+                    "res.groups": [
+                        _record("group_user", "res.groups"),
+                        _record("group_portal", "res.groups"),
+                    ],
+                    "ir.ui.menu": [_record("menu_root", "ir.ui.menu")],
+                },
+            },
+        }
+        self.addons = {
+            "partner_menu": {
+                "data": {
+                    "ir.ui.menu": [
+                        _record(
+                            "menu",
+                            "ir.ui.menu",
+                            parent_id="base.menu_root",
+                            action="action_unknown",
+                            groups_id="base.group_user,-base.group_portal",
+                        ),
+                        _record("base.menu_root", "ir.ui.menu", name="Home"),
+                    ],
+                    "ir.model.access": [
+                        _record(
+                            "access_groups",
+                            "ir.model.access",
+                            model_id="base.model_res_groups",
+                            group_id="base.group_unknown",
+                        ),
+                    ],
+                },
+                "demo": {
+                    "ir.ui.menu": [
+                        _record("menu", "ir.ui.menu", parent_id="eval(1)"),
+                    ],
+                },
+            },
+        }
+        self.registry = XmlIdRegistry()
+        self.registry.add_scan(self.base, repository="odoo")
+        self.registry.add_scan(self.addons, repository="addons")
+
+    def test_definitions(self):
+        self.assertIn("base.group_user", self.registry)
+        self.assertEqual(
+            self.registry.get("partner_menu.menu")[0],
+            {
+                "repository": "addons",
+                "module": "partner_menu",
+                "kind": "data",
+                "model": "ir.ui.menu",
+                "file_path": "data.xml",
+            },
+        )
+        # Generated by Odoo
+        for xmlid in (
+            "base.module_partner_menu",
+            "base.model_res_groups",
+            "base.field_res_groups__name",
+        ):
+            self.assertEqual(self.registry.get(xmlid)[0]["kind"], "generated")
+        # Updates of the records of other modules are not definitions
+        self.assertEqual(len(self.registry.get("base.menu_root")), 1)
+        self.assertEqual(self.registry.get("unknown.xmlid"), [])
+
+    def test_duplicates(self):
+        self.assertEqual(list(self.registry.duplicates()), ["partner_menu.menu"])
+        # Same module in two repositories
+        self.registry.add_scan(self.base, repository="odoo-fork")
+        duplicates = self.registry.duplicates()
+        self.assertIn("base.group_user", duplicates)
+        self.assertEqual(
+            [loc["repository"] for loc in duplicates["base.group_user"]],
+            ["odoo", "odoo-fork"],
+        )
+
+    def test_dangling(self):
+        self.assertEqual(
+            [(ref["xmlid"], ref["field"]) for ref in self.registry.dangling()],
+            [
+                ("partner_menu.action_unknown", "action"),
+                ("base.group_unknown", "group_id"),
+            ],
+        )
+        self.assertEqual(
+            self.registry.dangling()[0]["location"]["module"], "partner_menu"
+        )
+
+    def test_eval_references(self):
+        module_path = pathlib.Path("partner_groups")
+        content = b"""<odoo>
+            <record id="user_partner" model="res.users">
+                <field name="groups_id" eval="[(4, ref('base.group_user'))]"/>
+            </record>
+            <record id="menu_partner" model="ir.ui.menu">
+                <field
+                    name="groups_id"
+                    eval="[(6, 0, [ref('base.group_portal'), ref(&quot;group_unknown&quot;)])]"
+                />
+                <field name="parent_id" eval="False"/>
+            </record>
+        </odoo>"""
+        xml_file = XmlFile(
+            module_path, module_path.joinpath("data.xml"), loaded=True, content=content
+        )
+        self.registry.add_module("partner_groups", {"data": xml_file.to_dict()})
+        self.assertEqual(
+            [
+                (xmlid, location["model"])
+                for xmlid, __, location in self.registry.references
+                if location["module"] == "partner_groups"
+            ],
+            [
+                ("base.group_user", "res.users"),
+                ("base.group_portal", "ir.ui.menu"),
+                ("partner_groups.group_unknown", "ir.ui.menu"),
+            ],
+        )
+        self.assertIn(
+            ("partner_groups.group_unknown", "groups_id"),
+            [(ref["xmlid"], ref["field"]) for ref in self.registry.dangling()],
+        )
+
+    def test_scanned_only(self):
+        registry = XmlIdRegistry()
+        registry.add_scan(self.addons)
+        dangling = {ref["xmlid"] for ref in registry.dangling()}
+        self.assertIn("base.menu_root", dangling)
+        self.assertEqual(
+            [ref["xmlid"] for ref in registry.dangling(scanned_only=True)],
+            ["partner_menu.action_unknown"],
+        )
+
+    def test_scan_events(self):
+        registry = XmlIdRegistry()
+        RepositoryParser(self.repo_path, callback=registry.add_event).to_dict()
+        definition = registry.get(f"{self.module_name}.res_partner_menu")[0]
+        self.assertEqual(definition["repository"], self.repo_name)
+        self.assertIn(
+            (f"{self.module_name}.group_user", "group_id"),
+            [(ref["xmlid"], ref["field"]) for ref in registry.dangling()],
+        )
+
+    def test_extended_model(self):
+        registry = XmlIdRegistry()
+        registry.add_scan({self.module_name: self.module_to_dict})
+        # 'res.partner' is only extended by the module
+        self.assertEqual(
+            registry.get(f"{self.module_name}.model_res_partner")[0]["kind"],
+            "generated",
+        )
+        dangling = [ref["xmlid"] for ref in registry.dangling(scanned_only=True)]
+        self.assertNotIn(f"{self.module_name}.model_res_partner", dangling)
@@ -0,0 +1,353 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Scan modules from sources other than folders (git commits, archives).
+
+Such a source is a `Tree`: its files are listed once, then read on demand
+by the `Tree*Parser` classes, without being written to disk.
+"""
+
+import collections
+import hashlib
+import os
+import pathlib
+import typing
+
+from . import treesitter_utils as ts_utils
+from .code import PyFile
+from .module import (
+    ALWAYS_SKIPPED_DIRS,
+    BINARY_EXTENSIONS,
+    MANIFEST_FILES,
+    ModuleParser,
+    parse_manifest,
+)
+from .odoo import OdooParser
+from .repository import RepositoryParser
+
+# Type of entries: "tree" (folder), "blob" (file), or anything else (e.g.
+# symbolic links, git submodules) for entries not scanned.
+# `id` identifies the content of a file (e.g. git blob SHA), or is None
+# when the source has no such identifier (the content is then hashed).
+Entry = collections.namedtuple("Entry", ["type", "id", "size"])
+
+_FOLDER = Entry("tree", None, 0)
+
+
+class Tree:
+    """Files of a source, listed once.
+
+    Paths are `pathlib.PurePosixPath` relative to the root of the source.
+    Subclasses list their entries with `_add()` and implement `_read()`.
+    """
+
+    def __init__(self):
+        self._entries = {}  # {path: Entry}
+        self._children = {"": []}  # {folder path: [entry names]}
+
+    def _add(self, path: str, entry: Entry):
+        """Add an entry, and its parent folders if they are not listed."""
+        path = path.strip("/")
+        if not path or path in self._entries:
+            if entry.type != "tree":
+                self._entries[path] = entry
+            return
+        parent, __, name = path.rpartition("/")
+        if parent not in self._children:
+            self._add(parent, _FOLDER)
+        self._entries[path] = entry
+        self._children[parent].append(name)
+        if entry.type == "tree":
+            self._children.setdefault(path, [])
+
+    @staticmethod
+    def _key(path: typing.Union[str, os.PathLike]) -> str:
+        key = pathlib.PurePosixPath(path).as_posix()
+        return "" if key == "." else key
+
+    def get(self, path: typing.Union[str, os.PathLike]) -> typing.Optional[Entry]:
+        return self._entries.get(self._key(path))
+
+    def exists(self, path: typing.Union[str, os.PathLike]) -> bool:
+        return self._key(path) in self._children or self.get(path) is not None
+
+    def is_dir(self, path: typing.Union[str, os.PathLike]) -> bool:
+        return self._key(path) in self._children
+
+    def is_file(self, path: typing.Union[str, os.PathLike]) -> bool:
+        entry = self.get(path)
+        return entry is not None and entry.type == "blob"
+
+    def iter_dir(
+        self, path: typing.Union[str, os.PathLike]
+    ) -> typing.Iterator[tuple[pathlib.PurePosixPath, Entry]]:
+        """Yield the path and entry of each file and folder of a folder."""
+        key = self._key(path)
+        folder_path = pathlib.PurePosixPath(key)
+        for name in self._children.get(key, []):
+            child_path = folder_path.joinpath(name)
+            yield child_path, self._entries[child_path.as_posix()]
+
+    @property
+    def root(self) -> pathlib.PurePosixPath:
+        """Return the only folder at the root of the source, if any.
+
+        E.g. archives of GitHub repositories contain one `<repo>-<branch>`
+        folder.
+        """
+        names = self._children[""]
+        if len(names) == 1 and names[0] in self._children:
+            return pathlib.PurePosixPath(names[0])
+        return pathlib.PurePosixPath("")
+
+    def read(self, path: typing.Union[str, os.PathLike]) -> bytes:
+        """Return the content of a file."""
+        key = self._key(path)
+        entry = self._entries.get(key)
+        if entry is None or entry.type != "blob":
+            raise FileNotFoundError(f"'{path}' not found in {self}")
+        return self._read(key, entry)
+
+    def _read(self, path: str, entry: Entry) -> bytes:
+        raise NotImplementedError
+
+    def get_manifest_path(
+        self, folder_path: typing.Union[str, os.PathLike]
+    ) -> typing.Optional[pathlib.PurePosixPath]:
+        """Return the manifest file path of a module folder, if any."""
+        for manifest_name in MANIFEST_FILES:
+            manifest_path = pathlib.PurePosixPath(folder_path, manifest_name)
+            if self.is_file(manifest_path):
+                return manifest_path
+        return None
+
+    def read_manifest(self, folder_path: typing.Union[str, os.PathLike]) -> dict:
+        """Read the manifest of a module folder without scanning the module."""
+        manifest_path = self.get_manifest_path(folder_path)
+        if not manifest_path:
+            return {}
+        return parse_manifest(self.read(manifest_path))
+
+    def files_stats(
+        self, folder_path: typing.Union[str, os.PathLike]
+    ) -> dict[str, list[int]]:
+        """Return the number of files and their total size per file extension.
+
+        Same as `scheduling.module_files_stats()`, files are not read.
+        """
+        stats = {}
+        dir_paths = [folder_path]
+        while dir_paths:
+            for path, entry in self.iter_dir(dir_paths.pop()):
+                if entry.type == "tree":
+                    if path.name not in ALWAYS_SKIPPED_DIRS:
+                        dir_paths.append(path)
+                    continue
+                if entry.type != "blob":
+                    continue
+                ext = os.path.splitext(path.name)[1].lower()
+                if ext in BINARY_EXTENSIONS:
+                    continue
+                ext_stats = stats.setdefault(ext, [0, 0])
+                ext_stats[0] += 1
+                ext_stats[1] += entry.size
+        return stats
+
+
+class TreeModuleParser(ModuleParser):
+    """Parser of an Odoo module stored in a `Tree`.
+
+    `folder_path` is the path of the module relative to the root of the
+    tree. Files are read from the tree, and their results are cached by
+    path and content identifier (see `Entry`), or hash of their content.
+    """
+
+    def __init__(
+        self,
+        tree: Tree,
+        folder_path: typing.Union[str, os.PathLike],
+        **kwargs,
+    ):
+        self.tree = tree
+        super().__init__(folder_path, **kwargs)
+
+    def _get_folder_path(self, folder_path) -> pathlib.PurePosixPath:
+        module_path = pathlib.PurePosixPath(folder_path)
+        if not self.tree.is_dir(module_path):
+            raise ValueError(f"'{folder_path}' doesn't exist")
+        if not self._get_manifest_path(module_path):
+            raise ValueError(f"'{folder_path}' is not an Odoo module")
+        return module_path
+
+    def _get_manifest_path(self, folder_path):
+        return self.tree.get_manifest_path(folder_path)
+
+    def _walk(
+        self,
+        dir_path: pathlib.PurePosixPath,
+        skipped_dirs: set,
+        extensions: typing.Optional[set],
+    ) -> typing.Iterator[pathlib.PurePosixPath]:
+        subdirs = []
+        for path, entry in self.tree.iter_dir(dir_path):
+            if entry.type == "tree":
+                if path.name not in skipped_dirs:
+                    subdirs.append(path)
+                continue
+            if entry.type != "blob":
+                continue
+            ext = os.path.splitext(path.name)[1].lower()
+            if ext in BINARY_EXTENSIONS:
+                continue
+            if extensions is not None and ext not in extensions:
+                continue
+            yield path
+        for subdir in subdirs:
+            yield from self._walk(subdir, ALWAYS_SKIPPED_DIRS, extensions)
+
+    @property
+    def manifest(self) -> dict:
+        return self.tree.read_manifest(self.folder_path)
+
+    def _read_file(self, file_path):
+        return self._read_content(file_path)
+
+    def _read_content(self, file_path):
+        # Files are read once, to get both their hash and their data
+        if self._content is None or self._content[0] != file_path:
+            self._content = (file_path, self.tree.read(file_path))
+        return self._content[1]
+
+    def _file_phase(self, name, file_path):
+        # Paths are relative to the tree, sizes are listed with the entries
+        return self.instrumentation.phase(
+            name, self.name, bytes_=self.tree.get(file_path).size
+        )
+
+    def _get_file_key(self, file_path):
+        entry_id = self.tree.get(file_path).id
+        if entry_id is None:
+            content = self._read_content(file_path)
+            entry_id = hashlib.blake2b(content, digest_size=16).digest()
+        return (str(file_path), entry_id)
+
+
+class TreeRepositoryParser(RepositoryParser):
+    """Base class of parsers of an addons path stored in a `Tree`.
+
+    `folder_path` is the path of the addons path relative to the root of
+    the tree. Subclasses give the tree with the `tree` property.
+
+    Without workers, results of files are stored in `cache` (a mapping
+    shared between the parsers of several trees), so files unchanged
+    between these trees are parsed only once.
+    """
+
+    module_parser_class = TreeModuleParser
+
+    def __init__(
+        self,
+        folder_path: typing.Union[str, os.PathLike] = "",
+        cache: typing.Optional[typing.MutableMapping] = None,
+        **kwargs,
+    ):
+        self.cache = cache
+        super().__init__(folder_path, **kwargs)
+
+    def _get_folder_path(self, folder_path) -> pathlib.PurePosixPath:
+        return pathlib.PurePosixPath(folder_path)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Not shared with worker processes
+        state["cache"] = None
+        return state
+
+    @property
+    def tree(self) -> Tree:
+        raise NotImplementedError
+
+    @property
+    def all_module_paths(self) -> list[pathlib.PurePosixPath]:
+        tree = self.tree
+        return sorted(
+            path
+            for path, entry in tree.iter_dir(self.folder_path)
+            if entry.type == "tree" and tree.get_manifest_path(path)
+        )
+
+    def read_manifest(self, module_path):
+        return self.tree.read_manifest(module_path)
+
+    def _module_files_stats(self, module_path):
+        return self.tree.files_stats(module_path)
+
+    def get_module_parser(
+        self, module_path, instrumentation=None, code_stats=None, cache=None
+    ) -> TreeModuleParser:
+        return self.module_parser_class(
+            self.tree,
+            module_path,
+            languages=self.languages,
+            repo_parser=self,
+            code_stats=self._code_stats if code_stats is None else code_stats,
+            scan_models=self._scan_models,
+            instrumentation=instrumentation or self.instrumentation,
+            file_timeout=self.file_timeout,
+            cache=self.cache if cache is None else cache,
+        )
+
+
+class TreeOdooParser(OdooParser):
+    """Base class of parsers of the Odoo repository stored in a `Tree`.
+
+    `folder_path` is the path of the Odoo repository relative to the root
+    of the tree. Subclasses give the tree with the `tree` property, and
+    create the parsers of the addons paths with `_new_repository_parser()`.
+    """
+
+    def __init__(
+        self,
+        folder_path: typing.Union[str, os.PathLike] = "",
+        cache: typing.Optional[typing.MutableMapping] = None,
+        **kwargs,
+    ):
+        self.cache = cache
+        super().__init__(folder_path, **kwargs)
+
+    @property
+    def tree(self) -> Tree:
+        raise NotImplementedError
+
+    def _get_folder_path(self, folder_path) -> pathlib.PurePosixPath:
+        return pathlib.PurePosixPath(folder_path)
+
+    def _exists(self, path):
+        return self.tree.exists(self.folder_path.joinpath(path))
+
+    def _parse_base_models(self):
+        parser = ts_utils.get_parser()
+        for path in self._base_models_paths:
+            path = self.folder_path.joinpath(path)
+            yield PyFile(
+                path,
+                module_path=self.folder_path,
+                parser=parser,
+                content=self.tree.read(path),
+            )
+
+    def _new_repository_parser(self, folder_path, **kwargs) -> TreeRepositoryParser:
+        raise NotImplementedError
+
+    def _get_repository_parser(self, addons_path):
+        return self._new_repository_parser(
+            self.folder_path.joinpath(addons_path),
+            languages=self.languages,
+            name=str(addons_path),
+            workers=self.workers,
+            code_stats=self._code_stats,
+            scan_models=self._scan_models,
+            instrumentation=self.instrumentation,
+            callback=self.callback,
+            costs=self.costs,
+            cache=self.cache,
+        )
@@ -14,12 +14,48 @@ def get_parser() -> Parser:
     return parser
 
 
-def find_class_definitions(node: Node) -> typing.Iterator[Node]:
-    """Yield all class definition nodes."""
-    if node.type == "class_definition":
-        yield node
-    for child in node.children:
-        yield from find_class_definitions(child)
+# Statements that can't contain class definitions, not walked through
+# (e.g. fields declarations are expression statements)
+SIMPLE_STATEMENTS = frozenset(
+    [
+        "assert_statement",
+        "comment",
+        "delete_statement",
+        "expression_statement",
+        "global_statement",
+        "import_from_statement",
+        "import_statement",
+        "nonlocal_statement",
+        "raise_statement",
+        "return_statement",
+    ]
+)
+
+
+def find_class_definitions(
+    node: Node,
+    start_byte: typing.Optional[int] = None,
+    end_byte: typing.Optional[int] = None,
+) -> typing.Iterator[Node]:
+    """Yield all class definition nodes.
+
+    If `start_byte` and `end_byte` are set, only classes overlapping this
+    range of bytes are returned.
+    """
+    # Iterative depth-first walk, yielding classes in the order of the file
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.type == "class_definition":
+            yield node
+        for child in reversed(node.children):
+            if child.type in SIMPLE_STATEMENTS:
+                continue
+            if start_byte is not None and (
+                child.end_byte < start_byte or child.start_byte > end_byte
+            ):
+                continue
+            stack.append(child)
 
 
 def get_class_name(class_node: Node) -> typing.Optional[str]:
@@ -277,6 +313,29 @@ def get_function_parameters(func_node: Node) -> typing.Tuple[str, ...]:
     return tuple(signature)
 
 
+def calls_super(func_node: Node) -> bool:
+    """Check if a function calls `super()` (e.g. `super().write(vals)`).
+
+    Nested classes are not walked, their calls to `super()` are their own.
+    """
+    assert func_node.type == "function_definition"
+    body = func_node.child_by_field_name("body")
+    # Cheap check on the source before walking the nodes
+    if body is None or b"super" not in body.text:
+        return False
+    stack = [body]
+    while stack:
+        node = stack.pop()
+        if node.type == "call":
+            function = node.child_by_field_name("function")
+            if function.type == "identifier" and function.text == b"super":
+                return True
+        for child in node.children:
+            if child.type != "class_definition":
+                stack.append(child)
+    return False
+
+
 def get_decorator_name(decorator_node: Node) -> str:
     """Get the decorator name/identifier."""
     assert decorator_node.type == "decorator"
@@ -0,0 +1,141 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Scan several versions of a repository, parsing identical files once."""
+
+import multiprocessing
+import os
+import pathlib
+import typing
+
+from .odoo import OdooParser
+from .repository import MODULE_FAILED, RepositoryParser, _picklable_exception
+
+
+def _scan_versions(task: tuple) -> list[dict]:
+    """Scan a module in several versions, return the related events.
+
+    Files results are shared by the versions (see `ModuleParser.cache`).
+    """
+    module, locations = task
+    cache = {}
+    events = []
+    for version, repo_index, repo, module_path in locations:
+        for event in repo._iter_module_events(module_path, cache=cache):
+            if event["event"] == MODULE_FAILED:
+                event["exception"] = _picklable_exception(event["exception"])
+            event.update(version=version, repository_index=repo_index)
+            events.append(event)
+    return events
+
+
+class MultiVersionParser:
+    """Parser of several checkouts of a repository, e.g. one per Odoo version.
+
+    `folder_paths` maps a version name to the path of its checkout, scanned
+    with an `OdooParser` if `odoo` is set, a `RepositoryParser` otherwise
+    (`options` are given to them).
+
+    Modules are scanned one after the other in all versions, files being
+    identified by a hash of their content (see `hash_files`): a file
+    identical in several versions is parsed once, its results being shared
+    by all of them. With `workers`, each module is scanned in all versions
+    by the same worker.
+
+    To scan several versions from git objects without checkouts, give a
+    shared cache to `GitRepositoryParser` instead (files are identified by
+    their blob SHA).
+
+    E.g:
+        >>> parser = MultiVersionParser({"17.0": "./odoo-17", "18.0": "./odoo-18"}, odoo=True)
+        >>> data = parser.to_dict()
+        >>> list(data)
+        ['17.0', '18.0']
+    """
+
+    def __init__(
+        self,
+        folder_paths: typing.Mapping[str, typing.Union[str, os.PathLike]],
+        odoo: bool = False,
+        workers: int = 0,
+        callback: typing.Optional[typing.Callable[[dict], None]] = None,
+        **options,
+    ):
+        self.folder_paths = {
+            version: pathlib.Path(path).resolve()
+            for version, path in folder_paths.items()
+        }
+        self.odoo = odoo
+        self.workers = workers
+        self.callback = callback
+        parser_class = OdooParser if odoo else RepositoryParser
+        self.parsers = {
+            version: parser_class(path, hash_files=True, **options)
+            for version, path in self.folder_paths.items()
+        }
+
+    def _get_repositories(self, version: str) -> list[RepositoryParser]:
+        parser = self.parsers[version]
+        # OdooParser is a set of repositories
+        return getattr(parser, "repositories", [parser])
+
+    @property
+    def tasks(self) -> list[tuple[str, list[tuple]]]:
+        """Return the modules to scan, with their location in each version.
+
+        Locations are `(version, repository index, repository, module path)`.
+        """
+        tasks = {}
+        for version in self.parsers:
+            repositories = self._get_repositories(version)
+            for repo_index, repo in enumerate(repositories):
+                for module_path in repo.module_paths:
+                    tasks.setdefault(module_path.name, []).append(
+                        (version, repo_index, repo, module_path)
+                    )
+        return sorted(tasks.items())
+
+    def iter_events(self) -> typing.Iterator[dict]:
+        """Scan modules and yield events, see `RepositoryParser.iter_events()`.
+
+        Events have two extra keys: `version`, and `repository_index` (index
+        of the repository in the `OdooParser` of this version). Events of a
+        module are yielded once it is scanned in all versions.
+        """
+        tasks = self.tasks
+        if self.workers:
+            chunksize = max(1, len(tasks) // (self.workers * 4))
+            with multiprocessing.Pool(self.workers) as pool:
+                for events in pool.imap_unordered(
+                    _scan_versions, tasks, chunksize=chunksize
+                ):
+                    yield from events
+        else:
+            for task in tasks:
+                yield from _scan_versions(task)
+
+    def to_dict(self) -> dict:
+        """Return the data of each version (as its parser `to_dict()` does)."""
+        repos_data = {
+            version: [{} for __ in self._get_repositories(version)]
+            for version in self.parsers
+        }
+        for event in self.iter_events():
+            if self.callback:
+                self.callback(event)
+            module_data = RepositoryParser._get_event_data(event)
+            if module_data is not None:
+                version_data = repos_data[event["version"]]
+                version_data[event["repository_index"]][event["module"]] = module_data
+        data = {}
+        for version, parser in self.parsers.items():
+            # Workers return modules in completion order
+            version_repos_data = [
+                dict(sorted(repo_data.items())) for repo_data in repos_data[version]
+            ]
+            if isinstance(parser, OdooParser):
+                data[version] = parser.base_models_to_dict()
+                for repo_data in version_repos_data:
+                    parser._merge_repository_data(data[version], repo_data)
+            else:
+                data[version] = version_repos_data[0]
+        return data
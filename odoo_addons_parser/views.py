@@ -0,0 +1,177 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Index the inheritance tree of views across modules.
+
+Views are the `ir.ui.view` records and QWeb templates of the scanned
+modules, linked to the view they extend (`inherit_id`) by full XML ID.
+"""
+
+import typing
+
+from .data_xml import get_full_xmlid
+from .diff import RECORDS_KEYS
+from .graph import DependencyGraph
+
+# Default priority of views, as in Odoo
+DEFAULT_PRIORITY = 16
+
+
+class ViewIndex:
+    """Inheritance tree of the views of scanned modules.
+
+    `datasets` are outputs of `RepositoryParser.to_dict()` or
+    `OdooParser.to_dict()` (when a module is available in several of them,
+    the first one wins). Modules are added in the order of their
+    dependencies, given by `graph` (built from the manifests by default),
+    which is the order inheriting views are applied in (after their
+    priority).
+
+    Views are dicts with their full `xmlid`, the `module` defining them,
+    `parent` (full XML ID of the view extended, if any), `model`, `type`,
+    `mode`, `priority` and `file_path`. Modules updating a view defined by
+    another one are listed in its `updated_by`.
+
+    E.g:
+        >>> index = ViewIndex(OdooParser("./odoo").to_dict())
+        >>> index.children("base.view_partner_form")
+        ['account.view_partner_property_form', ...]
+    """
+
+    def __init__(self, *datasets: dict, graph: typing.Optional[DependencyGraph] = None):
+        self.graph = graph or DependencyGraph.from_dict(*datasets)
+        modules = {}
+        for data in datasets:
+            for module, module_data in data.items():
+                modules.setdefault(module, module_data)
+        order = [module for module in self.graph.load_order() if module in modules]
+        # Modules without manifest (e.g. '__odoo__') are not in the graph
+        order.extend(module for module in modules if module not in self.graph)
+        self.views = {}  # {xmlid: view}
+        self._children = {}  # {parent xmlid: [child xmlid]}
+        self._sequence = {}  # {xmlid: rank of its definition}
+        for module in order:
+            self.add_module(module, modules[module])
+
+    def __contains__(self, xmlid: str) -> bool:
+        return xmlid in self.views
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def add_module(self, module: str, module_data: dict):
+        """Add the views of a module, after the ones of its dependencies."""
+        for records_key in RECORDS_KEYS:
+            for record in module_data.get(records_key, {}).get("ir.ui.view", []):
+                self._add_view(module, record)
+
+    def _add_view(self, module: str, record: dict):
+        xmlid = get_full_xmlid(module, record.get("id"))
+        if not xmlid:
+            return
+        data = record.get("data", {})
+        parent = get_full_xmlid(module, data.get("inherit_id"))
+        view = self.views.get(xmlid)
+        if view is None:
+            view = self.views[xmlid] = {
+                "xmlid": xmlid,
+                "module": module,
+                "parent": None,
+                "model": record.get("target_model") or data.get("model"),
+                "type": record.get("type"),
+                "mode": data.get("mode") or ("extension" if parent else "primary"),
+                "priority": self._get_priority(data),
+                "file_path": record.get("file_path"),
+                "updated_by": [],
+            }
+            self._sequence[xmlid] = len(self._sequence)
+        elif module != view["module"] and module not in view["updated_by"]:
+            view["updated_by"].append(module)
+        if parent and parent != view["parent"]:
+            if view["parent"]:
+                self._children[view["parent"]].remove(xmlid)
+            view["parent"] = parent
+            self._children.setdefault(parent, []).append(xmlid)
+
+    @staticmethod
+    def _get_priority(data: dict) -> int:
+        try:
+            return int(data.get("priority") or DEFAULT_PRIORITY)
+        except ValueError:
+            return DEFAULT_PRIORITY
+
+    def get(self, xmlid: str) -> typing.Optional[dict]:
+        """Return a view by full XML ID."""
+        return self.views.get(xmlid)
+
+    def children(self, xmlid: str) -> list[str]:
+        """Return the views extending directly the view `xmlid`, in the
+        order they are applied (priority, then load order).
+        """
+        return sorted(
+            self._children.get(xmlid, []),
+            key=lambda child: (
+                self.views[child]["priority"],
+                self._sequence[child],
+            ),
+        )
+
+    def descendants(self, xmlid: str) -> list[str]:
+        """Return all the views extending the view `xmlid`, directly or not."""
+        result = set()
+        stack = [xmlid]
+        while stack:
+            for child in self._children.get(stack.pop(), []):
+                # Skip inheritance cycles
+                if child not in result:
+                    result.add(child)
+                    stack.append(child)
+        return sorted(result)
+
+    def ancestors(self, xmlid: str) -> list[str]:
+        """Return the views extended by the view `xmlid`, up to its root."""
+        result = []
+        view = self.views.get(xmlid)
+        while view and view["parent"] and view["parent"] not in result:
+            result.append(view["parent"])
+            view = self.views.get(view["parent"])
+        return result
+
+    def root(self, xmlid: str) -> str:
+        """Return the root view of the view `xmlid` (itself if it has no parent).
+
+        The root may be missing from the scanned modules.
+        """
+        ancestors = self.ancestors(xmlid)
+        return ancestors[-1] if ancestors else xmlid
+
+    def chain(self, xmlid: str) -> list[str]:
+        """Return the extension chain of the view `xmlid`: the view then the
+        views extending it, in the order they are applied.
+
+        Views in `primary` mode are separate views (only their own
+        extensions are applied on them): they are not part of the chain.
+        """
+        result = []
+        stack = [xmlid]
+        while stack:
+            current = stack.pop()
+            if current in result:
+                # Inheritance cycle
+                continue
+            result.append(current)
+            stack.extend(
+                child
+                for child in reversed(self.children(current))
+                if self.views[child]["mode"] != "primary"
+            )
+        return result
+
+    def missing_parents(self) -> dict[str, list[str]]:
+        """Return the views extending views missing from the scanned modules,
+        by missing view.
+        """
+        return {
+            parent: sorted(children)
+            for parent, children in sorted(self._children.items())
+            if parent not in self.views
+        }
@@ -0,0 +1,272 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Watch folders for changed files, with inotify or by polling."""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import time
+import typing
+
+from .module import ALWAYS_SKIPPED_DIRS
+
+_logger = logging.getLogger(__name__)
+
+# Folders not watched
+SKIPPED_DIRS = ALWAYS_SKIPPED_DIRS | {".git"}
+
+# inotify constants (see 'man inotify')
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _iter_dirs(folder_path: str) -> typing.Iterator[str]:
+    """Yield `folder_path` and all its sub-folders (symbolic links ignored)."""
+    yield folder_path
+    try:
+        with os.scandir(folder_path) as entries:
+            subdirs = [
+                entry.path
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and entry.name not in SKIPPED_DIRS
+            ]
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_dirs(subdir)
+
+
+class Watcher:
+    """Base class of watchers.
+
+    `wait()` returns the paths of files created, modified or deleted under
+    the watched folders since its last call. A watched folder itself is
+    returned when the changes it contains are unknown (e.g. events lost).
+    """
+
+    def __init__(self, folder_paths: typing.Iterable[typing.Union[str, os.PathLike]]):
+        self.folder_paths = [pathlib.Path(path).resolve() for path in folder_paths]
+
+    def wait(self, timeout: typing.Optional[float] = None) -> set[pathlib.Path]:
+        """Wait for changes during `timeout` seconds at most, return them."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+class PollingWatcher(Watcher):
+    """Watcher comparing the modification time and size of files regularly."""
+
+    def __init__(
+        self,
+        folder_paths: typing.Iterable[typing.Union[str, os.PathLike]],
+        interval: float = 1.0,
+    ):
+        super().__init__(folder_paths)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict:
+        snapshot = {}
+        for folder_path in self.folder_paths:
+            for dir_path in _iter_dirs(str(folder_path)):
+                try:
+                    with os.scandir(dir_path) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                continue
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changes = {
+                pathlib.Path(path)
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changes:
+                return changes
+            if deadline is None:
+                delay = self.interval
+            else:
+                delay = min(self.interval, deadline - time.monotonic())
+                if delay <= 0:
+                    return changes
+            time.sleep(delay)
+
+
+def inotify_available() -> bool:
+    return sys.platform.startswith("linux") and bool(_get_libc())
+
+
+def _get_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class InotifyWatcher(Watcher):
+    """Watcher based on Linux inotify.
+
+    Each folder is watched (inotify is not recursive), new folders being
+    watched as soon as they are created.
+    """
+
+    def __init__(self, folder_paths: typing.Iterable[typing.Union[str, os.PathLike]]):
+        super().__init__(folder_paths)
+        self._libc = _get_libc()
+        if self._libc is None:
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._dirs = {}  # {watch descriptor: folder path}
+        for folder_path in self.folder_paths:
+            self._add_watches(str(folder_path))
+
+    def _add_watches(self, folder_path: str) -> list[str]:
+        """Watch a folder and its sub-folders, return their paths."""
+        dir_paths = []
+        for dir_path in _iter_dirs(folder_path):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(dir_path), WATCH_MASK
+            )
+            if wd < 0:
+                # E.g. folder already removed, or limit of watches reached
+                errno = ctypes.get_errno()
+                _logger.warning(f"Unable to watch {dir_path}: {os.strerror(errno)}")
+                continue
+            self._dirs[wd] = dir_path
+            dir_paths.append(dir_path)
+        return dir_paths
+
+    def _read_events(self) -> typing.Iterator[tuple[int, int, str]]:
+        try:
+            buffer = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, __, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            yield wd, mask, os.fsdecode(name)
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changes = set()
+        ready, __, __ = select.select([self._fd], [], [], timeout)
+        while ready:
+            for wd, mask, name in self._read_events():
+                if mask & IN_Q_OVERFLOW:
+                    # Events lost, everything could have changed
+                    changes.update(self.folder_paths)
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                dir_path = self._dirs.get(wd)
+                if dir_path is None:
+                    continue
+                path = os.path.join(dir_path, name) if name else dir_path
+                if mask & IN_ISDIR:
+                    if name in SKIPPED_DIRS:
+                        continue
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # Files could be created before the folder is watched
+                        for new_dir in self._add_watches(path):
+                            changes.update(_iter_files(new_dir))
+                    changes.add(pathlib.Path(path))
+                    continue
+                changes.add(pathlib.Path(path))
+            # Get events following closely, e.g. a file saved in several steps,
+            # within the time budget: files changed continuously would
+            # otherwise never let the caller handle the changes
+            delay = 0.05
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    break
+            ready, __, __ = select.select([self._fd], [], [], delay)
+        return changes
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _iter_files(dir_path: str) -> typing.Iterator[pathlib.Path]:
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    yield pathlib.Path(entry.path)
+    except OSError:
+        return
+
+
+def get_watcher(
+    folder_paths: typing.Iterable[typing.Union[str, os.PathLike]],
+    polling: bool = False,
+    interval: float = 1.0,
+) -> Watcher:
+    """Return an inotify watcher if available (and not `polling`), a polling one otherwise."""
+    if not polling and inotify_available():
+        try:
+            return InotifyWatcher(folder_paths)
+        except OSError as exc:
+            _logger.warning(f"inotify not usable ({exc}), polling files instead")
+    return PollingWatcher(folder_paths, interval=interval)
@@ -0,0 +1,230 @@
+# Copyright 2026 Sebastien Alix <https://github.com/sebalix>
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+"""Registry of the XML IDs defined and referenced by scanned modules.
+
+XML IDs are defined by the data records (XML and CSV files) of the modules,
+and generated by Odoo for their models (`model_res_partner`), their fields
+(`field_res_partner__name`) and the modules themselves (`base.module_sale`).
+They are referenced by the fields of other records (`inherit_id`,
+`parent_id`, `model_id:id`...), and by records updating a record of another
+module (`<record id="base.view_partner_form">`).
+"""
+
+import re
+import typing
+
+from .data_xml import get_full_xmlid
+from .diff import RECORDS_KEYS
+from .repository import MODULE_FINISHED
+
+# Fields of records referencing other records, by model ('*' for all models)
+REFERENCE_FIELDS = {
+    "*": (
+        "inherit_id",
+        "parent_id",
+        "model_id",
+        "binding_model_id",
+        "group_id",
+        "groups_id",
+        "view_id",
+        "search_view_id",
+    ),
+    "ir.ui.menu": ("action",),
+}
+
+_XMLID_RE = re.compile(r"^[\w.]+$")
+# `ref('xmlid')` calls of `eval` expressions
+_EVAL_REF_RE = re.compile(r"""\bref\(\s*(['"])([\w.]+)\1\s*\)""")
+
+
+def _references(value: typing.Any) -> list[str]:
+    """Return the XML IDs referenced by a field value.
+
+    Values are single XML IDs or comma-separated lists of them, possibly
+    prefixed by '-' (e.g. `groups="base.group_user,-base.group_portal"`),
+    or `eval` expressions calling `ref()` (e.g.
+    `eval="[(6, 0, [ref('base.group_user')])]"`). Other values (numbers,
+    expressions without `ref()`...) are ignored.
+    """
+    if not isinstance(value, str):
+        return []
+    if "ref(" in value:
+        return [match.group(2) for match in _EVAL_REF_RE.finditer(value)]
+    references = []
+    for xmlid in value.split(","):
+        xmlid = xmlid.strip().lstrip("-")
+        if _XMLID_RE.match(xmlid) and not xmlid.isdigit() and xmlid != "False":
+            references.append(xmlid)
+    return references
+
+
+def _get_module_xmlid(module: str) -> str:
+    return f"base.module_{module}"
+
+
+def _get_model_xmlid(module: str, model: str) -> str:
+    return f"{module}.model_{model.replace('.', '_')}"
+
+
+def _get_field_xmlid(module: str, model: str, field: str) -> str:
+    return f"{module}.field_{model.replace('.', '_')}__{field}"
+
+
+class XmlIdRegistry:
+    """XML IDs defined and referenced by scanned modules, by full XML ID.
+
+    Modules are added from the data of scans (`add_module()`, `add_scan()`,
+    one call per repository) or while scanning (`add_event()` as the
+    `callback` of a parser). Definitions and references are kept with their
+    location, a dict with `repository`, `module`, `kind` (`data`, `demo`, or
+    `generated` for XML IDs generated by Odoo), `model` and `file_path`.
+
+    E.g:
+        >>> registry = XmlIdRegistry()
+        >>> for path in ("./odoo/addons", "./server-tools"):
+        ...     registry.add_scan(RepositoryParser(path).to_dict(), repository=path)
+        >>> registry.duplicates()
+        >>> registry.dangling(scanned_only=True)
+    """
+
+    def __init__(self, reference_fields: typing.Optional[dict] = None):
+        self.reference_fields = (
+            REFERENCE_FIELDS if reference_fields is None else reference_fields
+        )
+        self.definitions = {}  # {xmlid: [location]}
+        self.references = []  # [(xmlid, field, location)]
+        self.modules = set()
+
+    def __contains__(self, xmlid: str) -> bool:
+        return xmlid in self.definitions
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def add_module(self, module: str, module_data: dict, repository: str = ""):
+        """Add the XML IDs defined and referenced by the data of a module."""
+        self.modules.add(module)
+        self._define(_get_module_xmlid(module), repository, module, "ir.module.module")
+        for model, model_data in module_data.get("models", {}).items():
+            # Odoo generates the XML ID of a model for each module defining
+            # or extending it
+            self._define(
+                _get_model_xmlid(module, model),
+                repository,
+                module,
+                "ir.model",
+                model_data.get("file_path"),
+            )
+            self._add_fields(module, model, model_data, repository)
+        for kind in RECORDS_KEYS:
+            for model, records in module_data.get(kind, {}).items():
+                fields = self.reference_fields.get("*", ()) + self.reference_fields.get(
+                    model, ()
+                )
+                for record in records:
+                    self._add_record(module, kind, model, record, fields, repository)
+
+    def _add_fields(self, module: str, model: str, model_data: dict, repository: str):
+        for field in model_data.get("fields", {}):
+            self._define(
+                _get_field_xmlid(module, model, field),
+                repository,
+                module,
+                "ir.model.fields",
+                model_data.get("file_path"),
+            )
+
+    def _add_record(
+        self,
+        module: str,
+        kind: str,
+        model: str,
+        record: dict,
+        fields: tuple[str, ...],
+        repository: str,
+    ):
+        location = {
+            "repository": repository,
+            "module": module,
+            "kind": kind,
+            "model": model,
+            "file_path": record.get("file_path"),
+        }
+        xmlid = get_full_xmlid(module, record.get("id"))
+        if xmlid:
+            if xmlid.split(".", 1)[0] == module:
+                self.definitions.setdefault(xmlid, []).append(location)
+            else:
+                # Update of a record of another module
+                self.references.append((xmlid, "id", location))
+        data = record.get("data", {})
+        for field in fields:
+            value = data.get(field)
+            if not value:
+                continue
+            for reference in _references(value):
+                self.references.append(
+                    (get_full_xmlid(module, reference), field, location)
+                )
+
+    def _define(
+        self,
+        xmlid: str,
+        repository: str,
+        module: str,
+        model: str,
+        file_path: typing.Optional[str] = None,
+    ):
+        location = {
+            "repository": repository,
+            "module": module,
+            "kind": "generated",
+            "model": model,
+            "file_path": file_path,
+        }
+        self.definitions.setdefault(xmlid, []).append(location)
+
+    def add_scan(self, data: dict, repository: str = ""):
+        """Add all the modules of a scan (output of `to_dict()`)."""
+        for module, module_data in data.items():
+            self.add_module(module, module_data, repository=repository)
+
+    def add_event(self, event: dict):
+        """Add the module of a `module_finished` event, see `RepositoryParser.callback`."""
+        if event["event"] == MODULE_FINISHED:
+            self.add_module(
+                event["module"], event["data"], repository=event.get("repository", "")
+            )
+
+    def get(self, xmlid: str) -> list[dict]:
+        """Return the locations defining a full XML ID (empty if unknown)."""
+        return self.definitions.get(xmlid, [])
+
+    def duplicates(self) -> dict[str, list[dict]]:
+        """Return the XML IDs defined more than once, with their locations.
+
+        E.g. a module available in several repositories, or a record
+        defined twice in the same module.
+        """
+        return {
+            xmlid: locations
+            for xmlid, locations in sorted(self.definitions.items())
+            if len(locations) > 1
+        }
+
+    def dangling(self, scanned_only: bool = False) -> list[dict]:
+        """Return the references to unknown XML IDs.
+
+        References are dicts with the `xmlid` referenced, the `field`
+        referencing it (`id` for a record updating a record of another
+        module) and its `location`. With `scanned_only`, references to the
+        modules that have not been scanned are ignored.
+        """
+        result = []
+        for xmlid, field, location in self.references:
+            if xmlid in self.definitions:
+                continue
+            if scanned_only and xmlid.split(".", 1)[0] not in self.modules:
+                continue
+            result.append({"xmlid": xmlid, "field": field, "location": location})
+        return result